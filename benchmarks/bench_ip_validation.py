@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Benchmark IP address validation of ZeroPaddedIPvAnyAddress fields.
+
+Compares the reference parser (try IPv6, then IPv4, then strip padding) with
+the memoized validator, cold and warm, on the address forms ARIN returns, and
+times parsing a Net with many netBlocks.
+
+Usage:
+    python benchmarks/bench_ip_validation.py [--number N] [--blocks N]
+"""
+
+import argparse
+import random
+import timeit
+
+from regrws.models import Net
+from regrws.models.types import (
+    _parse_ip_address,
+    _parse_ip_string,
+    _validate_ip_address,
+)
+
+FORMS = {
+    "zero-padded IPv4": lambda r: ".".join(f"{r.randrange(256):03d}" for _ in range(4)),
+    "plain IPv4": lambda r: ".".join(str(r.randrange(256)) for _ in range(4)),
+    "full IPv6": lambda r: ":".join(f"{r.randrange(65536):04x}" for _ in range(8)),
+    "compressed IPv6": lambda r: (
+        f"2001:db8:{r.randrange(65536):x}::{r.randrange(65536):x}"
+    ),
+}
+
+NET_TEMPLATE = """<net xmlns="http://www.arin.net/regrws/core/v1">
+<version>4</version><handle>NET-10-0-0-0-1</handle><netName>NETNAME</netName>
+<customerHandle>C12341234</customerHandle>
+<netBlocks>{blocks}</netBlocks></net>"""
+
+BLOCK_TEMPLATE = """<netBlock><type>A</type><startAddress>{start}</startAddress>
+<endAddress>{end}</endAddress><cidrLength>24</cidrLength></netBlock>"""
+
+
+def addresses(form, count, distinct, seed=0):
+    rng = random.Random(seed)
+    pool = [FORMS[form](rng) for _ in range(distinct)]
+    return [pool[i % distinct] for i in range(count)]
+
+
+def per_call(func, values, number):
+    seconds = min(
+        timeit.repeat(lambda: [func(v) for v in values], number=number, repeat=3)
+    )
+    return seconds / number / len(values) * 1e9
+
+
+def bench_validators(number):
+    print(f"{'form':<18}{'reference':>12}{'cold':>12}{'warm':>12}  ns/address")
+    for form in FORMS:
+        values = addresses(form, 1000, distinct=1000)
+        reference = per_call(_parse_ip_address, values, number)
+        cold = min(
+            timeit.repeat(
+                lambda values=values: [_validate_ip_address(v) for v in values],
+                setup=_parse_ip_string.cache_clear,
+                number=1,
+                repeat=number,
+            )
+        )
+        cold = cold / len(values) * 1e9
+        warm = per_call(_validate_ip_address, values, number)
+        print(f"{form:<18}{reference:>12.0f}{cold:>12.0f}{warm:>12.0f}")
+
+
+def bench_net(blocks, number):
+    rng = random.Random(0)
+    xml = NET_TEMPLATE.format(
+        blocks="".join(
+            BLOCK_TEMPLATE.format(
+                start=FORMS["zero-padded IPv4"](rng), end=FORMS["zero-padded IPv4"](rng)
+            )
+            for _ in range(blocks)
+        )
+    ).encode()
+    _parse_ip_string.cache_clear()
+    cold = timeit.timeit(lambda: Net.from_xml(xml), number=1)
+    warm = min(timeit.repeat(lambda: Net.from_xml(xml), number=number, repeat=3))
+    print(
+        f"Net.from_xml with {blocks} netBlocks: "
+        f"{cold * 1e3:.2f} ms cold, {warm / number * 1e3:.2f} ms warm"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20)
+    parser.add_argument("--blocks", type=int, default=500)
+    args = parser.parse_args()
+    bench_validators(args.number)
+    bench_net(args.blocks, args.number)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Benchmark throughput of concurrent from_handle calls across threads.
+
+Requests are answered in-process by a canned transport adapter, so the
+measurement covers the client only: session setup, response handling and XML
+parsing. On a free-threaded build (python3.13t and later, GIL disabled)
+throughput should grow with the number of threads; with the GIL it stays flat.
+
+Usage:
+    python benchmarks/bench_threads.py [--calls N] [--threads 1,2,4,8]
+"""
+
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import BaseAdapter
+
+from regrws.api import Api, constants
+
+NET_PAYLOAD = b"""<net xmlns="http://www.arin.net/regrws/core/v1">
+<version>4</version><handle>NET-10-0-0-0-1</handle><netName>NETNAME</netName>
+<customerHandle>C12341234</customerHandle><parentNetHandle>PARENT</parentNetHandle>
+<netBlocks><netBlock><type>S</type><startAddress>010.000.000.000</startAddress>
+<endAddress>010.000.000.255</endAddress><cidrLength>24</cidrLength></netBlock></netBlocks>
+<originASes><originAS>AS102</originAS></originASes>
+<pocLinks><pocLinkRef description="Tech" function="T" handle="EXAMPLETECH-ARIN"/></pocLinks>
+</net>"""
+
+
+class CannedAdapter(BaseAdapter):
+    """Answer every request with the same payload, without any I/O."""
+
+    def __init__(self, body: bytes) -> None:
+        super().__init__()
+        self.body = body
+
+    def send(self, request, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = constants.CONTENT_TYPE
+        response._content = self.body
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--threads", default="1,2,4,8")
+    args = parser.parse_args()
+
+    api = Api(
+        api_key="APIKEY",
+        base_url="https://reg.ote.arin.net/",
+        transport=CannedAdapter(NET_PAYLOAD),
+    )
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    print(f"{'threads':>8}{'calls/s':>12}{'speedup':>10}")
+    baseline = None
+    for threads in map(int, args.threads.split(",")):
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            start = time.perf_counter()
+            list(
+                executor.map(
+                    lambda _: api.net.from_handle("NET-10-0-0-0-1"), range(args.calls)
+                )
+            )
+            elapsed = time.perf_counter() - start
+        throughput = args.calls / elapsed
+        baseline = baseline or throughput
+        print(f"{threads:>8}{throughput:>12.0f}{throughput / baseline:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""Drive a mix of API operations at a target rate against a stand-in server.
+
+A local Reg-RWS stand-in runs in a separate process (so it does not compete
+with the client for the GIL) and answers every call with a canned payload,
+after an optional latency and with an optional rate of 503 errors. The client
+sends operations on an open-loop schedule: latencies are measured from the
+time an operation was due, so a saturated client shows up as queueing delay
+instead of silently lowering the rate.
+
+Usage:
+    python benchmarks/loadtest.py --rate 200 --duration 10 --concurrency 16 \\
+        --mix from_handle=60,find_net=20,save=10,reassign=5,create_for_net=5
+"""
+
+import argparse
+import json
+import multiprocessing
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from regrws.api import Api
+from regrws.api.bulk import Result, Summary
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None  # type: ignore
+
+NS = 'xmlns="http://www.arin.net/regrws/core/v1"'
+ISO = (
+    "<iso3166-1><name>UNITED STATES</name><code2>US</code2><code3>USA</code3>"
+    "<e164>1</e164></iso3166-1>"
+)
+NET = (
+    f"<net {NS}><version>4</version><handle>NET-10-0-0-0-1</handle>"
+    "<netName>NETNAME</netName><customerHandle>C12341234</customerHandle>"
+    "<parentNetHandle>PARENT</parentNetHandle><netBlocks><netBlock><type>S</type>"
+    "<startAddress>010.000.000.000</startAddress><endAddress>010.000.000.255"
+    "</endAddress><cidrLength>24</cidrLength></netBlock></netBlocks>"
+    "<pocLinks><pocLinkRef description='Tech' function='T' handle='TECH-ARIN'/>"
+    "</pocLinks></net>"
+)
+PAYLOADS = {
+    "poc": (
+        f"<poc {NS}>{ISO}<iso3166-2>VA</iso3166-2><emails><email>noc@example.com"
+        "</email></emails><streetAddress><line number='1'>Line 1</line>"
+        "</streetAddress><city>Chantilly</city><postalCode>20151</postalCode>"
+        "<handle>EXAMPLE-ARIN</handle><contactType>ROLE</contactType>"
+        "<companyName>EXAMPLE</companyName><lastName>NOC</lastName><phones><phone>"
+        "<type><description>OFFICE</description><code>O</code></type>"
+        "<number>+1.703.227.9840</number></phone>"
+        "</phones></poc>"
+    ),
+    "net": NET,
+    "customer": (
+        f"<customer {NS}><customerName>CUSTOMER</customerName>{ISO}"
+        "<handle>C1241523</handle><streetAddress><line number='1'>Line 1</line>"
+        "</streetAddress><city>Chantilly</city><iso3166-2>VA</iso3166-2>"
+        "<postalCode>20151</postalCode><privateCustomer>false</privateCustomer>"
+        "</customer>"
+    ),
+    "ticketedRequest": f"<ticketedRequest {NS}>{NET}</ticketedRequest>",
+}
+OPERATIONS = ("from_handle", "find_net", "save", "reassign", "create_for_net")
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    latency = 0.0
+    error_rate = 0.0
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _answer(self, kind):
+        length = int(self.headers.get("Content-Length") or 0)
+        self.rfile.read(length)
+        if self.latency:
+            time.sleep(random.expovariate(1 / self.latency))
+        if random.random() < self.error_rate:
+            body, status = b"Service Unavailable", 503
+        else:
+            body, status = PAYLOADS[kind].encode(), 200
+        self.send_response(status)
+        self.send_header("Content-Type", "application/xml")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _kind(self):
+        segments = self.path.split("?")[0].strip("/").split("/")
+        if segments[-1] in ("reassign", "reallocate", "remove"):
+            return "ticketedRequest"
+        if segments[-1] == "customer":
+            return "customer"
+        return segments[1]
+
+    def do_GET(self):
+        self._answer(self._kind())
+
+    do_PUT = do_POST = do_GET
+
+
+def serve(port, latency, error_rate, ready):
+    StandInHandler.latency = latency
+    StandInHandler.error_rate = error_rate
+    server = ThreadingHTTPServer(("127.0.0.1", port), StandInHandler)
+    server.daemon_threads = True
+    ready.set()
+    server.serve_forever()
+
+
+def parse_mix(value):
+    mix = {}
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        if name not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f"unknown operation {name!r}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def make_operations(api):
+    """Return one callable per operation, taking the sequence number."""
+    poc = api.poc.model.from_xml(PAYLOADS["poc"].encode())
+    poc.manager = api.poc
+    parent = api.net.model.from_xml(PAYLOADS["net"].encode())
+    parent.manager = api.net
+    customer = api.customer.model.from_xml(PAYLOADS["customer"].encode())
+    customer_info = customer.model_dump(exclude={"handle"})
+    return {
+        "from_handle": lambda i: api.poc.from_handle(f"POC{i}-ARIN"),
+        "find_net": lambda i: api.net.find_net("10.0.0.0", "10.0.0.255"),
+        # vary the payloads so that serialization is not served from cache
+        "save": lambda i: poc.model_copy(update={"city": f"City {i}"}).save(),
+        "reassign": lambda i: parent.reassign(
+            parent.model_copy(update={"net_name": f"CHILD-{i}"})
+        ),
+        "create_for_net": lambda i: api.customer.create_for_net(
+            parent, **{**customer_info, "customer_name": f"CUSTOMER {i}"}
+        ),
+    }
+
+
+def run(api, mix, rate, duration, concurrency, seed):
+    operations = make_operations(api)
+    rng = random.Random(seed)
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    summaries = {name: Summary() for name in names}
+    total = Summary()
+    lock = threading.Lock()
+
+    def execute(name, index, due):
+        try:
+            result = Result(index, operations[name](index))
+        except Exception as exc:  # noqa: BLE001  # pylint: disable=broad-except
+            result = Result(index, exception=exc)
+        # measure from when the operation was due, queueing included
+        result.elapsed = time.perf_counter() - due
+        with lock:
+            summaries[name].add(result)
+            total.add(result)
+
+    cpu = time.process_time()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for index in range(int(rate * duration)):
+            due = start + index / rate
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            executor.submit(execute, rng.choices(names, weights)[0], index, due)
+    elapsed = time.perf_counter() - start
+
+    total.started = start
+    report = {
+        "target_rate": rate,
+        "total": total.as_dict(),
+        "operations": {name: summary.as_dict() for name, summary in summaries.items()},
+        "error_rate": round(total.failed / total.count, 4) if total.count else 0.0,
+        "client_cpu_seconds": round(time.process_time() - cpu, 3),
+        "client_cpu_utilization": round((time.process_time() - cpu) / elapsed, 3),
+    }
+    if resource is not None:
+        report["client_max_rss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rate", type=float, default=100, help="operations/s")
+    parser.add_argument("--duration", type=float, default=10, help="seconds")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default="from_handle=60,find_net=20,save=10,reassign=5,create_for_net=5",
+    )
+    parser.add_argument("--latency", type=float, default=0.02, help="server mean, s")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    ready = multiprocessing.Event()
+    server = multiprocessing.Process(
+        target=serve,
+        args=(args.port, args.latency, args.error_rate, ready),
+        daemon=True,
+    )
+    server.start()
+    ready.wait()
+    try:
+        api = Api(api_key="LOADTEST", base_url=f"http://127.0.0.1:{args.port}/")
+        report = run(
+            api, args.mix, args.rate, args.duration, args.concurrency, args.seed
+        )
+    finally:
+        server.terminate()
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
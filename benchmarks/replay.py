@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Replay the calls of a recorded cassette and report throughput and latency.
+
+Every exchange recorded by ``regrws.api.cassette.Recorder`` that maps to a
+public API call is replayed through it, at its recorded offset from the start
+of the recording and with the recorded latency (both divided by ``--speed``),
+so library versions can be compared on a production trace without reaching
+ARIN:
+
+- ``GET <endpoint>/<handle>``: ``from_handle``
+- ``GET net/mostSpecificNet|parentNet/<start>/<end>``: ``find_net``/``find_parent``
+- ``PUT <endpoint>/<handle>``: ``save``
+- ``DELETE <endpoint>/<handle>``: ``delete``
+- ``PUT net/<handle>/reassign|reallocate|remove``: the ``Net`` methods
+- ``POST net/<handle>/customer``: ``create_for_net``
+- ``POST <endpoint>``: ``create``
+
+Latencies are measured from when a call was due, so a client falling behind
+the recorded schedule shows up as queueing delay.
+
+Usage:
+    python benchmarks/replay.py bulk.cassette.gz [--concurrency N] [--speed X]
+"""
+
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import unquote, urlsplit
+
+from regrws.api import Api
+from regrws.api.bulk import Result, Summary
+from regrws.api.cassette import Replayer
+
+FIND = {"mostSpecificNet": "find_net", "parentNet": "find_parent"}
+
+
+def base_url(interaction):
+    """Return the API base URL of a recorded call, or None."""
+    parts = urlsplit(interaction.url)
+    prefix, rest, _ = parts.path.partition("/rest/")
+    if not rest:
+        return None
+    return f"{parts.scheme}://{parts.netloc}{prefix}/"
+
+
+def operation(api, interaction):
+    """Return the API call replaying ``interaction``, or None."""
+    path = urlsplit(interaction.url).path.partition("/rest/")[2]
+    segments = [unquote(segment) for segment in path.strip("/").split("/")]
+    method = interaction.method
+    manager = getattr(api, segments[0], None)
+    if manager is None:
+        return None
+    body = (interaction.request_body or "").encode()
+
+    def instance(handle=None):
+        obj = (
+            manager.model.from_xml(body)
+            if handle is None
+            else manager.model.model_construct(handle=handle)
+        )
+        obj.manager = manager
+        return obj
+
+    match method, segments:
+        case "GET", [_, finder, start, end] if finder in FIND:
+            return lambda: getattr(manager, FIND[finder])(start, end)
+        case "GET", [_, handle]:
+            return lambda: manager.from_handle(handle)
+        case "PUT", [_, _]:
+            return lambda: instance().save()
+        case "DELETE", [_, handle]:
+            return lambda: instance(handle).delete()
+        case "PUT", ["net", handle, "reassign" | "reallocate" as action]:
+            return lambda: getattr(instance(handle), action)(body)
+        case "PUT", ["net", _, "remove"]:
+            return lambda: instance().remove()
+        case "POST", ["net", handle, "customer"]:
+            return lambda: api.customer.create_for_net(
+                instance(handle),
+                **api.customer.model.from_xml(body).model_dump(exclude={"handle"}),
+            )
+        case "POST", [_]:
+            return lambda: manager.create(
+                **manager.model.from_xml(body).model_dump(exclude={"handle"})
+            )
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("cassette")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="0 replays as fast as possible, without latency",
+    )
+    args = parser.parse_args()
+
+    replayer = Replayer(args.cassette, speed=args.speed or None)
+    urls = {base_url(interaction) for interaction in replayer.interactions} - {None}
+    if len(urls) != 1:
+        parser.error(f"expected calls to one Reg-RWS base URL, found {len(urls)}")
+    api = Api(api_key="replay", base_url=urls.pop(), transport=replayer)
+    calls = []
+    skipped = 0
+    for interaction in replayer.interactions:
+        call = operation(api, interaction)
+        if call is None:
+            skipped += 1
+        else:
+            calls.append((interaction.offset, call))
+    if not calls:
+        parser.error("no API calls recorded in this cassette")
+
+    summary = Summary()
+    lock = threading.Lock()
+
+    def execute(index, call, due):
+        try:
+            result = Result(index, call())
+        except Exception as exc:  # noqa: BLE001  # pylint: disable=broad-except
+            result = Result(index, exception=exc)
+        result.elapsed = time.perf_counter() - due
+        with lock:
+            summary.add(result)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        for index, (offset, call) in enumerate(calls):
+            due = start + (offset / args.speed if args.speed else 0.0)
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            executor.submit(execute, index, call, due)
+    summary.started = start
+    print(json.dumps({**summary.as_dict(), "skipped": skipped}))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+"""Helpers for running many API operations concurrently"""
+
+from __future__ import annotations
+
+import contextvars
+import itertools
+import math
+import random
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+from regrws.api import constants
+
+T = TypeVar("T")
+
+
+@dataclass
+class Result(Generic[T]):
+    """Outcome of a single operation in a bulk run.
+
+    Attributes:
+        item: The input the operation was run for.
+        value: The value returned by the operation, which may be an ``Error``
+            payload returned by ARIN.
+        exception: The exception raised by the operation, if any.
+        elapsed: Time spent running the operation, in seconds.
+        changed: For updates, whether a change was saved; ``False`` when the
+            object was already up to date and left alone.
+    """
+
+    item: T
+    value: Any = None
+    exception: BaseException | None = None
+    elapsed: float = 0.0
+    changed: bool | None = None
+
+    @property
+    def ok(self) -> bool:
+        # prevent circular import
+        from regrws.models import Error
+
+        return self.exception is None and not isinstance(self.value, Error)
+
+
+def _call(func: Callable[[T], Any], item: T) -> Result[T]:
+    start = time.perf_counter()
+    try:
+        result = Result(item, func(item))
+    except Exception as exc:  # noqa: BLE001  # pylint: disable=broad-except
+        result = Result(item, exception=exc)
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+def submit(executor: Executor, func: Callable[..., T], *args: Any) -> Future[T]:
+    """Like ``executor.submit``, running ``func`` in a copy of the caller's
+    context so that :func:`~regrws.api.concurrency.priority` applies in the
+    worker thread."""
+    return executor.submit(contextvars.copy_context().run, func, *args)
+
+
+def iter_concurrently(
+    func: Callable[[T], Any],
+    items: Iterable[T],
+    max_workers: int = constants.DEFAULT_MAX_WORKERS,
+    window: int | None = None,
+) -> Iterator[Result[T]]:
+    """Like :func:`run_concurrently`, yielding results in input order as they
+    become available instead of returning them all at the end.
+
+    ``items`` is consumed lazily: at most ``window`` items (twice
+    ``max_workers`` by default) are in flight or waiting to be yielded at any
+    time, so inputs of any size, such as the lines of a file, run in constant
+    memory. A slow consumer holds back the reading of further items.
+    Closing the iterator early cancels the operations not yet started.
+    Operations run in a copy of the context current when this is called.
+    """
+    # copied here rather than in the generator, whose body only runs on the
+    # first next()
+    context = contextvars.copy_context()
+    return _iter_concurrently(
+        context, func, iter(items), max_workers, window or 2 * max_workers
+    )
+
+
+def _iter_concurrently(
+    context: contextvars.Context,
+    func: Callable[[T], Any],
+    iterator: Iterator[T],
+    max_workers: int,
+    window: int,
+) -> Iterator[Result[T]]:
+    def start(executor: Executor, item: T) -> Future[Result[T]]:
+        return executor.submit(context.copy().run, _call, func, item)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque(
+            start(executor, item) for item in itertools.islice(iterator, window)
+        )
+        try:
+            while pending:
+                result = pending.popleft().result()
+                for item in itertools.islice(iterator, 1):
+                    pending.append(start(executor, item))
+                yield result
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def run_concurrently(
+    func: Callable[[T], Any],
+    items: Iterable[T],
+    max_workers: int = constants.DEFAULT_MAX_WORKERS,
+) -> list[Result[T]]:
+    """Run ``func`` for every item using a thread pool.
+
+    Exceptions are captured in the returned results instead of being raised,
+    so one failure does not abort the rest of the batch. As every result is
+    kept, prefer :func:`iter_concurrently` for very large inputs.
+
+    Returns:
+        One :class:`Result` per item, in input order.
+    """
+    return list(iter_concurrently(func, items, max_workers))
+
+
+@dataclass
+class _Update:
+    value: Any
+    changed: bool
+
+
+def iter_updates(
+    fetch: Callable[[T], Any],
+    transform: Callable[[Any], Any],
+    items: Iterable[T],
+    max_workers: int = constants.DEFAULT_MAX_WORKERS,
+    validate: Callable[[Any], Any] | None = None,
+) -> Iterator[Result[T]]:
+    """Fetch, transform and save objects concurrently, skipping unchanged ones.
+
+    Args:
+        fetch: Returns the object to update for an item, such as a manager's
+            ``from_handle``.
+        transform: Updates a fetched object, in place or by returning an
+            updated copy.
+        items: Inputs, such as handles, consumed lazily as with
+            :func:`iter_concurrently`.
+        max_workers: Number of worker threads.
+        validate: Checks a changed object before it is saved, raising to
+            leave it unsaved, such as
+            :meth:`~regrws.models.validation.PayloadValidator.check`.
+
+    Yields:
+        One :class:`Result` per item, in input order. Its ``value`` is what
+        ``save()`` returned, the unchanged object, or the ``Error`` returned
+        while fetching; ``changed`` tells whether it was saved. Objects
+        rejected by ``validate`` have its exception instead.
+    """
+
+    def update(item: T) -> Any:
+        # prevent circular import
+        from regrws.models import Error
+
+        current = fetch(item)
+        if current is None or isinstance(current, Error):
+            return current
+        before = current.model_dump()
+        updated = transform(current)
+        if updated is None:
+            updated = current
+        if updated.model_dump() == before:
+            return _Update(current, changed=False)
+        if validate is not None:
+            validate(updated)
+        return _Update(updated.save(), changed=True)
+
+    for result in iter_concurrently(update, items, max_workers):
+        if isinstance(result.value, _Update):
+            result.value, result.changed = result.value.value, result.value.changed
+        yield result
+
+
+def update_concurrently(
+    fetch: Callable[[T], Any],
+    transform: Callable[[Any], Any],
+    items: Iterable[T],
+    max_workers: int = constants.DEFAULT_MAX_WORKERS,
+    validate: Callable[[Any], Any] | None = None,
+) -> list[Result[T]]:
+    """Like :func:`iter_updates`, returning all the results at the end."""
+    return list(iter_updates(fetch, transform, items, max_workers, validate))
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Return the ``q`` percentile (0-100) of already sorted ``values``."""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, max(0, math.ceil(q / 100 * len(values)) - 1))
+    return values[index]
+
+
+class Summary:
+    """Running counts and latency distribution of bulk results.
+
+    Percentiles are computed from a uniform sample of at most
+    ``sample_size`` latencies (reservoir sampling), so that the memory used
+    does not grow with the number of results; ``max`` is exact.
+
+    Args:
+        sample_size: Number of latencies kept for percentiles.
+        seed: Seed of the sampling, for reproducible reports.
+    """
+
+    def __init__(self, sample_size: int = 10000, seed: int | None = None) -> None:
+        self.started = time.perf_counter()
+        self.succeeded = 0
+        self.failed = 0
+        self.changed = 0
+        self.unchanged = 0
+        self.sample_size = sample_size
+        self.latencies: list[float] = []
+        self.max_latency = 0.0
+        self._random = random.Random(seed)
+
+    @property
+    def count(self) -> int:
+        return self.succeeded + self.failed
+
+    def add(self, result: Result[Any]) -> None:
+        if result.ok:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+        if result.changed is True:
+            self.changed += 1
+        elif result.changed is False:
+            self.unchanged += 1
+        self.max_latency = max(self.max_latency, result.elapsed)
+        if len(self.latencies) < self.sample_size:
+            self.latencies.append(result.elapsed)
+        else:
+            index = self._random.randrange(self.count)
+            if index < self.sample_size:
+                self.latencies[index] = result.elapsed
+
+    def as_dict(self) -> dict[str, float]:
+        elapsed = time.perf_counter() - self.started
+        latencies = sorted(self.latencies)
+        updates = {}
+        if self.changed or self.unchanged:
+            updates = {"changed": self.changed, "unchanged": self.unchanged}
+        return {
+            "count": self.count,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            **updates,
+            "elapsed": round(elapsed, 3),
+            "throughput": round(self.count / elapsed, 2) if elapsed else 0.0,
+            "p50": round(percentile(latencies, 50), 4),
+            "p95": round(percentile(latencies, 95), 4),
+            "p99": round(percentile(latencies, 99), 4),
+            "max": round(self.max_latency, 4),
+        }
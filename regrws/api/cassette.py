@@ -0,0 +1,260 @@
+"""Recording and replay of HTTP exchanges for offline regression testing"""
+
+from __future__ import annotations
+
+import base64
+import builtins
+import gzip
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from dataclasses import asdict, dataclass
+from datetime import timedelta
+from typing import IO, Any, Self
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+CASSETTE_VERSION = 2
+
+
+class CassetteError(LookupError):
+    """A request has no recorded response left to replay."""
+
+
+def _strip_apikey(url: str) -> str:
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query) if k.lower() != "apikey"]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def _open(path: str | os.PathLike[str], mode: str) -> IO[str]:
+    if os.fspath(path).endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")  # type: ignore
+    return open(path, mode, encoding="utf-8")
+
+
+def _text(body: bytes | str | None) -> str | None:
+    if isinstance(body, bytes):
+        return body.decode()
+    return body
+
+
+def _exception(name: str, message: str, request: requests.PreparedRequest) -> Exception:
+    """Rebuild a recorded exception.
+
+    Only builtin and ``requests`` exceptions are rebuilt with their type,
+    others are raised as :class:`requests.RequestException`.
+    """
+    module, _, qualname = name.rpartition(".")
+    namespace = {"builtins": builtins, "requests.exceptions": requests.exceptions}
+    cls = getattr(namespace.get(module), qualname, None)
+    if not (isinstance(cls, type) and issubclass(cls, Exception)):
+        return requests.RequestException(f"{name}: {message}", request=request)
+    if issubclass(cls, requests.RequestException):
+        return cls(message, request=request)
+    return cls(message)
+
+
+@dataclass
+class Interaction:
+    """One recorded request and its response.
+
+    Attributes:
+        method: HTTP method.
+        url: Request URL, without the API key.
+        request_body: Payload sent, if any.
+        status: Response status code, ``None`` if the request failed.
+        content_type: Response content type.
+        body: Response content, base64-encoded.
+        elapsed: Seconds between sending the request and receiving the
+            response or the exception.
+        offset: Seconds between the start of the recording and the request.
+        exception: Qualified name of the exception raised instead of
+            receiving a response, if any.
+        message: Message of that exception.
+    """
+
+    method: str
+    url: str
+    request_body: str | None
+    status: int | None
+    content_type: str | None
+    body: str | None
+    elapsed: float
+    offset: float
+    exception: str | None = None
+    message: str | None = None
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return self.method, self.url
+
+
+class Recorder(BaseAdapter):
+    """Transport adapter recording every exchange into a cassette file.
+
+    Pass it to :class:`~regrws.api.core.Api` as ``transport``. Requests are
+    sent through ``adapter`` and each exchange is appended to ``path`` as a
+    JSON line (gzip-compressed when the name ends with ``.gz``). API keys are
+    stripped from the recorded URLs. Exceptions raised by ``adapter``, such
+    as connection errors and timeouts, are recorded and raised again.
+
+    Args:
+        path: Cassette file to write.
+        adapter: Adapter actually sending the requests, a shared
+            :class:`~requests.adapters.HTTPAdapter` by default.
+
+    Example:
+        >>> with Recorder("bulk.cassette.gz") as recorder:
+        ...     api = Api(api_key="your-api-key", transport=recorder)
+        ...     run_concurrently(api.net.from_handle, handles)
+    """
+
+    def __init__(
+        self, path: str | os.PathLike[str], adapter: BaseAdapter | None = None
+    ) -> None:
+        super().__init__()
+        self.path = path
+        self.adapter = adapter or HTTPAdapter()
+        self._file = _open(path, "w")
+        self._file.write(json.dumps({"version": CASSETTE_VERSION}) + "\n")
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any):
+        offset = time.monotonic() - self._started
+        start = time.perf_counter()
+        interaction = Interaction(
+            method=str(request.method),
+            url=_strip_apikey(str(request.url)),
+            request_body=_text(request.body),
+            status=None,
+            content_type=None,
+            body=None,
+            elapsed=0.0,
+            offset=round(offset, 6),
+        )
+        try:
+            response = self.adapter.send(request, **kwargs)
+        except Exception as exc:
+            cls = type(exc)
+            interaction.exception = f"{cls.__module__}.{cls.__qualname__}"
+            interaction.message = str(exc)
+            raise
+        else:
+            interaction.status = response.status_code
+            interaction.content_type = response.headers.get("Content-Type")
+            interaction.body = base64.b64encode(response.content).decode("ascii")
+        finally:
+            interaction.elapsed = round(time.perf_counter() - start, 6)
+            line = json.dumps(asdict(interaction), separators=(",", ":")) + "\n"
+            with self._lock:
+                self._file.write(line)
+        return response
+
+    def close(self) -> None:
+        """Keep recording: sessions close their adapters after every call."""
+
+    def stop(self) -> None:
+        """Close the cassette file and the underlying adapter."""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+        self.adapter.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.stop()
+
+
+class Replayer(BaseAdapter):
+    """Transport adapter answering requests from a cassette, without network.
+
+    Requests are matched on method and URL (ignoring the API key); responses
+    recorded for the same request are served in their recorded order, so
+    concurrent replays match regardless of scheduling. Recorded exceptions
+    are raised again.
+
+    Args:
+        path: Cassette file written by :class:`Recorder`.
+        speed: Replay recorded latencies divided by ``speed`` (``2.0`` halves
+            them); ``None`` answers immediately.
+        repeat: Serve recorded responses again once they are exhausted,
+            instead of raising :class:`CassetteError`.
+
+    Example:
+        >>> api = Api(api_key="any", transport=Replayer("bulk.cassette.gz"))
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        speed: float | None = 1.0,
+        repeat: bool = False,
+    ) -> None:
+        super().__init__()
+        self.speed = speed
+        self.repeat = repeat
+        self.interactions = self.read(path)
+        self._queues: dict[tuple[str, str], deque[Interaction]] = defaultdict(deque)
+        for interaction in self.interactions:
+            self._queues[interaction.key].append(interaction)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def read(path: str | os.PathLike[str]) -> list[Interaction]:
+        """Return the interactions recorded in a cassette."""
+        with _open(path, "r") as file:
+            header = json.loads(next(file))
+            version = header.get("version")
+            if version not in (1, CASSETTE_VERSION):
+                raise ValueError(f"Unsupported cassette version {header!r}")
+            interactions = []
+            for line in file:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if version == 1:
+                    # version 1 stored the response text
+                    record["body"] = base64.b64encode(record["body"].encode()).decode()
+                interactions.append(Interaction(**record))
+            return interactions
+
+    def _next(self, key: tuple[str, str]) -> Interaction:
+        with self._lock:
+            queue = self._queues.get(key)
+            if not queue:
+                raise CassetteError(f"No recorded response for {key[0]} {key[1]}")
+            interaction = queue.popleft()
+            if self.repeat:
+                queue.append(interaction)
+            return interaction
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any):
+        interaction = self._next((str(request.method), _strip_apikey(str(request.url))))
+        delay = interaction.elapsed / self.speed if self.speed else 0.0
+        if delay:
+            time.sleep(delay)
+        if interaction.exception is not None:
+            raise _exception(interaction.exception, interaction.message or "", request)
+        response = requests.Response()
+        response.status_code = interaction.status
+        response.headers = CaseInsensitiveDict()
+        if interaction.content_type:
+            response.headers["Content-Type"] = interaction.content_type
+        response._content = base64.b64decode(interaction.body or "")
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.url = str(request.url)
+        response.request = request
+        response.elapsed = timedelta(seconds=delay)
+        return response
+
+    def close(self) -> None:
+        """Nothing to release."""
@@ -0,0 +1,234 @@
+"""Adaptive control of the number of concurrent requests"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import enum
+import heapq
+import itertools
+import threading
+import time
+from collections.abc import Iterator
+
+import requests
+
+from regrws.api.profiling import phase
+
+#: Exceptions that tell a request may have overloaded the server
+OVERLOAD_ERRORS: tuple[type[BaseException], ...] = (
+    requests.ConnectionError,
+    requests.Timeout,
+)
+
+
+class Priority(enum.IntEnum):
+    """Priority class of API calls, lower values are served first."""
+
+    INTERACTIVE = 0
+    NORMAL = 1
+    BULK = 2
+
+
+_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar(
+    "regrws_priority", default=Priority.NORMAL
+)
+
+
+def current_priority() -> Priority:
+    """Priority of the calls made in the current context."""
+    return _priority.get()
+
+
+@contextlib.contextmanager
+def priority(level: Priority) -> Iterator[Priority]:
+    """Tag the calls made within the block with a priority class.
+
+    Calls waiting for a slot of an :class:`AdaptiveLimiter` are admitted in
+    priority order, then first come first served. The priority follows the
+    operations started through :mod:`regrws.api.bulk`, :class:`OperationGraph`
+    and :class:`HedgingPolicy` into their worker threads.
+
+    Example:
+        >>> with priority(Priority.BULK):
+        ...     results = run_concurrently(api.net.from_handle, handles)
+    """
+    token = _priority.set(Priority(level))
+    try:
+        yield _priority.get()
+    finally:
+        _priority.reset(token)
+
+
+class Slot:
+    """A permission to send one request, see :meth:`AdaptiveLimiter.slot`.
+
+    Attributes:
+        failed: Set to ``True`` when the request failed in a way that signals
+            overload (connection errors, timeouts, 5xx, ``E_OUTAGE``).
+    """
+
+    def __init__(self, ticket: int) -> None:
+        self.ticket = ticket
+        self.failed = False
+
+
+class AdaptiveLimiter:
+    """Additive-increase/multiplicative-decrease limit on in-flight requests.
+
+    The limit grows by about one every ``limit`` successful requests while
+    latency stays close to the lowest latency observed so far, and is
+    multiplied by ``backoff`` when the smoothed latency exceeds that baseline
+    by ``latency_tolerance`` times or when a request fails with an overload
+    signal. Only one decrease happens per round trip: failures of requests
+    that were already in flight when the limit was last decreased are
+    ignored.
+
+    Pass it to :class:`~regrws.api.core.Api` to gate every HTTP call made
+    through its managers, and size worker pools to ``max_limit``. Calls
+    waiting for a slot are admitted by :func:`priority`, so interactive
+    lookups overtake queued bulk requests; use ``min_limit=max_limit`` for a
+    fixed limit.
+
+    Args:
+        initial_limit: Concurrency to start with.
+        min_limit: Lower bound of the limit.
+        max_limit: Upper bound of the limit.
+        latency_tolerance: Ratio of smoothed to baseline latency considered
+            a sign of overload.
+        backoff: Factor applied to the limit on overload.
+        smoothing: Weight of the latest sample in the smoothed latency.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        latency_tolerance: float = 2.0,
+        backoff: float = 0.5,
+        smoothing: float = 0.2,
+    ) -> None:
+        if not min_limit <= initial_limit <= max_limit:
+            raise ValueError("`initial_limit` must be within `min_limit`/`max_limit`")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_tolerance = latency_tolerance
+        self.backoff = backoff
+        self.smoothing = smoothing
+        self._limit = float(initial_limit)
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._issued = 0
+        self._last_decrease = 0
+        self._waiting: list[tuple[int, int]] = []
+        self._arrivals = itertools.count()
+        self._latency: float | None = None
+        self._baseline: float | None = None
+
+    @property
+    def limit(self) -> int:
+        """Current maximum number of requests in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def waiting(self) -> int:
+        """Number of calls waiting for a slot."""
+        return len(self._waiting)
+
+    def acquire(self, level: Priority | None = None) -> int:
+        """Block until a request may be sent.
+
+        Args:
+            level: Priority of the request, defaults to the priority of the
+                current context.
+
+        Returns:
+            A ticket to hand back to :meth:`release`.
+        """
+        if level is None:
+            level = current_priority()
+        with self._cond:
+            entry = (int(level), next(self._arrivals))
+            heapq.heappush(self._waiting, entry)
+            try:
+                while self._waiting[0] != entry or self._in_flight >= int(self._limit):
+                    self._cond.wait()
+            except BaseException:
+                self._waiting.remove(entry)
+                heapq.heapify(self._waiting)
+                self._cond.notify_all()
+                raise
+            heapq.heappop(self._waiting)
+            self._in_flight += 1
+            self._issued += 1
+            # the next waiter may fit as well
+            self._cond.notify_all()
+            return self._issued
+
+    def release(self, ticket: int, latency: float | None, failed: bool = False) -> None:
+        """Report the outcome of a request sent under ``ticket``.
+
+        A ``latency`` of ``None`` frees the slot without adapting the limit,
+        for requests that have no outcome to learn from.
+        """
+        with self._cond:
+            self._in_flight -= 1
+            if failed:
+                self._decrease(ticket)
+            elif latency is not None:
+                self._observe(ticket, latency)
+            self._cond.notify_all()
+
+    def _observe(self, ticket: int, latency: float) -> None:
+        if self._latency is None or self._baseline is None:
+            self._latency = self._baseline = latency
+        else:
+            self._latency += self.smoothing * (latency - self._latency)
+            # let the baseline follow slow, lasting changes in service time
+            self._baseline = min(
+                self._latency, self._baseline + 0.01 * (self._latency - self._baseline)
+            )
+        if self._latency > self.latency_tolerance * self._baseline:
+            self._decrease(ticket)
+        else:
+            self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+
+    def _decrease(self, ticket: int) -> None:
+        if ticket <= self._last_decrease:
+            return
+        self._limit = max(self.min_limit, self._limit * self.backoff)
+        self._last_decrease = self._issued
+        if self._latency is not None and self._baseline is not None:
+            # start the next round from the baseline rather than the peak
+            self._latency = self._baseline
+
+    @contextlib.contextmanager
+    def slot(self) -> Iterator[Slot]:
+        """Hold a slot for the duration of a request.
+
+        Connection errors and timeouts raised inside the block count as
+        failures, other exceptions free the slot without adapting the limit.
+
+        Example:
+            >>> with limiter.slot() as slot:
+            ...     response = send()
+            ...     slot.failed = response.status_code >= 500
+        """
+        with phase("gate"):
+            slot = Slot(self.acquire())
+        start = time.perf_counter()
+        latency: float | None = None
+        try:
+            yield slot
+        except OVERLOAD_ERRORS:
+            slot.failed = True
+            raise
+        else:
+            latency = time.perf_counter() - start
+        finally:
+            self.release(slot.ticket, latency, slot.failed)
@@ -1,2 +1,3 @@
 BASE_URL_DEFAULT = "https://reg.arin.net/"
 CONTENT_TYPE = "application/xml"
+DEFAULT_MAX_WORKERS = 8
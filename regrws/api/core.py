@@ -1,14 +1,30 @@
 from __future__ import annotations
 
+import hashlib
+import threading
 from typing import TYPE_CHECKING, Dict, Optional
 
 import requests
+from pydantic_xml.element.native import etree
 
 from regrws.settings import Settings
 
 from regrws.api import constants
+from regrws.api.profiling import phase
 
 if TYPE_CHECKING:
+    from pydantic_xml import BaseXmlModel
+    from requests.adapters import BaseAdapter
+
+    from regrws.api.concurrency import AdaptiveLimiter
+    from regrws.api.hedging import HedgingPolicy
+    from regrws.api.journal import Journal
+    from regrws.api.manager import BaseManager
+    from regrws.api.preflight import Preflight
+    from regrws.api.profiling import Profiler
+    from regrws.api.tracing import Tracer
+    from regrws.cache import LRUCache, NetRangeCache
+    from regrws.models.base import BaseModel
     from regrws.models.types import xmlmodel_type
 
 
@@ -28,6 +44,10 @@ class Response(requests.Response):
     def instance(self) -> xmlmodel_type | None:
         """Get pydantic_xml instance from request content.
 
+        When the session has a parse cache, content identical to a previously
+        parsed response is not parsed again: a copy of the earlier instance
+        is returned instead.
+
         Returns:
             The parsed pydantic model instance or None if parsing fails.
 
@@ -41,9 +61,26 @@ class Response(requests.Response):
                 raise RuntimeError(
                     f"Parser for status code {self.status_code} is missing in session."
                 )
-            self._object = model.from_xml(self.content)
+            cache = self.session.parse_cache
+            if cache is None:
+                self._object = self._parse(model)
+            else:
+                digest = hashlib.blake2b(self.content, digest_size=16).digest()
+                parsed = cache.get((model, digest))
+                if parsed is None:
+                    parsed = self._parse(model)
+                    cache.put((model, digest), parsed)
+                # callers get their own instance to mutate and bind a manager to
+                self._object = parsed.model_copy(deep=True)
         return self._object
 
+    def _parse(self, model: xmlmodel_type) -> xmlmodel_type:
+        # same as model.from_xml, in two steps to profile them separately
+        with phase("parse"):
+            tree = etree.fromstring(self.content)
+        with phase("validate"):
+            return model.from_xml_tree(tree)  # type: ignore
+
     def raise_for_unknown_status(self):
         """Raises :class:`HTTPError` for unknown status codes.
 
@@ -70,13 +107,23 @@ class Session(requests.Session):
     Args:
         handlers: Dictionary mapping HTTP status codes to pydantic model classes.
         headers: Optional additional headers to include in requests.
+        parse_cache: Optional cache of parsed responses keyed by content hash.
+        adapter: Optional transport adapter used for every URL.
     """
 
     def __init__(
-        self, handlers: Dict[int, xmlmodel_type], headers: Optional[dict] = None
+        self,
+        handlers: Dict[int, xmlmodel_type],
+        headers: Optional[dict] = None,
+        parse_cache: LRUCache[BaseXmlModel] | None = None,
+        adapter: BaseAdapter | None = None,
     ):
         super().__init__()
         self.handlers = handlers
+        self.parse_cache = parse_cache
+        if adapter is not None:
+            self.mount("https://", adapter)
+            self.mount("http://", adapter)
         self.hooks["response"].append(self.response_hook)
         self.headers.update({"accept": constants.CONTENT_TYPE})
         if headers:
@@ -95,7 +142,8 @@ class Session(requests.Session):
         Returns:
             A regrws Response instance with XML parsing capabilities.
         """
-        return Response._from_response(response, self)
+        with phase("copy"):
+            return Response._from_response(response, self)
 
 
 class Api:
@@ -109,12 +157,34 @@ class Api:
         base_url: Base URL for the ARIN Reg-RWS API. Defaults to ARIN production.
         api_key: Your ARIN API key. Can also be set via REGRWS_API_KEY env var.
         settings: Optional Settings object for advanced configuration.
+        journal: Optional Journal recording every mutating call.
+        limiter: Optional AdaptiveLimiter bounding the number of requests in
+            flight across every manager of this instance.
+        hedging: Optional HedgingPolicy duplicating slow GET requests.
+        parse_cache: Optional LRUCache of parsed responses, reused when the same
+            bytes are received again.
+        transport: Optional requests transport adapter shared by every call,
+            such as a cassette :class:`~regrws.api.cassette.Recorder` or
+            :class:`~regrws.api.cassette.Replayer`. It must not release its
+            resources in ``close()``, which sessions call after each request.
+        profiler: Optional Profiler recording where the time of a sample of
+            calls goes.
+        tracer: Optional OpenTelemetry tracer (see
+            :func:`~regrws.api.tracing.get_tracer`) recording a span per
+            manager operation, with a child span per HTTP attempt.
+        net_cache: Optional NetRangeCache answering ``find_net`` and
+            ``find_parent`` queries locally when the answer is known.
+        preflight: Optional Preflight rejecting reassignments and
+            reallocations that conflict with known nets before sending them.
 
     Attributes:
         poc: Manager for POC (Point of Contact) operations.
         org: Manager for Organization operations.
         net: Manager for Network operations.
         customer: Manager for Customer operations.
+        delegation: Manager for reverse DNS Delegation operations.
+        timeout: Timeout of each HTTP call, in seconds, when no
+            :class:`~regrws.api.deadline.Deadline` is active.
 
     Example:
         >>> api = Api(api_key="your-api-key")
@@ -127,10 +197,20 @@ class Api:
         base_url: str | None = None,
         api_key: str | None = None,
         settings: Settings | None = None,
+        journal: Journal | None = None,
+        limiter: AdaptiveLimiter | None = None,
+        hedging: HedgingPolicy | None = None,
+        parse_cache: LRUCache[BaseXmlModel] | None = None,
+        transport: BaseAdapter | None = None,
+        profiler: Profiler | None = None,
+        tracer: Tracer | None = None,
+        net_cache: NetRangeCache | None = None,
+        preflight: Preflight | None = None,
     ):
         # avoid circular imports
         from regrws.models import (  # pylint: disable=import-outside-toplevel
             Customer,
+            Delegation,
             Net,
             Org,
             Poc,
@@ -146,9 +226,36 @@ class Api:
         base_url = str(settings.base_url)
         self.base_url = f"{base_url.rstrip('/')}/rest"
         self.apikey = settings.api_key
-
-        for model in [Customer, Net, Org, Poc]:
+        self.timeout = settings.timeout
+        self.journal = journal
+        self.limiter = limiter
+        self.hedging = hedging
+        self.parse_cache = parse_cache
+        self.transport = transport
+        self.profiler = profiler
+        self.tracer = tracer
+        self.net_cache = net_cache
+        self.preflight = preflight
+        self._managers: dict[type, BaseManager] = {}
+        self._managers_lock = threading.Lock()
+
+        for model in [Customer, Delegation, Net, Org, Poc]:
             if hasattr(model, "_endpoint"):
-                manager = model._manager_class(api=self, model=model)
+                manager = self.manager_for(model)
                 endpoint = model._endpoint[1:]  # Remove leading "/"
                 setattr(self, endpoint, manager)
+
+    def manager_for(self, model: type[BaseModel]) -> BaseManager:
+        """Return the manager of ``model``, created once per Api instance.
+
+        Managers hold no per-call state, so the same manager is shared by
+        every instance of ``model`` returned by this Api, across threads.
+        """
+        try:
+            return self._managers[model]
+        except KeyError:
+            pass
+        with self._managers_lock:
+            if model not in self._managers:
+                self._managers[model] = model._manager_class(api=self, model=model)
+            return self._managers[model]
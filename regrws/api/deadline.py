@@ -0,0 +1,92 @@
+"""Time budgets shared by every call of a multi-step operation"""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+import time
+from contextvars import Token
+from types import TracebackType
+
+
+class DeadlineExceeded(TimeoutError):
+    """The time budget of an operation ran out before a call completed."""
+
+
+_deadline: contextvars.ContextVar[Deadline | None] = contextvars.ContextVar(
+    "regrws_deadline", default=None
+)
+
+
+def current_deadline() -> Deadline | None:
+    """Deadline of the calls made in the current context, if any."""
+    return _deadline.get()
+
+
+class Deadline:
+    """A point in time by which a group of calls must complete.
+
+    Within a ``with`` block, every HTTP call made through the managers of an
+    :class:`~regrws.api.core.Api` gets the remaining budget as its timeout and
+    raises :class:`DeadlineExceeded` once the budget is exhausted, instead of
+    being sent. Nested deadlines can only shorten the budget. The deadline
+    follows operations started through :mod:`regrws.api.bulk` and
+    :class:`~regrws.api.graph.OperationGraph` into their worker threads.
+
+    Args:
+        timeout: Budget in seconds, starting when the deadline is created.
+
+    Example:
+        >>> with Deadline(30):
+        ...     customer = api.customer.create_for_net(parent, **info)
+        ...     net.reassign(child)
+    """
+
+    def __init__(self, timeout: float) -> None:
+        self.timeout = timeout
+        self.expires = time.monotonic() + timeout
+        # a deadline may be entered by several threads at once
+        self._local = threading.local()
+
+    @property
+    def remaining(self) -> float:
+        """Seconds left, zero once expired."""
+        return max(0.0, self.expires - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires
+
+    def check(self) -> float:
+        """Return the remaining budget.
+
+        Raises:
+            DeadlineExceeded: If the budget is exhausted.
+        """
+        remaining = self.remaining
+        if remaining <= 0:
+            raise DeadlineExceeded(f"Deadline of {self.timeout}s exceeded")
+        return remaining
+
+    def __enter__(self) -> Deadline:  # noqa: PYI034
+        # an earlier outer deadline stays in effect, and is returned instead
+        outer = _deadline.get()
+        effective = self if outer is None or self.expires < outer.expires else outer
+        self._tokens().append(_deadline.set(effective))
+        return effective
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        _deadline.reset(self._tokens().pop())
+
+    def _tokens(self) -> list[Token[Deadline | None]]:
+        if not hasattr(self._local, "tokens"):
+            self._local.tokens = []
+        return self._local.tokens
+
+    def __repr__(self) -> str:
+        return f"Deadline(timeout={self.timeout}, remaining={self.remaining:.3f})"
@@ -0,0 +1,173 @@
+"""Dependency-aware execution of multi-step operations"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any
+
+from regrws.api import constants
+from regrws.api.bulk import Result, _call, submit
+
+
+class DependencyError(RuntimeError):
+    """Raised in place of running an operation whose dependency failed."""
+
+
+@dataclass
+class Operation:
+    name: str
+    func: Callable[..., Any]
+    depends_on: tuple[str, ...] = field(default_factory=tuple)
+
+
+class OperationGraph:
+    """Run a graph of operations, passing results along dependency edges.
+
+    Each operation is called with the results of its dependencies as
+    positional arguments, in the order they were listed. Operations whose
+    dependencies are all done run concurrently, up to ``max_workers`` at a
+    time across the whole graph. When an operation fails, by raising or by
+    returning an ARIN ``Error``, everything that depends on it is skipped.
+
+    Args:
+        max_workers: Maximum number of operations running at once.
+
+    Example:
+        >>> graph = OperationGraph(max_workers=8)
+        >>> for net, info in plan:
+        ...     cust = graph.add(
+        ...         f"customer:{net.handle}",
+        ...         lambda net=net, info=info: api.customer.create_for_net(net, **info),
+        ...     )
+        ...     graph.add(
+        ...         f"reassign:{net.handle}",
+        ...         lambda customer, net=net: net.reassign(child_for(net, customer)),
+        ...         depends_on=[cust],
+        ...     )
+        >>> results = graph.run()
+    """
+
+    def __init__(self, max_workers: int = constants.DEFAULT_MAX_WORKERS) -> None:
+        self.max_workers = max_workers
+        self._operations: dict[str, Operation] = {}
+
+    def add(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        depends_on: Iterable[str] = (),
+    ) -> str:
+        """Add an operation to the graph.
+
+        Args:
+            name: Unique name of the operation.
+            func: Called with the results of ``depends_on``.
+            depends_on: Names of the operations this one consumes.
+
+        Returns:
+            ``name``, to be used in ``depends_on`` of later operations.
+        """
+        if name in self._operations:
+            raise ValueError(f"Operation {name!r} is already defined")
+        self._operations[name] = Operation(name, func, tuple(depends_on))
+        return name
+
+    def _check(self) -> None:
+        for operation in self._operations.values():
+            for dependency in operation.depends_on:
+                if dependency not in self._operations:
+                    raise ValueError(
+                        f"Operation {operation.name!r} depends on unknown {dependency!r}"
+                    )
+
+        # Kahn's algorithm, any node left over is part of a cycle
+        remaining = {
+            name: len(set(operation.depends_on))
+            for name, operation in self._operations.items()
+        }
+        dependents = self._dependents()
+        ready = [name for name, count in remaining.items() if count == 0]
+        while ready:
+            for dependent in dependents[ready.pop()]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+        cyclic = sorted(name for name, count in remaining.items() if count)
+        if cyclic:
+            raise ValueError(f"Operations {cyclic} form a dependency cycle")
+
+    def _dependents(self) -> dict[str, list[str]]:
+        dependents: dict[str, list[str]] = {name: [] for name in self._operations}
+        for operation in self._operations.values():
+            for dependency in set(operation.depends_on):
+                dependents[dependency].append(operation.name)
+        return dependents
+
+    def run(self) -> dict[str, Result[str]]:
+        """Run every operation, respecting dependencies.
+
+        Returns:
+            A :class:`~regrws.api.bulk.Result` per operation name. Skipped
+            operations carry a :class:`DependencyError`.
+
+        Raises:
+            ValueError: If a dependency is unknown or the graph has a cycle.
+        """
+        self._check()
+        dependents = self._dependents()
+        # number of dependencies each operation still waits for
+        remaining = {
+            name: len(set(operation.depends_on))
+            for name, operation in self._operations.items()
+        }
+        ready = deque(name for name, count in remaining.items() if count == 0)
+        results: dict[str, Result[str]] = {}
+
+        def skip(name: str, cause: str) -> None:
+            stack = [name]
+            while stack:
+                name = stack.pop()
+                if name in results:
+                    continue
+                results[name] = Result(
+                    name,
+                    exception=DependencyError(f"{name!r} skipped: {cause!r} failed"),
+                )
+                stack.extend(dependents[name])
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            running: dict[Future[Result[str]], str] = {}
+
+            def submit_ready() -> None:
+                while ready:
+                    name = ready.popleft()
+                    if name in results:
+                        continue
+                    operation = self._operations[name]
+                    args = [results[dep].value for dep in operation.depends_on]
+                    future = submit(
+                        executor,
+                        _call,
+                        lambda _, func=operation.func, args=args: func(*args),
+                        name,
+                    )
+                    running[future] = name
+
+            submit_ready()
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    result = results[name] = future.result()
+                    for dependent in dependents[name]:
+                        if not result.ok:
+                            skip(dependent, name)
+                        elif dependent not in results:
+                            remaining[dependent] -= 1
+                            if remaining[dependent] == 0:
+                                ready.append(dependent)
+                submit_ready()
+        return results
@@ -0,0 +1,144 @@
+"""Hedged requests to cut tail latency of idempotent reads"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TypeVar
+
+from regrws.api import bulk
+
+T = TypeVar("T")
+
+
+class HedgingPolicy:
+    """Send a duplicate of slow idempotent requests and keep the first answer.
+
+    When a request has not completed after the ``percentile`` of recently
+    observed latencies, a second identical request is sent and whichever
+    completes first is used. Only GET requests (``from_handle``,
+    ``find_net``, ``find_parent``) are hedged when the policy is passed to
+    :class:`~regrws.api.core.Api`.
+
+    Args:
+        percentile: Percentile of recent latencies after which to hedge.
+        min_samples: Latencies to observe before hedging at all.
+        window: Number of recent latencies kept.
+        min_delay: Lower bound of the hedging delay, in seconds.
+        max_workers: Size of the thread pool running the attempts, and so
+            the number of requests hedged at once.
+
+    Attributes:
+        hedged: Number of duplicate requests sent.
+        hedge_wins: Number of times the duplicate answered first.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        min_samples: int = 20,
+        window: int = 200,
+        min_delay: float = 0.05,
+        max_workers: int = 32,
+    ) -> None:
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.max_workers = max_workers
+        self.hedged = 0
+        self.hedge_wins = 0
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        # workers not running an attempt
+        self._idle = threading.Semaphore(max_workers)
+
+    def record(self, latency: float) -> None:
+        with self._lock:
+            self._latencies.append(latency)
+
+    @property
+    def delay(self) -> float | None:
+        """Seconds to wait before hedging, ``None`` until enough samples exist."""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            latencies = sorted(self._latencies)
+        return max(self.min_delay, bulk.percentile(latencies, self.percentile))
+
+    def _attempt(
+        self, func: Callable[[], T], started: threading.Event | None = None
+    ) -> T:
+        # timed from the moment the attempt actually begins
+        start = time.perf_counter()
+        if started is not None:
+            started.set()
+        result = func()
+        self.record(time.perf_counter() - start)
+        return result
+
+    def _submit(
+        self, func: Callable[[], T], started: threading.Event | None = None
+    ) -> Future[T] | None:
+        """Run an attempt on an idle worker, ``None`` if every worker is busy."""
+        if not self._idle.acquire(blocking=False):
+            return None
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="regrws-hedge"
+                )
+            executor = self._executor
+        future = bulk.submit(executor, self._attempt, func, started)
+        future.add_done_callback(lambda _: self._idle.release())
+        return future
+
+    def run(self, func: Callable[[], T]) -> T:
+        """Call ``func``, hedging it if it is slower than usual.
+
+        Attempts only ever start on idle workers: when every worker is busy,
+        ``func`` runs on the calling thread without hedging, so a burst of
+        callers neither queues behind the pool nor multiplies its own load
+        with hedges.
+
+        Raises:
+            Exception: The exception raised by the first attempt, if every
+                attempt failed.
+        """
+        delay = self.delay
+        started = threading.Event()
+        primary = None if delay is None else self._submit(func, started)
+        if primary is None:
+            return self._attempt(func)
+
+        # the delay runs from the moment the primary attempt is sent
+        started.wait()
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+
+        hedge = self._submit(func)
+        if hedge is None:
+            return primary.result()
+        with self._lock:
+            self.hedged += 1
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in (primary, hedge):
+                if future in done and future.exception() is None:
+                    if future is hedge:
+                        with self._lock:
+                            self.hedge_wins += 1
+                    return future.result()
+        return primary.result()
+
+    def shutdown(self) -> None:
+        """Release the worker threads, without waiting for losing attempts."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
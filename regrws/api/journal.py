@@ -0,0 +1,221 @@
+"""Write-ahead journal of mutating API calls"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Self
+
+if TYPE_CHECKING:
+    from regrws.models.base import BaseModel
+
+
+@dataclass
+class JournalEntry:
+    """A mutating call and, once known, its outcome.
+
+    Attributes:
+        id: Unique identifier linking the intent and outcome records.
+        operation: Manager operation (``create``, ``save``, ``reassign``...).
+        method: HTTP method.
+        url: Request URL, without the API key.
+        payload: Serialized XML payload sent, if any.
+        started: Timestamp at which the intent was recorded.
+        completed: Timestamp at which the outcome was recorded, ``None`` if
+            the call never completed.
+        status: HTTP status code of the response.
+        handle: Handle of the returned object.
+        ticket_no: Ticket number of a returned ticket or ticketed request.
+        error_code: ``Error.code`` of an error returned by ARIN.
+        exception: Description of an exception raised while sending.
+    """
+
+    id: str
+    operation: str
+    method: str
+    url: str
+    payload: str | None = None
+    started: float | None = None
+    completed: float | None = None
+    status: int | None = None
+    handle: str | None = None
+    ticket_no: str | None = None
+    error_code: str | None = None
+    exception: str | None = None
+
+    @property
+    def pending(self) -> bool:
+        """Whether the call was sent without its outcome being recorded."""
+        return self.completed is None
+
+
+def _describe(instance: BaseModel | None) -> dict[str, Any]:
+    # prevent circular import
+    from regrws.models import Error
+    from regrws.models.tickets import Ticket, TicketRequest
+
+    if instance is None:
+        return {}
+    if isinstance(instance, Error):
+        return {"error_code": instance.code}
+    if isinstance(instance, TicketRequest):
+        return {
+            "ticket_no": instance.ticket.ticket_no if instance.ticket else None,
+            "handle": instance.net.handle if instance.net else None,
+        }
+    if isinstance(instance, Ticket):
+        return {"ticket_no": instance.ticket_no}
+    return {"handle": getattr(instance, instance._handle, None)}
+
+
+class Journal:
+    """Append-only journal recording mutating calls made through an Api.
+
+    An intent record is appended before each request is sent and an outcome
+    record once it completes, as JSON lines. Records are handed to the
+    operating system immediately so they survive a crash of the process;
+    ``fsync`` is batched, every ``fsync_every`` records or ``fsync_interval``
+    seconds, to bound what can be lost if the machine itself goes down.
+
+    Args:
+        path: File to append to, created if missing.
+        fsync_every: Number of records written between two fsyncs.
+        fsync_interval: Maximum number of seconds between two fsyncs.
+
+    Example:
+        >>> api = Api(api_key="...", journal=Journal("reassign.journal"))
+        >>> # after a crash
+        >>> [e for e in Journal.read("reassign.journal") if e.pending]
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        fsync_every: int = 64,
+        fsync_interval: float = 1.0,
+    ) -> None:
+        self.path = path
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        # kept open until close()
+        self._file = open(path, "a", encoding="utf-8")  # noqa: SIM115
+        self._lock = threading.Lock()
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def _write(self, record: dict[str, Any]) -> None:
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            self._unsynced += 1
+            if (
+                self._unsynced >= self.fsync_every
+                or time.monotonic() - self._last_sync >= self.fsync_interval
+            ):
+                self._sync()
+
+    def _sync(self) -> None:
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def intent(
+        self, operation: str, method: str, url: str, payload: bytes | None = None
+    ) -> str:
+        """Record a call about to be sent.
+
+        Returns:
+            The entry id to pass to :meth:`outcome`.
+        """
+        entry_id = uuid.uuid4().hex
+        self._write(
+            {
+                "type": "intent",
+                "id": entry_id,
+                "ts": time.time(),
+                "operation": operation,
+                "method": method,
+                "url": url,
+                "payload": payload.decode() if payload is not None else None,
+            }
+        )
+        return entry_id
+
+    def outcome(
+        self,
+        entry_id: str,
+        status: int | None = None,
+        instance: BaseModel | None = None,
+        exception: BaseException | None = None,
+    ) -> None:
+        """Record the outcome of a call previously recorded with :meth:`intent`."""
+        record: dict[str, Any] = {
+            "type": "outcome",
+            "id": entry_id,
+            "ts": time.time(),
+            "status": status,
+            **_describe(instance),
+        }
+        if exception is not None:
+            record["exception"] = f"{type(exception).__name__}: {exception}"
+        self._write(record)
+
+    def flush(self) -> None:
+        """Force every record written so far to disk."""
+        with self._lock:
+            self._file.flush()
+            self._sync()
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._file.flush()
+                self._sync()
+                self._file.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    @staticmethod
+    def read(path: str | os.PathLike[str]) -> Iterator[JournalEntry]:
+        """Read back the entries of a journal, in the order they were started.
+
+        A truncated last line, as left by a crash mid-write, is ignored.
+        """
+        entries: dict[str, JournalEntry] = {}
+        with open(path, encoding="utf-8") as journal:
+            for line in journal:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if record["type"] == "intent":
+                    entries[record["id"]] = JournalEntry(
+                        id=record["id"],
+                        operation=record["operation"],
+                        method=record["method"],
+                        url=record["url"],
+                        payload=record["payload"],
+                        started=record["ts"],
+                    )
+                elif record["id"] in entries:
+                    entry = entries[record["id"]]
+                    entry.completed = record["ts"]
+                    for name in (
+                        "status",
+                        "handle",
+                        "ticket_no",
+                        "error_code",
+                        "exception",
+                    ):
+                        setattr(entry, name, record.get(name))
+        yield from entries.values()
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import time
+from contextlib import nullcontext
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Literal
 
-from regrws.api import constants
+import requests
+
+from regrws.api import constants, tracing
 from regrws.api.core import Response
+from regrws.api.deadline import DeadlineExceeded, current_deadline
+from regrws.api.profiling import phase
 
 
 if TYPE_CHECKING:
@@ -25,40 +32,188 @@ class BaseManager:
     def __init__(self, api: Api, model: type[BaseModel]) -> None:
         self.model = model
         self.api = api
-        self.url_params = {"apikey": self.api.apikey.get_secret_value()}
+        # shared by every thread sending requests through this manager
+        self.url_params = MappingProxyType(
+            {"apikey": self.api.apikey.get_secret_value()}
+        )
 
     @property
     def endpoint_url(self):
         if self.api and self.model._endpoint:
             return f"{self.api.base_url}{self.model._endpoint}"
 
-    def _do(
+    @staticmethod
+    def _overloaded(res: Response) -> bool:
+        """Whether a response tells that ARIN is overloaded or unavailable."""
+        # prevent circular import
+        from regrws.models import Error
+
+        if res.status_code >= 500:
+            return True
+        if res.session.handlers.get(res.status_code) is Error:
+            return res.instance.code == "E_OUTAGE"  # type: ignore
+        return False
+
+    def _send(
         self,
+        handlers: dict,
         verb: Literal["get", "post", "put", "delete"],
         url: str,
         data: bytes | None = None,
+    ) -> Response:
+        # prevent circular import
+        from regrws.api.core import Session
+
+        deadline = current_deadline()
+        # before taking a slot, an exhausted budget says nothing about load
+        if deadline:
+            deadline.check()
+        with phase("session"):
+            session = Session(
+                handlers,  # type: ignore
+                parse_cache=self.api.parse_cache,
+                adapter=self.api.transport,
+            )
+        with session:
+            headers = {}
+            if verb in ("post", "put"):
+                headers["Content-Type"] = constants.CONTENT_TYPE
+            session_method = getattr(session, verb)
+            limiter = self.api.limiter
+            with limiter.slot() if limiter else nullcontext() as slot:
+                # waiting for the slot may have taken part of the budget
+                timeout = deadline.check() if deadline else self.api.timeout
+                try:
+                    with (
+                        tracing.span(
+                            self.api.tracer,
+                            verb.upper(),
+                            client=True,
+                            **{
+                                "http.request.method": verb.upper(),
+                                "url.full": url,
+                                "http.request.body.size": len(data) if data else None,
+                            },
+                        ) as attempt,
+                        phase("network"),
+                    ):
+                        res: Response = session_method(
+                            url,
+                            headers=headers,
+                            params=self.url_params,
+                            data=data,
+                            timeout=timeout,
+                        )  # type: ignore
+                        if attempt is not None:
+                            attempt.set_attribute(
+                                "http.response.status_code", res.status_code
+                            )
+                            attempt.set_attribute(
+                                "http.response.body.size", len(res.content)
+                            )
+                            if res.status_code >= 400:
+                                tracing.set_error(attempt, str(res.status_code))
+                except requests.Timeout as exc:
+                    if deadline and deadline.expired:
+                        raise DeadlineExceeded(
+                            f"Deadline of {deadline.timeout}s exceeded"
+                        ) from exc
+                    raise
+                if slot:
+                    slot.failed = self._overloaded(res)
+            return res
+
+    def _do(
+        self,
+        verb: Literal["get", "post", "put", "delete"],
+        url: str,
+        data: BaseModel | bytes | None = None,
         return_type: type[BaseModel] | None = None,
+        operation: str | None = None,
+        handle: str | None = None,
+    ):
+        operation = operation or verb
+        with tracing.span(
+            self.api.tracer,
+            f"{self.model.__name__}.{operation}",
+            **{
+                "regrws.operation": operation,
+                "regrws.endpoint": self.model._endpoint,
+                "regrws.handle": handle or getattr(data, "handle", None),
+            },
+        ) as current:
+            profiler = self.api.profiler
+            if profiler is None:
+                return self._call(verb, url, data, return_type, operation, current)
+            with profiler.call(operation):
+                return self._call(verb, url, data, return_type, operation, current)
+
+    def _call(
+        self,
+        verb: Literal["get", "post", "put", "delete"],
+        url: str,
+        data: BaseModel | bytes | None,
+        return_type: type[BaseModel] | None,
+        operation: str,
+        current: tracing.Span | None,
     ):
         # prevent circular import
-        from regrws.api.core import Session
         from regrws.models import Error
 
+        if data is not None and not isinstance(data, bytes):
+            with phase("serialize"):
+                data = data.to_payload()
+        if current is not None and data is not None:
+            current.set_attribute("regrws.request.size", len(data))
+
+        journal = self.api.journal if verb != "get" else None
+        if journal:
+            entry_id = journal.intent(operation, verb.upper(), url, data)
+
         handlers = {200: return_type or self.model}
         handlers.update({i: Error for i in [400, 401, 403, 404, 405, 406, 409]})
-        with Session(handlers) as session:  # type: ignore
-            headers = {}
-            if verb in ('post', 'put'):
-                headers['Content-Type'] = constants.CONTENT_TYPE
-            session_method = getattr(session, verb)
-            res: Response = session_method(url, headers=headers, params=self.url_params, data=data)  # type: ignore
+        try:
+            hedging = self.api.hedging
+            if hedging and verb == "get":
+                res = hedging.run(lambda: self._send(handlers, verb, url))
+            else:
+                res = self._send(handlers, verb, url, data)
             res.raise_for_unknown_status()
+            start = time.perf_counter()
+            instance = res.instance
+            if current is not None:
+                self._trace(current, res, instance, time.perf_counter() - start)
+        except Exception as exc:
+            if journal:
+                response = getattr(exc, "response", None)
+                status = getattr(response, "status_code", None)
+                journal.outcome(entry_id, status=status, exception=exc)
+            raise
+        if journal:
+            journal.outcome(entry_id, status=res.status_code, instance=instance)
+
+        if instance:
+            instance.manager = self.api.manager_for(instance.__class__)  # type: ignore
+        return instance
+
+    @staticmethod
+    def _trace(
+        current: tracing.Span,
+        res: Response,
+        instance: BaseModel | None,
+        parse_duration: float,
+    ) -> None:
+        # prevent circular import
+        from regrws.models import Error
 
-            if res.instance:
-                related_model = res.instance.__class__
-                res.instance.manager = related_model._manager_class(
-                    api=self.api, model=related_model
-                )  # type: ignore
-            return res.instance
+        current.set_attribute("http.response.status_code", res.status_code)
+        current.set_attribute("regrws.response.size", len(res.content))
+        current.set_attribute("regrws.parse.duration", parse_duration)
+        if isinstance(instance, Error):
+            current.set_attribute("regrws.error.code", instance.code)
+            tracing.set_error(current, instance.code)
+        elif getattr(instance, "handle", None):
+            current.set_attribute("regrws.handle", instance.handle)  # type: ignore
 
     def create(self, return_type: type[BaseModel] | None = None, *args, **kwargs):
         """Create a new resource.
@@ -78,8 +233,9 @@ class BaseManager:
             return self._do(
                 "post",
                 url,
-                instance.to_xml(encoding="UTF-8", skip_empty=True),  # type: ignore
+                instance,
                 return_type,
+                operation="create",
             )
 
     # retrieve
@@ -95,7 +251,7 @@ class BaseManager:
         if self.endpoint_url:
             handle = handle.upper()
             url = self.endpoint_url + f"/{handle}"
-            return self._do("get", url)
+            return self._do("get", url, operation="from_handle", handle=handle)
 
     # update
     def save(self, instance: BaseModel):
@@ -112,7 +268,8 @@ class BaseManager:
             return self._do(
                 "put",
                 url,
-                instance.to_xml(encoding="UTF-8", skip_empty=True),  # type: ignore
+                instance,
+                operation="save",
             )
 
     # delete
@@ -132,4 +289,4 @@ class BaseManager:
         """
         url = str(instance.absolute_url)
         if url:
-            return self._do("delete", url, return_type=return_type)
+            return self._do("delete", url, return_type=return_type, operation="delete")
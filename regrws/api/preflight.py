@@ -0,0 +1,164 @@
+"""Local detection of reassignments and reallocations bound to be rejected"""
+
+from __future__ import annotations
+
+import bisect
+import os
+import threading
+from ipaddress import IPv4Address, IPv6Address
+from typing import TYPE_CHECKING
+
+from regrws.api.journal import Journal
+from regrws.cache import net_range
+
+if TYPE_CHECKING:
+    from regrws.models.net import Net
+
+SUBDIVISIONS = ("reassign", "reallocate")
+
+# version, first address, last address, label
+_Child = tuple[int, int, int, str]
+
+
+def _describe(version: int, first: int, last: int) -> str:
+    address = IPv4Address if version == 4 else IPv6Address
+    return f"{address(first)}-{address(last)}"
+
+
+class ConflictError(ValueError):
+    """A reassignment or reallocation that ARIN would reject.
+
+    Attributes:
+        parent: Handle of the net being subdivided.
+        net: Net that was to be registered.
+        reason: Why it would be rejected.
+    """
+
+    def __init__(self, parent: str | None, net: Net, reason: str) -> None:
+        super().__init__(f"Cannot subdivide {parent}: {reason}")
+        self.parent = parent
+        self.net = net
+        self.reason = reason
+
+
+class Preflight:
+    """Index of the known children of nets, checked before subdividing them.
+
+    Pass it to :class:`~regrws.api.core.Api` as ``preflight``.
+    :meth:`~regrws.models.net.NetManager.reassign` and
+    :meth:`~regrws.models.net.NetManager.reallocate` then raise
+    :class:`ConflictError` without sending anything when the new net falls
+    outside of its parent or overlaps a known child of it. Nets accepted are
+    added to the index, so a batch also cannot conflict with itself; they are
+    removed again if ARIN rejects them.
+
+    Children are known from :meth:`add` and :meth:`load_journal`. Conflicts
+    with children the index does not know about are still left to ARIN.
+
+    Example:
+        >>> preflight = Preflight()
+        >>> preflight.load_journal("reassign.journal")
+        >>> api = Api(api_key="your-api-key", preflight=preflight)
+    """
+
+    def __init__(self) -> None:
+        # children per parent handle, sorted; siblings do not overlap
+        self._children: dict[str, list[_Child]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _child(net: Net) -> _Child | None:
+        bounds = net_range(net)
+        if bounds is None:
+            return None
+        return (*bounds, net.handle or net.net_name or "")
+
+    def add(self, net: Net, parent: str | None = None) -> None:
+        """Record a child net.
+
+        Args:
+            net: Registered (or about to be registered) net.
+            parent: Handle of its parent, ``net.parent_net_handle`` by
+                default.
+        """
+        parent = parent or net.parent_net_handle
+        child = self._child(net)
+        if parent is None or child is None:
+            raise ValueError("The parent and net blocks of the net must be known")
+        with self._lock:
+            bisect.insort(self._children.setdefault(parent.upper(), []), child)
+
+    def load_journal(self, path: str | os.PathLike[str]) -> int:
+        """Record the nets registered by the reassignments and reallocations
+        of a :class:`~regrws.api.journal.Journal`, pending or successful.
+
+        Returns:
+            The number of nets recorded.
+        """
+        # prevent circular import
+        from regrws.models.net import Net
+
+        count = 0
+        for entry in Journal.read(path):
+            if entry.operation not in SUBDIVISIONS or not entry.payload:
+                continue
+            if not entry.pending and (entry.status != 200 or entry.error_code):
+                continue
+            # .../net/<parent>/reassign
+            parent = entry.url.rstrip("/").split("/")[-2]
+            self.add(Net.from_xml(entry.payload.encode()), parent)
+            count += 1
+        return count
+
+    def reserve(self, parent: Net, net: Net) -> None:
+        """Check that ``net`` can be carved out of ``parent`` and record it.
+
+        Raises:
+            ConflictError: ``net`` is outside of ``parent`` or overlaps one of
+                its known children.
+        """
+        child = self._child(net)
+        if child is None:
+            raise ConflictError(parent.handle, net, "the net has no net blocks")
+        version, first, last, _ = child
+        outer = net_range(parent)
+        if outer is not None and not (
+            outer[0] == version and outer[1] <= first and last <= outer[2]
+        ):
+            raise ConflictError(
+                parent.handle,
+                net,
+                f"{_describe(version, first, last)} is outside of {_describe(*outer)}",
+            )
+        if parent.handle is None:
+            return
+        with self._lock:
+            siblings = self._children.setdefault(parent.handle.upper(), [])
+            # siblings are disjoint: only the last one starting before the
+            # end of the new net may overlap it
+            index = bisect.bisect_right(
+                siblings, (version, last), key=lambda sibling: sibling[:2]
+            )
+            if index:
+                s_version, s_first, s_last, label = siblings[index - 1]
+                if s_version == version and s_last >= first:
+                    raise ConflictError(
+                        parent.handle,
+                        net,
+                        f"{_describe(version, first, last)} overlaps {label} "
+                        f"({_describe(s_version, s_first, s_last)})",
+                    )
+            bisect.insort(siblings, child)
+
+    def release(self, parent: Net, net: Net) -> None:
+        """Forget a net recorded by :meth:`reserve` that was not registered."""
+        child = self._child(net)
+        if parent.handle is None or child is None:
+            return
+        with self._lock:
+            siblings = self._children.get(parent.handle.upper(), [])
+            if child in siblings:
+                siblings.remove(child)
+
+    def __len__(self) -> int:
+        return sum(len(children) for children in self._children.values())
@@ -0,0 +1,171 @@
+"""Sampling breakdown of where the time of API calls goes"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import random
+import threading
+import time
+from collections import defaultdict, deque
+from collections.abc import Iterator
+from typing import Any
+
+from regrws.api import bulk
+
+PHASES = ("serialize", "gate", "session", "network", "copy", "parse", "validate")
+"""Phases of a call, in the order they happen.
+
+- ``serialize``: ``to_xml`` of the payload.
+- ``gate``: waiting for a slot of the :class:`AdaptiveLimiter`.
+- ``session``: creating the session and preparing the request.
+- ``network``: sending the request and waiting for the response, including
+  connection setup.
+- ``copy``: ``Response._from_response`` copying the response.
+- ``parse``: parsing the XML content into an element tree.
+- ``validate``: building and validating the model from the element tree.
+"""
+
+
+class Sample:
+    """Time spent in each phase of one call, nested phases excluded."""
+
+    def __init__(self, operation: str) -> None:
+        self.operation = operation
+        self.phases: dict[str, float] = defaultdict(float)
+        self._lock = threading.Lock()
+        # per thread, as hedged attempts record phases concurrently
+        self._nested = threading.local()
+
+    def _stack(self) -> list[float]:
+        if not hasattr(self._nested, "stack"):
+            self._nested.stack = [0.0]
+        return self._nested.stack
+
+    def enter(self) -> None:
+        self._stack().append(0.0)
+
+    def exit(self, name: str, elapsed: float) -> None:
+        stack = self._stack()
+        nested = stack.pop()
+        stack[-1] += elapsed
+        with self._lock:
+            self.phases[name] += elapsed - nested
+
+
+_sample: contextvars.ContextVar[Sample | None] = contextvars.ContextVar(
+    "regrws_sample", default=None
+)
+
+
+@contextlib.contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Attribute the time spent in the block to ``name`` if the call is sampled."""
+    sample = _sample.get()
+    if sample is None:
+        yield
+        return
+    sample.enter()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        sample.exit(name, time.perf_counter() - start)
+
+
+class Profiler:
+    """Record a per-phase breakdown of a fraction of the calls of an Api.
+
+    Pass it to :class:`~regrws.api.core.Api` as ``profiler``. Sampled calls
+    record the time spent in each of :data:`PHASES`; :meth:`report`
+    aggregates them per operation, telling whether calls are bound by ARIN
+    (``network``) or by the client (``parse``, ``validate``, ``serialize``).
+
+    Args:
+        sample_rate: Fraction of calls to sample, between 0 and 1.
+        window: Number of recent samples kept per operation.
+        seed: Seed of the sampling decisions, for reproducible runs.
+    """
+
+    def __init__(
+        self, sample_rate: float = 0.01, window: int = 1000, seed: int | None = None
+    ) -> None:
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("`sample_rate` must be between 0 and 1")
+        self.sample_rate = sample_rate
+        self.calls = 0
+        self._random = random.Random(seed)
+        self._samples: dict[str, deque[tuple[float, dict[str, float]]]] = defaultdict(
+            lambda: deque(maxlen=window)
+        )
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def call(self, operation: str) -> Iterator[Sample | None]:
+        """Sample the call made within the block, or not."""
+        with self._lock:
+            self.calls += 1
+            sampled = self._random.random() < self.sample_rate
+        if not sampled or _sample.get() is not None:
+            yield None
+            return
+        sample = Sample(operation)
+        token = _sample.set(sample)
+        start = time.perf_counter()
+        try:
+            yield sample
+        finally:
+            total = time.perf_counter() - start
+            _sample.reset(token)
+            with self._lock:
+                self._samples[operation].append((total, dict(sample.phases)))
+
+    def report(self) -> dict[str, Any]:
+        """Aggregate the samples per operation.
+
+        Returns:
+            For each operation, the number of samples, the mean, p50 and p95
+            of the total duration and of each phase, in seconds, and the
+            share of the total spent in each phase. Time not attributed to a
+            phase is reported as ``other``.
+        """
+        with self._lock:
+            samples = {name: list(values) for name, values in self._samples.items()}
+        report: dict[str, Any] = {}
+        for operation, values in samples.items():
+            totals = sorted(total for total, _ in values)
+            durations: dict[str, list[float]] = {name: [] for name in PHASES}
+            durations["other"] = []
+            for total, phases in values:
+                for name in PHASES:
+                    durations[name].append(phases.get(name, 0.0))
+                durations["other"].append(max(0.0, total - sum(phases.values())))
+            grand_total = sum(totals)
+            report[operation] = {
+                "samples": len(values),
+                "total": _stats(totals),
+                "phases": {
+                    name: {
+                        **_stats(sorted(values)),
+                        "share": round(sum(values) / grand_total, 4)
+                        if grand_total
+                        else 0.0,
+                    }
+                    for name, values in durations.items()
+                    if any(values)
+                },
+            }
+        return report
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+            self.calls = 0
+
+
+def _stats(values: list[float]) -> dict[str, float]:
+    return {
+        "mean": round(sum(values) / len(values), 6) if values else 0.0,
+        "p50": round(bulk.percentile(values, 50), 6),
+        "p95": round(bulk.percentile(values, 95), 6),
+    }
@@ -0,0 +1,63 @@
+"""OpenTelemetry-compatible tracing of API calls"""
+
+from __future__ import annotations
+
+import contextlib
+from collections.abc import Iterator
+from typing import Any, Protocol
+
+try:
+    from opentelemetry.trace import SpanKind, StatusCode
+except ImportError:  # pragma: no cover
+    SpanKind = StatusCode = None  # type: ignore
+
+
+class Span(Protocol):
+    def set_attribute(self, key: str, value: Any) -> None: ...
+
+
+class Tracer(Protocol):
+    """What regrws needs from a tracer, as provided by OpenTelemetry's."""
+
+    def start_as_current_span(
+        self, name: str, *args: Any, **kwargs: Any
+    ) -> contextlib.AbstractContextManager[Span]: ...
+
+
+def get_tracer(name: str = "regrws") -> Tracer:
+    """Return the OpenTelemetry tracer ``name`` of the global tracer provider."""
+    try:
+        from opentelemetry import trace
+    except ImportError as exc:  # pragma: no cover
+        raise ImportError(
+            "opentelemetry-api is required for tracing: pip install opentelemetry-api"
+        ) from exc
+    return trace.get_tracer(name)
+
+
+@contextlib.contextmanager
+def span(
+    tracer: Tracer | None, name: str, client: bool = False, **attributes: Any
+) -> Iterator[Span | None]:
+    """Run the block in a span of ``tracer``, if any.
+
+    Attributes whose value is ``None`` are left out. Exceptions raised by the
+    block are recorded by the tracer.
+    """
+    if tracer is None:
+        yield None
+        return
+    kwargs: dict[str, Any] = {
+        "attributes": {k: v for k, v in attributes.items() if v is not None}
+    }
+    if client and SpanKind is not None:
+        kwargs["kind"] = SpanKind.CLIENT
+    with tracer.start_as_current_span(name, **kwargs) as current:
+        yield current
+
+
+def set_error(current: Span, description: str) -> None:
+    """Mark a span as failed without an exception, e.g. for an ``Error`` payload."""
+    set_status = getattr(current, "set_status", None)
+    if StatusCode is not None and set_status is not None:
+        set_status(StatusCode.ERROR, description)
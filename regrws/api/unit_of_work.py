@@ -0,0 +1,118 @@
+"""Unit of work coalescing repeated modifications of the same objects"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Self
+
+from regrws.api import constants
+from regrws.api.bulk import Result, run_concurrently
+
+if TYPE_CHECKING:
+    from regrws.api.core import Api
+    from regrws.api.manager import BaseManager
+    from regrws.models.base import BaseModel
+
+
+class UnitOfWork:
+    """Accumulate edits to POC, Org, Customer and Net objects and save each once.
+
+    Objects are fetched at most once per unit of work: every :meth:`get` for
+    the same handle returns the same instance, so independent edits all land
+    on it. :meth:`commit` sends a single PUT for each object whose content
+    changed, saving different objects concurrently.
+
+    Args:
+        api: The Api instance to use.
+        max_workers: Maximum number of concurrent requests during commit.
+
+    Example:
+        >>> with UnitOfWork(api) as uow:
+        ...     poc = uow.get(api.poc, "EXAMPLE-ARIN")
+        ...     poc.emails.append("noc@example.com")
+        ...     uow.get(api.poc, "EXAMPLE-ARIN").city = "Chantilly"
+        # one PUT for EXAMPLE-ARIN when the block exits
+    """
+
+    def __init__(
+        self, api: Api, max_workers: int = constants.DEFAULT_MAX_WORKERS
+    ) -> None:
+        self.api = api
+        self.max_workers = max_workers
+        self._instances: dict[tuple[type, str], BaseModel] = {}
+        self._snapshots: dict[tuple[type, str], dict[str, Any]] = {}
+
+    @staticmethod
+    def _key(instance: BaseModel) -> tuple[type, str]:
+        handle = getattr(instance, instance._handle)
+        if not handle:
+            raise ValueError("Only objects with a handle can be tracked")
+        return type(instance), handle.upper()
+
+    def get(self, manager: BaseManager, handle: str) -> BaseModel | None:
+        """Fetch an object through ``manager`` unless it is already tracked.
+
+        Returns:
+            The tracked instance, or whatever the manager returned (such as
+            an ``Error``) if the object could not be retrieved.
+        """
+        key = (manager.model, handle.upper())
+        if key not in self._instances:
+            instance = manager.from_handle(handle)
+            if not isinstance(instance, manager.model):
+                return instance
+            self.add(instance)
+        return self._instances[key]
+
+    def add(self, instance: BaseModel) -> BaseModel:
+        """Track an already retrieved instance.
+
+        Returns:
+            The tracked instance for the same handle, which is ``instance``
+            unless that handle was already being tracked.
+        """
+        key = self._key(instance)
+        if key not in self._instances:
+            self._instances[key] = instance
+            self._snapshots[key] = instance.model_dump()
+        return self._instances[key]
+
+    @property
+    def dirty(self) -> list[BaseModel]:
+        """Tracked instances whose content differs from when they were added."""
+        return [
+            instance
+            for key, instance in self._instances.items()
+            if instance.model_dump() != self._snapshots[key]
+        ]
+
+    def commit(self) -> list[Result[BaseModel]]:
+        """Save every modified object once, concurrently.
+
+        Objects that were saved successfully are considered clean afterwards,
+        failed ones stay dirty so that ``commit`` can be called again.
+
+        Returns:
+            One :class:`~regrws.api.bulk.Result` per saved object.
+        """
+        results = run_concurrently(
+            lambda instance: instance.save(), self.dirty, self.max_workers
+        )
+        for result in results:
+            if result.ok:
+                key = self._key(result.item)
+                self._snapshots[key] = result.item.model_dump()
+        return results
+
+    def rollback(self) -> None:
+        """Forget every tracked object without saving."""
+        self._instances.clear()
+        self._snapshots.clear()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *args: object) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
@@ -0,0 +1,222 @@
+"""Polling of objects for changes made outside of this client"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal
+
+from regrws.api import bulk, constants
+
+if TYPE_CHECKING:
+    from regrws.api.manager import BaseManager
+    from regrws.models.base import BaseModel
+
+
+@dataclass(frozen=True)
+class FieldChange:
+    """A value that differs between two snapshots of an object.
+
+    Attributes:
+        path: Location of the value, such as ``net_blocks[0].cidr_length``.
+        old: Previous value, ``None`` if it was added.
+        new: Current value, ``None`` if it was removed.
+    """
+
+    path: str
+    old: Any
+    new: Any
+
+
+def diff(old: Any, new: Any, path: str = "") -> list[FieldChange]:
+    """Compare two ``model_dump()`` snapshots field by field."""
+    if isinstance(old, dict) and isinstance(new, dict):
+        changes = []
+        for key in [*old, *(key for key in new if key not in old)]:
+            sub = f"{path}.{key}" if path else str(key)
+            changes.extend(diff(old.get(key), new.get(key), sub))
+        return changes
+    if isinstance(old, list) and isinstance(new, list):
+        changes = []
+        for index in range(max(len(old), len(new))):
+            changes.extend(
+                diff(
+                    old[index] if index < len(old) else None,
+                    new[index] if index < len(new) else None,
+                    f"{path}[{index}]",
+                )
+            )
+        return changes
+    if old != new:
+        return [FieldChange(path, old, new)]
+    return []
+
+
+@dataclass
+class Change:
+    """Something that happened to a watched object.
+
+    Attributes:
+        manager: Manager the object is fetched through.
+        handle: Handle of the object.
+        kind: ``"changed"`` when fields differ from the last successful poll,
+            ``"error"`` when an object that could be retrieved no longer can.
+        fields: Field-level differences, for ``"changed"``.
+        instance: The object as just fetched, for ``"changed"``.
+        error: The ``Error`` payload or exception, for ``"error"``.
+    """
+
+    manager: BaseManager
+    handle: str
+    kind: Literal["changed", "error"]
+    fields: list[FieldChange] = field(default_factory=list)
+    instance: BaseModel | None = None
+    error: Any = None
+
+
+class Watcher:
+    """Poll a set of objects and report field-level changes.
+
+    Each object is fetched once per cycle, and the requests of a cycle are
+    spread evenly over it instead of being sent in a burst. The first poll of
+    an object only records its state; later polls yield a :class:`Change`
+    when it differs. Failures are reported once, when an object that could
+    be retrieved no longer can.
+
+    Args:
+        targets: ``(manager, handle)`` pairs to watch.
+        interval: Duration of a polling cycle, in seconds.
+        budget: Maximum number of requests per second. Cycles are stretched
+            when the targets cannot all be polled within ``interval``.
+        max_workers: Maximum number of requests in flight.
+
+    Example:
+        >>> watcher = Watcher([(api.net, "NET-192-0-2-0-1")], interval=3600)
+        >>> for change in watcher.watch():
+        ...     for field_change in change.fields:
+        ...         print(change.handle, field_change)
+    """
+
+    def __init__(
+        self,
+        targets: Iterable[tuple[BaseManager, str]] = (),
+        interval: float = 3600.0,
+        budget: float | None = None,
+        max_workers: int = constants.DEFAULT_MAX_WORKERS,
+    ) -> None:
+        self.interval = interval
+        self.budget = budget
+        self.max_workers = max_workers
+        self._targets: dict[tuple[type, str], tuple[BaseManager, str]] = {}
+        self._snapshots: dict[tuple[type, str], dict[str, Any]] = {}
+        self._failing: set[tuple[type, str]] = set()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        for manager, handle in targets:
+            self.add(manager, handle)
+
+    def add(self, manager: BaseManager, handle: str) -> None:
+        with self._lock:
+            self._targets[(manager.model, handle.upper())] = (manager, handle)
+
+    def remove(self, manager: BaseManager, handle: str) -> None:
+        key = (manager.model, handle.upper())
+        with self._lock:
+            self._targets.pop(key, None)
+            self._snapshots.pop(key, None)
+            self._failing.discard(key)
+
+    @property
+    def cycle(self) -> float:
+        """Duration of a polling cycle given the number of targets and budget."""
+        if self.budget:
+            return max(self.interval, len(self._targets) / self.budget)
+        return self.interval
+
+    def stop(self) -> None:
+        """Make :meth:`watch` return once the requests in flight complete."""
+        self._stopped.set()
+
+    def check(self, manager: BaseManager, handle: str) -> Change | None:
+        """Fetch one object and compare it with its previous state."""
+        # prevent circular import
+        from regrws.models import Error
+
+        key = (manager.model, handle.upper())
+        try:
+            instance = manager.from_handle(handle)
+            error = instance if isinstance(instance, Error) else None
+        except Exception as exc:  # noqa: BLE001  # pylint: disable=broad-except
+            instance, error = None, exc
+        with self._lock:
+            if key not in self._targets:
+                return None
+            previous = self._snapshots.get(key)
+            if error is not None or instance is None:
+                if previous is not None and key not in self._failing:
+                    self._failing.add(key)
+                    return Change(manager, handle, "error", error=error)
+                return None
+            self._failing.discard(key)
+            current = self._snapshots[key] = instance.model_dump()
+        if previous is None:
+            return None
+        fields = diff(previous, current)
+        if fields:
+            return Change(manager, handle, "changed", fields, instance)
+        return None
+
+    def watch(self, cycles: int | None = None) -> Iterator[Change]:
+        """Poll the targets, yielding changes as they are detected.
+
+        Args:
+            cycles: Number of cycles to run, forever (until :meth:`stop`) if
+                ``None``.
+        """
+        self._stopped.clear()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending: set[Future[Change | None]] = set()
+            due = time.monotonic()
+            rounds = itertools.count() if cycles is None else range(cycles)
+            for _ in rounds:
+                with self._lock:
+                    targets = list(self._targets.values())
+                if not targets:
+                    targets = [None]  # idle for a cycle
+                spacing = self.cycle / len(targets)
+                for target in targets:
+                    while True:
+                        yield from self._collect(pending)
+                        remaining = due - time.monotonic()
+                        if self._stopped.is_set():
+                            yield from self._drain(pending)
+                            return
+                        if remaining <= 0:
+                            break
+                        if pending:
+                            wait(pending, remaining, return_when=FIRST_COMPLETED)
+                        else:
+                            self._stopped.wait(remaining)
+                    if target is not None:
+                        while len(pending) >= self.max_workers:
+                            wait(pending, return_when=FIRST_COMPLETED)
+                            yield from self._collect(pending)
+                        pending.add(bulk.submit(executor, self.check, *target))
+                    due += spacing
+            yield from self._drain(pending)
+
+    @staticmethod
+    def _collect(pending: set[Future[Change | None]]) -> Iterator[Change]:
+        for future in [future for future in pending if future.done()]:
+            pending.discard(future)
+            change = future.result()
+            if change is not None:
+                yield change
+
+    def _drain(self, pending: set[Future[Change | None]]) -> Iterator[Change]:
+        wait(pending)
+        yield from self._collect(pending)
@@ -0,0 +1,434 @@
+"""Bounded, thread-safe memoization shared by the models and managers"""
+
+from __future__ import annotations
+
+import bisect
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator
+from ipaddress import IPv4Address, IPv6Address
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from regrws.models.net import Net
+
+V = TypeVar("V")
+
+
+class LRUCache(Generic[V]):
+    """Least-recently-used mapping holding at most ``maxsize`` entries.
+
+    Args:
+        maxsize: Number of entries kept, ``0`` disables the cache.
+
+    Attributes:
+        hits: Number of lookups that found an entry.
+        misses: Number of lookups that did not.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> V | None:
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: V) -> None:
+        with self._lock:
+            if self.maxsize <= 0:
+                return
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class _Known:
+    """A net known to a :class:`NetRangeCache` and the queries it answered."""
+
+    __slots__ = ("expires", "net", "queries")
+
+    def __init__(self, net: Net | None, expires: float) -> None:
+        self.net = net
+        self.expires = expires
+        self.queries: dict[str, _Queries] = {}
+
+
+class _Queries:
+    """Ranges of the queries a net answered, for one kind of query.
+
+    A query proves the answer to every wider query, so only the narrowest
+    ones are kept: none contains another, and sorted by first address they
+    are also sorted by last address, which lets every operation bisect.
+    """
+
+    __slots__ = ("expires", "firsts", "lasts")
+
+    def __init__(self) -> None:
+        self.firsts: list[int] = []
+        self.lasts: list[int] = []
+        self.expires: list[float] = []
+
+    def __len__(self) -> int:
+        return len(self.firsts)
+
+    def proves(self, first: int, last: int, now: float) -> bool:
+        """Whether an unexpired query lies within ``[first, last]``."""
+        for index in range(bisect.bisect_left(self.firsts, first), len(self)):
+            if self.lasts[index] > last:
+                break
+            if self.expires[index] > now:
+                return True
+        return False
+
+    def add(
+        self, first: int, last: int, expires: float, now: float, maxsize: int
+    ) -> None:
+        if self.proves(first, last, now):
+            return
+        # expired queries within the new one, then those containing it
+        lo = bisect.bisect_left(self.firsts, first)
+        hi = bisect.bisect_right(self.lasts, last, lo)
+        self._delete(lo, hi)
+        hi = bisect.bisect_right(self.firsts, first)
+        lo = bisect.bisect_left(self.lasts, last, 0, hi)
+        self._delete(lo, hi)
+        self.firsts.insert(lo, first)
+        self.lasts.insert(lo, last)
+        self.expires.insert(lo, expires)
+        if len(self) > maxsize:
+            oldest = min(range(len(self)), key=self.expires.__getitem__)
+            self._delete(oldest, oldest + 1)
+
+    def discard_overlapping(self, first: int, last: int) -> None:
+        self._delete(
+            bisect.bisect_left(self.lasts, first),
+            bisect.bisect_right(self.firsts, last),
+        )
+
+    def _delete(self, lo: int, hi: int) -> None:
+        if lo < hi:
+            del self.firsts[lo:hi]
+            del self.lasts[lo:hi]
+            del self.expires[lo:hi]
+
+
+_Range = tuple[int, int, int]  # version, first address, last address
+
+
+def _address(value: Any) -> IPv4Address | IPv6Address:
+    # avoid circular imports
+    from regrws.models.types import _validate_ip_address
+
+    if isinstance(value, (IPv4Address, IPv6Address)):
+        return value
+    return _validate_ip_address(value)
+
+
+def _query_range(start_address: Any, end_address: Any) -> _Range:
+    start, end = _address(start_address), _address(end_address)
+    return start.version, int(start), int(end)
+
+
+def _detached(net: Net) -> Net:
+    """Deep copy of ``net``, without the manager it may be bound to."""
+    shallow = net.model_copy()
+    object.__setattr__(shallow, "__pydantic_private__", {})
+    return shallow.model_copy(deep=True)
+
+
+def net_range(net: Net) -> _Range | None:
+    """Return the version, first and last address covered by a Net's blocks."""
+    bounds = []
+    for block in net.net_blocks or ():
+        start = _address(block.start_address)
+        if block.end_address is not None:
+            end = int(_address(block.end_address))
+        elif block.cidr_length is not None:
+            end = int(start) + 2 ** (start.max_prefixlen - block.cidr_length) - 1
+        else:  # pragma: no cover
+            return None
+        bounds.append((start.version, int(start), end))
+    if not bounds:
+        return None
+    return bounds[0][0], min(b[1] for b in bounds), max(b[2] for b in bounds)
+
+
+class NetRangeCache:
+    """Range-aware cache of ``find_net`` and ``find_parent`` results.
+
+    Pass it to :class:`~regrws.api.core.Api` as ``net_cache``. Besides
+    repeated queries, a query is answered locally when the answer is provably
+    the one of a cached query: nets nest, so if the most specific net
+    containing a range is ``N``, it is also the most specific net containing
+    any wider range still within ``N``.
+
+    With ``trust_known``, queries within a cached net are also answered when
+    no other net known to the cache overlaps them. This only holds when
+    every net registered under the cached ones is known, for instance when
+    planning the reassignments of an allocation that only this client
+    subdivides.
+
+    Reassigning, reallocating, removing, deleting or saving a net through
+    the managers drops the entries it may affect.
+
+    Args:
+        ttl: Seconds for which an answer is reused.
+        maxsize: Number of nets kept.
+        trust_known: Also infer answers from the absence of known children.
+        max_queries: Number of queries kept per net and kind of query, the
+            oldest are forgotten first.
+
+    Attributes:
+        hits: Number of queries answered locally.
+        misses: Number of queries sent to ARIN.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        maxsize: int = 10000,
+        trust_known: bool = False,
+        max_queries: int = 64,
+    ) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.trust_known = trust_known
+        self.max_queries = max_queries
+        self.hits = 0
+        self.misses = 0
+        self._known: OrderedDict[tuple[_Range, str | None], _Known] = OrderedDict()
+        # version -> size of the range -> sorted first addresses, so that the
+        # nets containing or crossing a query are found by bisection
+        self._starts: dict[int, dict[int, list[int]]] = {}
+        # handles of the known nets per range, and ranges per handle
+        self._handles: dict[_Range, set[str | None]] = {}
+        self._ranges: dict[str | None, set[_Range]] = {}
+        self._lock = threading.Lock()
+
+    def _add(self, key: tuple[_Range, str | None], known: _Known) -> None:
+        self._known[key] = known
+        bounds, handle = key
+        handles = self._handles.setdefault(bounds, set())
+        if not handles:
+            version, first, last = bounds
+            starts = self._starts.setdefault(version, {}).setdefault(last - first, [])
+            bisect.insort(starts, first)
+        handles.add(handle)
+        self._ranges.setdefault(handle, set()).add(bounds)
+
+    def _remove(self, key: tuple[_Range, str | None]) -> None:
+        del self._known[key]
+        bounds, handle = key
+        ranges = self._ranges[handle]
+        ranges.discard(bounds)
+        if not ranges:
+            del self._ranges[handle]
+        handles = self._handles[bounds]
+        handles.discard(handle)
+        if handles:
+            return
+        del self._handles[bounds]
+        version, first, last = bounds
+        sizes = self._starts[version]
+        starts = sizes[last - first]
+        del starts[bisect.bisect_left(starts, first)]
+        if not starts:
+            del sizes[last - first]
+
+    def _starting(
+        self, version: int, low: int, high: int, min_size: int = 0
+    ) -> Iterator[tuple[int, int, _Known]]:
+        """Unexpired known nets of at least ``min_size`` addresses whose range
+        starts within ``[low - size, high]``, ``size`` being its own."""
+        now = time.monotonic()
+        for (_, r_first, r_last), _, known in self._keys(version, low, high, min_size):
+            if known.expires > now:
+                yield r_first, r_last, known
+
+    def _keys(
+        self, version: int, low: int, high: int, min_size: int = 0
+    ) -> Iterator[tuple[_Range, str | None, _Known]]:
+        """Like :meth:`_starting`, with the keys of expired nets too."""
+        for size, starts in self._starts.get(version, {}).items():
+            if size < min_size:
+                continue
+            lo = bisect.bisect_left(starts, low - size)
+            hi = bisect.bisect_right(starts, high)
+            for r_first in starts[lo:hi]:
+                bounds = (version, r_first, r_first + size)
+                for handle in self._handles[bounds]:
+                    yield bounds, handle, self._known[(bounds, handle)]
+
+    def get(self, kind: str, start_address: Any, end_address: Any) -> Net | None:
+        """Return a copy of the net answering the query, if known.
+
+        Args:
+            kind: ``"find_net"`` or ``"find_parent"``.
+            start_address: First address of the queried range.
+            end_address: Last address of the queried range.
+        """
+        version, first, last = _query_range(start_address, end_address)
+        now = time.monotonic()
+        with self._lock:
+            # containing nets start at most their size before the query ends
+            candidates = [
+                ((r_first, r_last), known)
+                for r_first, r_last, known in self._starting(
+                    version, last, first, min_size=last - first
+                )
+                if r_first <= first
+                and last <= r_last
+                # a range is not its own parent
+                and (kind != "find_parent" or (r_first, r_last) != (first, last))
+            ]
+            net = self._proven(kind, first, last, candidates, now)
+            if net is None and self.trust_known:
+                net = self._inferred(version, first, last, candidates)
+            if net is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return net.model_copy(deep=True)
+
+    @staticmethod
+    def _proven(kind, first, last, candidates, now) -> Net | None:
+        for _, known in candidates:
+            queries = known.queries.get(kind)
+            if known.net is not None and queries and queries.proves(first, last, now):
+                return known.net
+        return None
+
+    def _inferred(self, version, first, last, candidates) -> Net | None:
+        if not candidates:
+            return None
+        candidates.sort(key=lambda item: item[0][1] - item[0][0])
+        (c_first, c_last), closest = candidates[0]
+        if closest.net is None or (
+            len(candidates) > 1 and candidates[1][0] == (c_first, c_last)
+        ):
+            # a registration we know nothing about, or ambiguous
+            return None
+        # nets only partly overlapping the query start just before it or
+        # end just after it
+        crossing = itertools.chain(
+            self._starting(version, first, first - 1),
+            self._starting(version, last + 1, last),
+        )
+        for r_first, r_last, known in crossing:
+            if known is closest or not (c_first <= r_first and r_last <= c_last):
+                continue
+            overlaps = r_first <= last and first <= r_last
+            if overlaps and not (first <= r_first and r_last <= last):
+                return None
+        return closest.net
+
+    def put(self, kind: str, start_address: Any, end_address: Any, net: Net) -> None:
+        """Record ``net`` as the answer to a query."""
+        answer = net_range(net)
+        if answer is None:
+            return
+        _, first, last = _query_range(start_address, end_address)
+        now = time.monotonic()
+        expires = now + self.ttl
+        key = (answer, net.handle)
+        with self._lock:
+            known = self._known.get(key)
+            if known is None:
+                known = _Known(_detached(net), expires)
+                self._add(key, known)
+            elif known.net is None:
+                known.net = _detached(net)
+                known.queries.clear()
+                known.expires = expires
+            else:
+                known.net = _detached(net)
+                known.expires = expires
+            known.queries.setdefault(kind, _Queries()).add(
+                first, last, expires, now, self.max_queries
+            )
+            self._known.move_to_end(key)
+            self._evict(now)
+
+    def invalidate(self, net: Net, registered: bool = False) -> None:
+        """Drop the entries that a change to ``net`` may affect.
+
+        Args:
+            net: Net changed, or registered when ``registered`` is set.
+            registered: Remember that a net now covers the range of ``net``,
+                so that it is not inferred away with ``trust_known``.
+        """
+        changed = net_range(net)
+        with self._lock:
+            if changed is None:
+                self._clear()
+                return
+            version, first, last = changed
+            affected = {
+                (bounds, handle): known
+                for bounds, handle, known in self._keys(version, first, last)
+            }
+            if net.handle is not None:
+                for bounds in self._ranges.get(net.handle, ()):
+                    key = (bounds, net.handle)
+                    affected[key] = self._known[key]
+            for key, known in affected.items():
+                (_, r_first, r_last), handle = key
+                same = handle is not None and handle == net.handle
+                if (
+                    known.net is not None
+                    and not same
+                    and r_first <= first
+                    and last <= r_last
+                ):
+                    # an ancestor: only its answers overlapping the change
+                    for queries in known.queries.values():
+                        queries.discard_overlapping(first, last)
+                else:
+                    self._remove(key)
+            if registered:
+                now = time.monotonic()
+                self._add((changed, net.handle), _Known(None, now + self.ttl))
+                self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        while self._known and (
+            len(self._known) > self.maxsize
+            or next(iter(self._known.values())).expires <= now
+        ):
+            self._remove(next(iter(self._known)))
+
+    def _clear(self) -> None:
+        self._known.clear()
+        self._starts.clear()
+        self._handles.clear()
+        self._ranges.clear()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._known)
@@ -0,0 +1,354 @@
+"""Command-line interface for bulk Reg-RWS operations
+
+Every command reads its inputs lazily, runs the requests with ``--concurrency``
+worker threads and writes one NDJSON record per input to stdout, in input
+order. Only a bounded window of inputs is in flight at a time and snapshots
+are written in batches, so memory use does not grow with the input. A latency
+summary is written to stderr once done.
+
+Example:
+    $ regrws get poc -f handles.txt --concurrency 16 > pocs.ndjson
+    $ regrws export net -f nets.txt --format parquet -o nets.parquet
+    $ regrws reassign plan.csv --journal reassign.journal
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import csv
+import functools
+import json
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from ipaddress import ip_network
+from typing import IO, TYPE_CHECKING, Any
+
+from regrws.api import constants
+from regrws.api.bulk import Result, Summary, iter_concurrently
+from regrws.api.concurrency import AdaptiveLimiter
+from regrws.api.core import Api
+
+if TYPE_CHECKING:
+    from regrws.api.journal import Journal
+
+KINDS = ("poc", "org", "net", "customer")
+
+
+def _read_lines(stream: IO[str]) -> Iterator[str]:
+    for line in stream:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield line
+
+
+def _inputs(args: argparse.Namespace) -> Iterator[str]:
+    yield from args.handles
+    if args.file == "-" or (not args.handles and args.file is None):
+        yield from _read_lines(sys.stdin)
+    elif args.file is not None:
+        with open(args.file, encoding="utf-8") as stream:
+            yield from _read_lines(stream)
+
+
+def _record(result: Result[Any]) -> dict[str, Any]:
+    # prevent circular import
+    from regrws.models import Error
+
+    record: dict[str, Any] = {
+        "input": result.item,
+        "ok": result.ok,
+        "elapsed": round(result.elapsed, 4),
+    }
+    if result.exception is not None:
+        record["exception"] = f"{type(result.exception).__name__}: {result.exception}"
+    elif isinstance(result.value, Error):
+        record["error"] = result.value.model_dump(mode="json")
+    elif result.value is not None:
+        record["result"] = result.value.model_dump(mode="json", exclude_none=True)
+    return record
+
+
+class _Progress:
+    """Periodically report progress on stderr."""
+
+    def __init__(self, summary: Summary, interval: float | None) -> None:
+        self.summary = summary
+        self.interval = interval
+        self._last = time.monotonic()
+
+    def tick(self) -> None:
+        if self.interval is None or time.monotonic() - self._last < self.interval:
+            return
+        self._last = time.monotonic()
+        stats = self.summary.as_dict()
+        print(
+            f"progress: {stats['count']} done, {stats['failed']} failed, "
+            f"{stats['throughput']}/s, p95 {stats['p95']}s",
+            file=sys.stderr,
+        )
+
+
+def _run(
+    args: argparse.Namespace,
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    output: Callable[[Result[Any]], None],
+) -> int:
+    summary = Summary()
+    progress = _Progress(summary, args.progress)
+    for result in iter_concurrently(func, items, args.concurrency):
+        summary.add(result)
+        output(result)
+        progress.tick()
+    print(
+        "summary: " + " ".join(f"{k}={v}" for k, v in summary.as_dict().items()),
+        file=sys.stderr,
+    )
+    return 0 if summary.failed == 0 else 1
+
+
+def _write_ndjson(stream: IO[str]) -> Callable[[Result[Any]], None]:
+    lock = threading.Lock()
+
+    def write(result: Result[Any]) -> None:
+        line = json.dumps(_record(result), separators=(",", ":"))
+        with lock:
+            stream.write(line + "\n")
+            stream.flush()
+
+    return write
+
+
+def _api(args: argparse.Namespace, journal: Journal | None = None) -> Api:
+    limiter = None
+    if args.adaptive:
+        limiter = AdaptiveLimiter(
+            initial_limit=min(4, args.concurrency), max_limit=args.concurrency
+        )
+    return Api(
+        base_url=args.base_url, api_key=args.api_key, journal=journal, limiter=limiter
+    )
+
+
+def cmd_get(args: argparse.Namespace) -> int:
+    manager = getattr(_api(args), args.kind)
+    return _run(args, manager.from_handle, _inputs(args), _write_ndjson(sys.stdout))
+
+
+def cmd_export(args: argparse.Namespace) -> int:
+    manager = getattr(_api(args), args.kind)
+    if args.format == "ndjson":
+        if args.output == "-":
+            return _run(
+                args, manager.from_handle, _inputs(args), _write_ndjson(sys.stdout)
+            )
+        with open(args.output, "w", encoding="utf-8") as stream:
+            return _run(args, manager.from_handle, _inputs(args), _write_ndjson(stream))
+
+    # prevent circular import
+    from regrws.models.export import arrow_schema, to_arrow
+
+    schema = arrow_schema(manager.model)
+    if args.format == "parquet":
+        import pyarrow.parquet  # pylint: disable=import-outside-toplevel
+
+        writer = pyarrow.parquet.ParquetWriter(args.output, schema)
+    else:
+        import pyarrow.ipc  # pylint: disable=import-outside-toplevel
+
+        # feather v2 files are Arrow IPC files
+        writer = pyarrow.ipc.new_file(args.output, schema)
+    batch: list[Any] = []
+
+    def flush() -> None:
+        if batch:
+            writer.write_table(to_arrow(batch, manager.model))
+            batch.clear()
+
+    def collect(result: Result[Any]) -> None:
+        if result.ok and result.value is not None:
+            batch.append(result.value)
+            if len(batch) >= args.batch_size:
+                flush()
+        else:
+            print(json.dumps(_record(result)), file=sys.stderr)
+
+    with writer:
+        status = _run(args, manager.from_handle, _inputs(args), collect)
+        flush()
+    return status
+
+
+def _reassignment_net(row: dict[str, str]) -> Any:
+    # prevent circular import
+    from regrws.models import Net
+    from regrws.models.net import NetBlock
+
+    network = ip_network(row["prefix"], strict=True)
+    return Net(
+        version=network.version,
+        net_name=row.get("net_name")
+        or f"NET-{str(network).replace('.', '-').replace(':', '-').replace('/', '-')}",
+        net_blocks=[
+            NetBlock(
+                type=row.get("type") or "S",  # type: ignore[arg-type]
+                start_address=network.network_address,
+                cidr_length=network.prefixlen,
+            )
+        ],
+        parent_net_handle=row["parent"],
+        customer_handle=row.get("customer_handle") or None,
+        org_handle=row.get("org_handle") or None,
+    )
+
+
+def _validate_reassignments(
+    args: argparse.Namespace, rows: Iterable[tuple[int, dict[str, str]]]
+) -> bool:
+    """Validate the nets of every ``(line, row)``, reporting invalid rows on stderr."""
+    # prevent circular import
+    from regrws.models.validation import PayloadValidator
+
+    validator = PayloadValidator(args.schema)
+
+    def validate(item: tuple[int, dict[str, str]]) -> list[str]:
+        return validator.validate(_reassignment_net(item[1]))
+
+    valid = True
+    for result in iter_concurrently(validate, rows, args.concurrency):
+        errors = result.value
+        if result.exception is not None:
+            errors = [f"{type(result.exception).__name__}: {result.exception}"]
+        if errors:
+            valid = False
+            line = result.item[0]
+            print(json.dumps({"line": line, "errors": errors}), file=sys.stderr)
+    return valid
+
+
+def cmd_reassign(args: argparse.Namespace) -> int:
+    """Reassign the prefixes listed in a CSV file.
+
+    The CSV must have ``parent`` and ``prefix`` columns, one of
+    ``customer_handle`` or ``org_handle``, and may have ``net_name`` and
+    ``type`` (defaults to ``S``, simple reassignment) columns. With
+    ``--validate`` (or ``--schema``), every net is validated before any
+    request is sent and nothing is sent if one is invalid.
+    """
+    # prevent circular import
+    from regrws.api.journal import Journal
+
+    with Journal(args.journal) if args.journal else contextlib.nullcontext() as journal:
+        api = _api(args, journal)
+        parents = functools.lru_cache(maxsize=1024)(api.net.from_handle)
+
+        def reassign(row: dict[str, str]) -> Any:
+            net = _reassignment_net(row)
+            if args.dry_run:
+                return net
+            parent = parents(row["parent"])
+            if not isinstance(parent, api.net.model):
+                return parent
+            return parent.reassign(net)
+
+        def rows() -> Iterator[tuple[int, dict[str, str]]]:
+            with open(args.csv, newline="", encoding="utf-8") as stream:
+                reader = csv.DictReader(stream)
+                # the line a row ends on, quoted fields may span lines
+                for row in reader:
+                    yield reader.line_num, row
+
+        # the file is read twice rather than held in memory
+        if (args.validate or args.schema) and not _validate_reassignments(args, rows()):
+            return 1
+        return _run(
+            args, reassign, (row for _, row in rows()), _write_ndjson(sys.stdout)
+        )
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="regrws", description="Bulk operations against ARIN's Reg-RWS."
+    )
+    parser.add_argument(
+        "--base-url", help="Reg-RWS base URL (default: ARIN production)"
+    )
+    parser.add_argument("--api-key", help="API key (default: $REGRWS_API_KEY)")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=constants.DEFAULT_MAX_WORKERS,
+        help="number of concurrent requests (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="adapt concurrency to observed latency and errors, up to --concurrency",
+    )
+    parser.add_argument(
+        "--progress",
+        type=float,
+        metavar="SECONDS",
+        help="report progress on stderr every SECONDS",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def handles(command: argparse.ArgumentParser) -> None:
+        command.add_argument("kind", choices=KINDS)
+        command.add_argument("handles", nargs="*", help="handles to retrieve")
+        command.add_argument(
+            "-f", "--file", help="read handles from FILE, one per line ('-' for stdin)"
+        )
+
+    get = commands.add_parser("get", help="retrieve objects by handle as NDJSON")
+    handles(get)
+    get.set_defaults(func=cmd_get)
+
+    export = commands.add_parser("export", help="write a snapshot of objects")
+    handles(export)
+    export.add_argument("-o", "--output", default="-", help="output file")
+    export.add_argument(
+        "--format",
+        choices=("ndjson", "parquet", "feather"),
+        default="ndjson",
+        help="snapshot format, parquet and feather require pyarrow",
+    )
+    export.add_argument(
+        "--batch-size",
+        type=int,
+        default=10000,
+        help="objects per parquet row group or feather record batch",
+    )
+    export.set_defaults(func=cmd_export)
+
+    reassign = commands.add_parser("reassign", help="reassign prefixes from a CSV")
+    reassign.add_argument("csv", help="CSV file (see cmd_reassign)")
+    reassign.add_argument("--journal", help="record calls in a write-ahead journal")
+    reassign.add_argument(
+        "--dry-run", action="store_true", help="print the nets without sending them"
+    )
+    reassign.add_argument(
+        "--validate",
+        action="store_true",
+        help="validate every net before sending any, stop if one is invalid",
+    )
+    reassign.add_argument(
+        "--schema", help="validate against this Reg-RWS XSD (requires lxml)"
+    )
+    reassign.set_defaults(func=cmd_reassign)
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if args.command == "export" and args.format != "ndjson" and args.output == "-":
+        parser.error(f"--output is required for {args.format} snapshots")
+    return args.func(args)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from regrws.models.customer import Customer
+from regrws.models.delegation import Delegation
 from regrws.models.error import Error
 from regrws.models.net import Net
 from regrws.models.org import Org
 from regrws.models.poc import Poc
 
-__all__ = ["Customer", "Org", "Poc", "Net", "Error"]
+__all__ = ["Customer", "Delegation", "Org", "Poc", "Net", "Error"]
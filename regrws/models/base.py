@@ -3,9 +3,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, ClassVar
 
 from pydantic import ConfigDict, PrivateAttr
+from pydantic_core import PydanticSerializationError
 from pydantic_xml import BaseXmlModel
 
 from regrws.api.manager import BaseManager
+from regrws.cache import LRUCache
 
 if TYPE_CHECKING:
     from regrws.api.core import Api
@@ -13,6 +15,10 @@ if TYPE_CHECKING:
 
 NSMAP = {"": "http://www.arin.net/regrws/core/v1"}
 
+PAYLOAD_CACHE_SIZE = 256
+
+_payloads: LRUCache[bytes] = LRUCache(PAYLOAD_CACHE_SIZE)
+
 
 class BaseModel(BaseXmlModel):
     """Base model class for all ARIN Reg-RWS resources.
@@ -52,6 +58,24 @@ class BaseModel(BaseXmlModel):
             return f"{self._api.base_url}{self._endpoint}/"
         return None  # pragma: no cover
 
+    def to_payload(self) -> bytes:
+        """Serialize this resource to the XML payload sent to Reg-RWS.
+
+        Payloads are memoized on the state of the model, so sending the same
+        unchanged instance again (retries, one Net reassigned under many
+        parents) skips XML serialization. Any mutation, including of nested
+        models and lists, changes the state and thus the payload.
+        """
+        try:
+            key = (self.__class__, self.model_dump_json())
+        except PydanticSerializationError:  # pragma: no cover
+            return self.to_xml(encoding="UTF-8", skip_empty=True)  # type: ignore
+        payload = _payloads.get(key)
+        if payload is None:
+            payload = self.to_xml(encoding="UTF-8", skip_empty=True)
+            _payloads.put(key, payload)  # type: ignore
+        return payload  # type: ignore
+
     def save(self):
         """Save changes to this resource.
 
@@ -0,0 +1,439 @@
+"""Compact record representations
+
+Pydantic model instances carry a ``__dict__``, a fields set and validator
+state per object, which adds up quickly when holding hundreds of thousands
+of Nets or POCs in memory. The records in this module keep the same data in
+``__slots__`` with integer addresses and interned strings, and convert back
+to full models on demand with :meth:`to_model`.
+"""
+
+from __future__ import annotations
+
+import sys
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from ipaddress import IPv4Address, IPv6Address
+from typing import Any, ClassVar
+
+from regrws.models.nested import (
+    IPVersionEnum,
+    Iso31661,
+    MultiLineElement,
+    OriginAS,
+    Phone,
+    PhoneType,
+)
+from regrws.models.net import Net, NetBlock
+from regrws.models.poc import Poc, PocLinkRef
+
+POC_FUNCTION_DESCRIPTIONS = {
+    "AB": "Abuse",
+    "AD": "Admin",
+    "N": "NOC",
+    "R": "Routing",
+    "T": "Tech",
+}
+
+# Countries are shared by most records, a single tuple per distinct value is kept.
+_COUNTRIES: dict[tuple, tuple] = {}
+
+lines_type = tuple[tuple[int, str | None], ...]
+
+
+def _intern(value: str | None) -> str | None:
+    return sys.intern(value) if value is not None else None
+
+
+def _intern_country(iso: Iso31661) -> tuple:
+    key = (iso.name, iso.code2, iso.code3, iso.e164)
+    return _COUNTRIES.setdefault(key, key)
+
+
+def _pack_lines(lines: list[MultiLineElement] | None) -> lines_type | None:
+    if lines is None:
+        return None
+    return tuple((line.number, line.line) for line in lines)
+
+
+def _unpack_lines(lines: lines_type | None) -> list[MultiLineElement] | None:
+    if lines is None:
+        return None
+    return [MultiLineElement(number=number, line=line) for number, line in lines]
+
+
+def _ip(value: int, version: int) -> IPv4Address | IPv6Address:
+    return IPv4Address(value) if version == 4 else IPv6Address(value)
+
+
+class CompactRecord(ABC):
+    """Base class for slotted records, providing equality and a readable repr.
+
+    Subclasses list their slots in constructor order, which the repr, equality
+    and pickled state follow.
+    """
+
+    __slots__ = ()
+
+    model: ClassVar[type]
+
+    def _astuple(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._astuple() == other._astuple()  # type: ignore[attr-defined]
+
+    def __hash__(self) -> int:
+        return hash(self._astuple())
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{self.__class__.__name__}({values})"
+
+    def __getstate__(self) -> tuple:
+        return self._astuple()
+
+    def __setstate__(self, state: tuple) -> None:
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+    @classmethod
+    @abstractmethod
+    def from_model(cls, instance: Any) -> CompactRecord:
+        """Build the record of a model instance."""
+
+    @abstractmethod
+    def to_model(self) -> Any:
+        """Convert the record back to a model instance."""
+
+
+class CompactNetBlock(CompactRecord):
+    """Compact form of :class:`~regrws.models.net.NetBlock`.
+
+    Addresses are stored as integers, ``version`` tells them apart.
+    """
+
+    __slots__ = (  # noqa: RUF023
+        "version",
+        "type",
+        "start",
+        "end",
+        "cidr_length",
+        "description",
+    )
+
+    model = NetBlock
+
+    def __init__(
+        self,
+        version: int,
+        type: str,
+        start: int,
+        end: int | None = None,
+        cidr_length: int | None = None,
+        description: str | None = None,
+    ) -> None:
+        self.version = version
+        self.type = type
+        self.start = start
+        self.end = end
+        self.cidr_length = cidr_length
+        self.description = description
+
+    @classmethod
+    def from_model(cls, instance: NetBlock) -> CompactNetBlock:
+        start = instance.start_address
+        end = instance.end_address
+        return cls(
+            version=start.version,
+            type=sys.intern(instance.type),
+            start=int(start),
+            end=int(end) if end is not None else None,
+            cidr_length=instance.cidr_length,
+            description=_intern(instance.description),
+        )
+
+    def to_model(self) -> NetBlock:
+        return NetBlock(
+            type=self.type,  # type: ignore[arg-type]
+            description=self.description,
+            start_address=_ip(self.start, self.version),
+            end_address=_ip(self.end, self.version) if self.end is not None else None,
+            cidr_length=self.cidr_length,
+        )
+
+
+class CompactPocLinkRef(CompactRecord):
+    """Compact form of :class:`~regrws.models.poc.PocLinkRef`.
+
+    The description is derived from the function code and is not stored.
+    """
+
+    __slots__ = ("function", "handle")
+
+    model = PocLinkRef
+
+    def __init__(self, function: str, handle: str) -> None:
+        self.function = function
+        self.handle = handle
+
+    @property
+    def description(self) -> str:
+        return POC_FUNCTION_DESCRIPTIONS[self.function]
+
+    @classmethod
+    def from_model(cls, instance: PocLinkRef) -> CompactPocLinkRef:
+        return cls(
+            function=sys.intern(instance.function), handle=sys.intern(instance.handle)
+        )
+
+    def to_model(self) -> PocLinkRef:
+        return PocLinkRef(
+            description=self.description,  # type: ignore[arg-type]
+            function=self.function,  # type: ignore[arg-type]
+            handle=self.handle,
+        )
+
+
+class CompactNet(CompactRecord):
+    """Compact form of :class:`~regrws.models.net.Net`."""
+
+    __slots__ = (  # noqa: RUF023
+        "version",
+        "handle",
+        "net_name",
+        "org_handle",
+        "customer_handle",
+        "parent_net_handle",
+        "registration_date",
+        "net_blocks",
+        "origin_ases",
+        "poc_links",
+        "comment",
+    )
+
+    model = Net
+
+    def __init__(
+        self,
+        version: int,
+        handle: str | None = None,
+        net_name: str | None = None,
+        org_handle: str | None = None,
+        customer_handle: str | None = None,
+        parent_net_handle: str | None = None,
+        registration_date: str | None = None,
+        net_blocks: tuple[CompactNetBlock, ...] | None = None,
+        origin_ases: tuple[str, ...] | None = None,
+        poc_links: tuple[CompactPocLinkRef, ...] | None = None,
+        comment: lines_type | None = None,
+    ) -> None:
+        self.version = version
+        self.handle = handle
+        self.net_name = net_name
+        self.org_handle = org_handle
+        self.customer_handle = customer_handle
+        self.parent_net_handle = parent_net_handle
+        self.registration_date = registration_date
+        self.net_blocks = net_blocks
+        self.origin_ases = origin_ases
+        self.poc_links = poc_links
+        self.comment = comment
+
+    @classmethod
+    def from_model(cls, instance: Net) -> CompactNet:
+        net_blocks = origin_ases = poc_links = None
+        if instance.net_blocks is not None:
+            net_blocks = tuple(
+                CompactNetBlock.from_model(block) for block in instance.net_blocks
+            )
+        if instance.origin_ases is not None:
+            origin_ases = tuple(sys.intern(o.asn) for o in instance.origin_ases)
+        if instance.poc_links is not None:
+            poc_links = tuple(
+                CompactPocLinkRef.from_model(link) for link in instance.poc_links
+            )
+        return cls(
+            version=int(instance.version),
+            handle=_intern(instance.handle),
+            net_name=instance.net_name,
+            org_handle=_intern(instance.org_handle),
+            customer_handle=_intern(instance.customer_handle),
+            parent_net_handle=_intern(instance.parent_net_handle),
+            registration_date=_intern(instance.registration_date),
+            net_blocks=net_blocks,
+            origin_ases=origin_ases,
+            poc_links=poc_links,
+            comment=_pack_lines(instance.comment),
+        )
+
+    def to_model(self) -> Net:
+        return Net(
+            version=IPVersionEnum(self.version),
+            comment=_unpack_lines(self.comment),
+            org_handle=self.org_handle,
+            customer_handle=self.customer_handle,
+            handle=self.handle,
+            registration_date=self.registration_date,
+            net_name=self.net_name,
+            net_blocks=(
+                [block.to_model() for block in self.net_blocks]
+                if self.net_blocks is not None
+                else None
+            ),
+            parent_net_handle=self.parent_net_handle,
+            origin_ases=(
+                [OriginAS(asn=asn) for asn in self.origin_ases]
+                if self.origin_ases is not None
+                else None
+            ),
+            poc_links=(
+                [link.to_model() for link in self.poc_links]
+                if self.poc_links is not None
+                else None
+            ),
+        )
+
+
+class CompactPoc(CompactRecord):
+    """Compact form of :class:`~regrws.models.poc.Poc`.
+
+    ``iso3166_1`` is a ``(name, code2, code3, e164)`` tuple shared between every
+    record of the same country, phones are ``(code, description, number,
+    extension)`` tuples.
+    """
+
+    __slots__ = (  # noqa: RUF023
+        "handle",
+        "contact_type",
+        "company_name",
+        "first_name",
+        "middle_name",
+        "last_name",
+        "iso3166_1",
+        "street_address",
+        "city",
+        "iso3166_2",
+        "postal_code",
+        "emails",
+        "phones",
+        "comment",
+        "registration_date",
+    )
+
+    model = Poc
+
+    def __init__(
+        self,
+        contact_type: str,
+        iso3166_1: tuple,
+        street_address: lines_type,
+        city: str,
+        emails: tuple[str, ...] = (),
+        phones: tuple[tuple, ...] = (),
+        handle: str | None = None,
+        company_name: str | None = None,
+        first_name: str | None = None,
+        middle_name: str | None = None,
+        last_name: str | None = None,
+        iso3166_2: str | None = None,
+        postal_code: str | None = None,
+        comment: lines_type | None = None,
+        registration_date: str | None = None,
+    ) -> None:
+        self.handle = handle
+        self.contact_type = contact_type
+        self.company_name = company_name
+        self.first_name = first_name
+        self.middle_name = middle_name
+        self.last_name = last_name
+        self.iso3166_1 = iso3166_1
+        self.street_address = street_address
+        self.city = city
+        self.iso3166_2 = iso3166_2
+        self.postal_code = postal_code
+        self.emails = emails
+        self.phones = phones
+        self.comment = comment
+        self.registration_date = registration_date
+
+    @classmethod
+    def from_model(cls, instance: Poc) -> CompactPoc:
+        return cls(
+            handle=_intern(instance.handle),
+            contact_type=sys.intern(instance.contact_type),
+            company_name=_intern(instance.company_name),
+            first_name=instance.first_name,
+            middle_name=instance.middle_name,
+            last_name=instance.last_name,
+            iso3166_1=_intern_country(instance.iso3166_1),
+            street_address=_pack_lines(instance.street_address),  # type: ignore[arg-type]
+            city=sys.intern(instance.city),
+            iso3166_2=_intern(instance.iso3166_2),
+            postal_code=_intern(instance.postal_code),
+            emails=tuple(instance.emails),
+            phones=tuple(
+                (
+                    sys.intern(phone.type.code),
+                    sys.intern(phone.type.description),
+                    phone.number,
+                    phone.extension,
+                )
+                for phone in instance.phones
+            ),
+            comment=_pack_lines(instance.comment),
+            registration_date=_intern(instance.registration_date),
+        )
+
+    def to_model(self) -> Poc:
+        name, code2, code3, e164 = self.iso3166_1
+        return Poc(
+            iso3166_1=Iso31661(name=name, code2=code2, code3=code3, e164=e164),
+            street_address=_unpack_lines(self.street_address),  # type: ignore[arg-type]
+            city=self.city,
+            iso3166_2=self.iso3166_2,
+            postal_code=self.postal_code,
+            comment=_unpack_lines(self.comment),
+            handle=self.handle,
+            registration_date=self.registration_date,
+            contact_type=self.contact_type,  # type: ignore[arg-type]
+            company_name=self.company_name,
+            first_name=self.first_name,
+            middle_name=self.middle_name,
+            last_name=self.last_name,
+            emails=list(self.emails),
+            phones=[
+                Phone(
+                    type=PhoneType(code=code, description=description),  # type: ignore[arg-type]
+                    number=number,
+                    extension=extension,
+                )
+                for code, description, number, extension in self.phones
+            ],
+        )
+
+
+COMPACT_RECORDS: dict[type, type[CompactRecord]] = {
+    record.model: record
+    for record in (CompactNet, CompactNetBlock, CompactPocLinkRef, CompactPoc)
+}
+
+
+def compact(instance: Any) -> CompactRecord:
+    """Convert a model instance to its compact record.
+
+    Raises:
+        TypeError: If no compact record exists for the instance's model.
+    """
+    try:
+        record = COMPACT_RECORDS[type(instance)]
+    except KeyError:
+        raise TypeError(f"No compact record for {type(instance).__name__}")
+    return record.from_model(instance)
+
+
+def compact_all(instances: Iterable[Any]) -> Iterator[CompactRecord]:
+    """Lazily convert many model instances to compact records."""
+    for instance in instances:
+        yield compact(instance)
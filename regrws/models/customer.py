@@ -32,7 +32,8 @@ class CustomerManager(BaseManager):
             return self._do(
                 "post",
                 url,
-                instance.to_xml(encoding="UTF-8", skip_empty=True),  # type: ignore
+                instance,
+                operation="create_for_net",
             )
         return None  # pragma: no cover
 
@@ -0,0 +1,138 @@
+"""Delegation Model"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import ClassVar
+
+from pydantic import model_validator
+from pydantic_xml import attr, element, wrapped
+
+from regrws.api import constants
+from regrws.api.bulk import Result, iter_updates
+from regrws.api.manager import BaseManager
+from regrws.models.base import NSMAP, BaseModel
+from regrws.models.nested import (
+    ALGORITHM_NAMES_MAP,
+    DIGEST_TYPE_NAMES_MAP,
+    AlgorithmEnum,
+    DigestTypeEnum,
+)
+
+
+def _nameserver(name: str) -> str:
+    return name.strip().rstrip(".").upper()
+
+
+class DelegationManager(BaseManager):
+    """Custom Manager for Delegation Payloads"""
+
+    def create(self, *args, **kwargs):
+        raise NotImplementedError  # pragma: no cover
+
+    def from_handle(self, handle: str):
+        """Retrieve a delegation by name, such as ``0.76.in-addr.arpa.``.
+
+        Unlike handles, names are sent as is.
+        """
+        if self.endpoint_url:
+            url = self.endpoint_url + f"/{handle}"
+            return self._do("get", url, operation="from_handle", handle=handle)
+
+    def iter_update_nameservers(
+        self,
+        names: Iterable[str],
+        nameservers: Iterable[str],
+        max_workers: int = constants.DEFAULT_MAX_WORKERS,
+    ) -> Iterator[Result[str]]:
+        """Set the nameservers of many delegations concurrently.
+
+        Delegations already served by ``nameservers`` (regardless of case,
+        order and trailing dots) are not saved again.
+
+        Args:
+            names: Names of the delegations to update, read lazily.
+            nameservers: Nameservers every delegation must end up with.
+            max_workers: Number of worker threads.
+
+        Yields:
+            One result per name, in input order; ``changed`` tells which
+            delegations were saved.
+        """
+        nameservers = list(nameservers)
+        wanted = {_nameserver(name) for name in nameservers}
+
+        def transform(delegation: Delegation) -> None:
+            if delegation.nameserver_set != wanted:
+                delegation.nameservers = nameservers
+
+        return iter_updates(self.from_handle, transform, names, max_workers)
+
+    def update_nameservers(
+        self,
+        names: Iterable[str],
+        nameservers: Iterable[str],
+        max_workers: int = constants.DEFAULT_MAX_WORKERS,
+    ) -> list[Result[str]]:
+        """Like :meth:`iter_update_nameservers`, returning all the results at
+        the end."""
+        return list(self.iter_update_nameservers(names, nameservers, max_workers))
+
+
+class Algorithm(BaseModel, tag="algorithm", nsmap=NSMAP, search_mode="unordered"):
+    name: str | None = attr(default=None)
+    value: AlgorithmEnum
+
+    @model_validator(mode="after")
+    def default_name(self):
+        if self.name is None:
+            self.name = ALGORITHM_NAMES_MAP[self.value]
+        return self
+
+
+class DigestType(BaseModel, tag="digestType", nsmap=NSMAP, search_mode="unordered"):
+    name: str | None = attr(default=None)
+    value: DigestTypeEnum
+
+    @model_validator(mode="after")
+    def default_name(self):
+        if self.name is None:
+            self.name = DIGEST_TYPE_NAMES_MAP[self.value]
+        return self
+
+
+class DelegationKey(
+    BaseModel, tag="delegationKey", nsmap=NSMAP, search_mode="unordered"
+):
+    """
+    https://www.arin.net/resources/manage/regrws/payloads/#delegation-key-payload
+    """
+
+    algorithm: Algorithm
+    digest: str = element()
+    ttl: int | None = element(default=None)
+    digest_type: DigestType
+    key_tag: int = element(tag="keyTag")
+
+
+class Delegation(BaseModel, tag="delegation", nsmap=NSMAP, search_mode="unordered"):
+    """
+    https://www.arin.net/resources/manage/regrws/payloads/#delegation-payload
+    """
+
+    name: str = element()
+    delegation_keys: list[DelegationKey] | None = wrapped(
+        "delegationKeys", element(tag="delegationKey"), default=None
+    )
+    nameservers: list[str] | None = wrapped(
+        "nameservers", element(tag="nameserver"), default=None
+    )
+
+    _endpoint: ClassVar[str] = "/delegation"
+    _handle: ClassVar[str] = "name"
+    _manager_class: ClassVar[type[BaseManager]] = DelegationManager
+
+    @property
+    def nameserver_set(self) -> set[str]:
+        """Nameservers, uppercased and without trailing dots, for comparisons."""
+        return {_nameserver(name) for name in self.nameservers or ()}
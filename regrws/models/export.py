@@ -0,0 +1,285 @@
+"""Columnar export of model collections
+
+Flattens lists of :class:`~regrws.models.net.Net`,
+:class:`~regrws.models.net.NetBlock`, :class:`~regrws.models.poc.Poc` and
+:class:`~regrws.models.customer.Customer` into typed columns, ready to be
+handed to `pyarrow <https://arrow.apache.org/docs/python/>`_ or
+`pandas <https://pandas.pydata.org/>`_ (neither is a dependency of pyregrws).
+
+IP addresses are stored as two unsigned 64-bit integers, ``<name>_hi`` and
+``<name>_lo``, so IPv4 and IPv6 share a schema: the address is
+``(hi << 64) | lo`` and ``hi`` is always ``0`` for IPv4.
+"""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
+
+from regrws.models.customer import Customer
+from regrws.models.net import Net, NetBlock
+from regrws.models.poc import Poc
+
+if TYPE_CHECKING:
+    import pandas
+    import pyarrow
+
+_LOW_MASK = (1 << 64) - 1
+
+
+@dataclass(frozen=True)
+class Column:
+    """A flattened column.
+
+    Attributes:
+        name: The column name.
+        type: Arrow type alias (``string``, ``bool``, ``uint8``, ``uint64``,
+            ``int64``), ``list`` for a list of strings or ``struct`` for a list
+            of nested records described by ``fields``.
+        get: Extracts the value from a model instance.
+        fields: Struct fields when the column holds a list of nested records.
+    """
+
+    name: str
+    type: str
+    get: Callable[[Any], Any]
+    fields: tuple[Column, ...] = ()
+
+    def extract(self, instance: Any) -> Any:
+        value = self.get(instance)
+        if self.fields and value is not None:
+            return [
+                {field.name: field.get(item) for field in self.fields} for item in value
+            ]
+        return value
+
+
+def _lines(name: str) -> Column:
+    def get(instance: Any) -> list[str | None] | None:
+        lines = getattr(instance, name)
+        if lines is None:
+            return None
+        return [line.line for line in lines]
+
+    return Column(name, "list", get)
+
+
+def _address(name: str) -> tuple[Column, Column]:
+    def hi(instance: Any) -> int | None:
+        address = getattr(instance, name)
+        return int(address) >> 64 if address is not None else None
+
+    def lo(instance: Any) -> int | None:
+        address = getattr(instance, name)
+        return int(address) & _LOW_MASK if address is not None else None
+
+    return Column(f"{name}_hi", "uint64", hi), Column(f"{name}_lo", "uint64", lo)
+
+
+def _string(name: str) -> Column:
+    return Column(name, "string", attrgetter(name))
+
+
+def _country() -> tuple[Column, ...]:
+    return (
+        Column("iso3166_1_name", "string", attrgetter("iso3166_1.name")),
+        Column("iso3166_1_code2", "string", attrgetter("iso3166_1.code2")),
+        Column("iso3166_1_code3", "string", attrgetter("iso3166_1.code3")),
+        Column("iso3166_1_e164", "int64", attrgetter("iso3166_1.e164")),
+    )
+
+
+NET_BLOCK_COLUMNS: tuple[Column, ...] = (
+    _string("type"),
+    _string("description"),
+    *_address("start_address"),
+    *_address("end_address"),
+    Column("cidr_length", "uint8", attrgetter("cidr_length")),
+)
+
+POC_LINK_COLUMNS: tuple[Column, ...] = (
+    _string("function"),
+    _string("description"),
+    _string("handle"),
+)
+
+PHONE_COLUMNS: tuple[Column, ...] = (
+    Column("code", "string", attrgetter("type.code")),
+    Column("description", "string", attrgetter("type.description")),
+    _string("number"),
+    _string("extension"),
+)
+
+NET_COLUMNS: tuple[Column, ...] = (
+    _string("handle"),
+    Column("version", "uint8", lambda net: int(net.version)),
+    _string("net_name"),
+    _string("org_handle"),
+    _string("customer_handle"),
+    _string("parent_net_handle"),
+    _string("registration_date"),
+    Column("net_blocks", "struct", attrgetter("net_blocks"), NET_BLOCK_COLUMNS),
+    Column(
+        "origin_ases",
+        "list",
+        lambda net: (
+            [o.asn for o in net.origin_ases] if net.origin_ases is not None else None
+        ),
+    ),
+    Column("poc_links", "struct", attrgetter("poc_links"), POC_LINK_COLUMNS),
+    _lines("comment"),
+)
+
+POC_COLUMNS: tuple[Column, ...] = (
+    _string("handle"),
+    _string("contact_type"),
+    _string("company_name"),
+    _string("first_name"),
+    _string("middle_name"),
+    _string("last_name"),
+    _lines("street_address"),
+    _string("city"),
+    _string("iso3166_2"),
+    _string("postal_code"),
+    *_country(),
+    Column("emails", "list", attrgetter("emails")),
+    Column("phones", "struct", attrgetter("phones"), PHONE_COLUMNS),
+    _lines("comment"),
+    _string("registration_date"),
+)
+
+CUSTOMER_COLUMNS: tuple[Column, ...] = (
+    _string("handle"),
+    _string("customer_name"),
+    _lines("street_address"),
+    _string("city"),
+    _string("iso3166_2"),
+    _string("postal_code"),
+    *_country(),
+    _string("parent_org_handle"),
+    Column("private_customer", "bool", attrgetter("private_customer")),
+    _lines("comment"),
+    _string("registration_date"),
+)
+
+COLUMNS: dict[type, tuple[Column, ...]] = {
+    Net: NET_COLUMNS,
+    NetBlock: NET_BLOCK_COLUMNS,
+    Poc: POC_COLUMNS,
+    Customer: CUSTOMER_COLUMNS,
+}
+
+
+def _columns_for(model: type) -> tuple[Column, ...]:
+    try:
+        return COLUMNS[model]
+    except KeyError:
+        raise TypeError(f"Columnar export is not supported for {model.__name__}")
+
+
+def _flatten(
+    instances: Iterable[Any], model: type | None
+) -> tuple[type, dict[str, list[Any]]]:
+    iterator = iter(instances)
+    first = next(iterator, None)
+    if model is None:
+        if first is None:
+            raise TypeError("`model` is required to export an empty collection")
+        model = type(first)
+    columns = _columns_for(model)
+    data: dict[str, list[Any]] = {column.name: [] for column in columns}
+    if first is None:
+        return model, data
+
+    appenders = [(column.extract, data[column.name].append) for column in columns]
+    for instance in itertools.chain((first,), iterator):
+        if type(instance) is not model:
+            raise TypeError(
+                f"Expected {model.__name__} instances, got {type(instance).__name__}"
+            )
+        for extract, append in appenders:
+            append(extract(instance))
+    return model, data
+
+
+def to_columns(
+    instances: Iterable[Any], model: type | None = None
+) -> dict[str, list[Any]]:
+    """Flatten model instances into a mapping of column name to values.
+
+    Args:
+        instances: Instances of a single model type.
+        model: The model type, required when ``instances`` may be empty.
+
+    Raises:
+        TypeError: If the model is unsupported or the instances are mixed.
+    """
+    return _flatten(instances, model)[1]
+
+
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow  # pylint: disable=import-outside-toplevel
+    except ImportError as exc:  # pragma: no cover
+        raise ImportError(
+            "pyarrow is required for Arrow export: pip install pyarrow"
+        ) from exc
+    return pyarrow
+
+
+def _arrow_type(pa: Any, column: Column) -> Any:
+    if column.fields:
+        return pa.list_(
+            pa.struct(
+                [
+                    pa.field(field.name, _arrow_type(pa, field))
+                    for field in column.fields
+                ]
+            )
+        )
+    if column.type == "list":
+        return pa.list_(pa.string())
+    return pa.type_for_alias(column.type)
+
+
+def arrow_schema(model: type) -> pyarrow.Schema:
+    """Return the Arrow schema used to export ``model`` instances."""
+    pa = _import_pyarrow()
+    return pa.schema(
+        [
+            pa.field(column.name, _arrow_type(pa, column))
+            for column in _columns_for(model)
+        ]
+    )
+
+
+def to_arrow(instances: Iterable[Any], model: type | None = None) -> pyarrow.Table:
+    """Export model instances as a :class:`pyarrow.Table`.
+
+    Nested lists (``net_blocks``, ``poc_links``, ``phones``) become
+    ``list<struct>`` columns, multi-line elements and ``origin_ases`` become
+    ``list<string>`` columns.
+    """
+    pa = _import_pyarrow()
+    model, data = _flatten(instances, model)
+    return pa.Table.from_pydict(data, schema=arrow_schema(model))
+
+
+def to_dataframe(
+    instances: Iterable[Any], model: type | None = None
+) -> pandas.DataFrame:
+    """Export model instances as a :class:`pandas.DataFrame` backed by Arrow types.
+
+    Integer columns keep their width and nullability instead of being cast to
+    ``float64`` when values are missing.
+    """
+    try:
+        import pandas  # pylint: disable=import-outside-toplevel
+    except ImportError as exc:  # pragma: no cover
+        raise ImportError(
+            "pandas is required for DataFrame export: pip install pandas pyarrow"
+        ) from exc
+    return to_arrow(instances, model).to_pandas(types_mapper=pandas.ArrowDtype)
@@ -26,6 +26,19 @@ class AlgorithmEnum(IntEnum):
     ECDSA384 = 14
 
 
+DIGEST_TYPE_NAMES_MAP = {
+    1: "SHA-1",
+    2: "SHA-256",
+    4: "SHA-384",
+}
+
+
+class DigestTypeEnum(IntEnum):
+    SHA1 = 1
+    SHA256 = 2
+    SHA384 = 4
+
+
 class IPVersionEnum(IntEnum):
     IPV4 = 4
     IPV6 = 6
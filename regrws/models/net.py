@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, ClassVar, List, Literal, Optional
 
+import requests
 from pydantic import model_validator
 from pydantic_xml import element, wrapped
 
+from regrws.api.deadline import DeadlineExceeded
 from regrws.api.manager import BaseManager
 
 from regrws.models.base import NSMAP, BaseModel
@@ -18,18 +21,43 @@ if TYPE_CHECKING:
     from regrws.models.tickets import TicketRequest
 
 
+def _maybe_sent(exc: BaseException | None) -> bool:
+    """Whether a request that failed with ``exc`` may have reached ARIN."""
+    if isinstance(exc, DeadlineExceeded):
+        # raised before sending, unless the request timed out in flight
+        exc = exc.__cause__
+    return isinstance(
+        exc, (requests.ConnectionError, requests.Timeout)
+    ) and not isinstance(exc, requests.ConnectTimeout)
+
+
 class NetManager(BaseManager):
     """Custom Manager for Net Payloads"""
 
     def create(self, *args, **kwargs):
         raise NotImplementedError  # pragma: no cover
 
+    @contextmanager
+    def _invalidating(self, net: Net | bytes, registered: bool = False):
+        """Drop the entries of the net cache that changing ``net`` may affect."""
+        try:
+            yield
+        finally:
+            cache = self.api.net_cache
+            if cache is not None and isinstance(net, Net):
+                cache.invalidate(net, registered=registered)
+
+    def save(self, instance: BaseModel):
+        with self._invalidating(instance):  # type: ignore
+            return super().save(instance)
+
     def delete(self, instance: type[BaseModel], return_type=None):
         """This call will generate an automatically-processed ticketed request to delete the NET"""
         # Avoid circular import
         from regrws.models.tickets import TicketRequest
 
-        return super().delete(instance, TicketRequest)
+        with self._invalidating(instance):  # type: ignore
+            return super().delete(instance, TicketRequest)
 
     def remove(self, instance: type[Net]) -> TicketRequest | None:
         """This call will remove the network from the ARIN database. It is only applicable for reallocations or reassignments.
@@ -40,45 +68,67 @@ class NetManager(BaseManager):
         url = instance.absolute_url
         if url:
             url = str(url) + "/remove"
-            return self._do(
-                "put",
-                url,
-                data=instance.to_xml(encoding="UTF-8", skip_empty=True),  # type: ignore
-                return_type=TicketRequest,
-            )
-        return None  # pragma: no cover
-
-    def reassign(self, instance: type[Net], net: type[Net]) -> TicketRequest | None:
-        """This call performs a reassignment from the NET instance using the recipient information from the object."""
-        # Avoid circular import
-        from regrws.models.tickets import TicketRequest
-
-        url = instance.absolute_url
-        if url:
-            url = str(url) + "/reassign"
-            return self._do(
-                "put",
-                url,
-                data=net.to_xml(encoding="UTF-8", skip_empty=True),  # type: ignore
-                return_type=TicketRequest,
-            )
+            with self._invalidating(instance):  # type: ignore
+                return self._do(
+                    "put",
+                    url,
+                    data=instance,
+                    return_type=TicketRequest,
+                    operation="remove",
+                )
         return None  # pragma: no cover
 
-    def reallocate(self, instance: type[Net], net: type[Net]) -> TicketRequest | None:
-        """This call performs a reallocation from the NET instance using the recipient information from the object."""
+    def reassign(
+        self, instance: type[Net], net: type[Net] | bytes
+    ) -> TicketRequest | None:
+        """This call performs a reassignment from the NET instance using the recipient information from the object.
+        `net` may also be a payload rendered by a :class:`~regrws.models.template.PayloadTemplate`."""
+        return self._subdivide("reassign", instance, net)  # type: ignore
+
+    def reallocate(
+        self, instance: type[Net], net: type[Net] | bytes
+    ) -> TicketRequest | None:
+        """This call performs a reallocation from the NET instance using the recipient information from the object.
+        `net` may also be a payload rendered by a :class:`~regrws.models.template.PayloadTemplate`."""
+        return self._subdivide("reallocate", instance, net)  # type: ignore
+
+    def _subdivide(
+        self, operation: str, instance: Net, net: Net | bytes
+    ) -> TicketRequest | None:
         # Avoid circular import
+        from regrws.models.error import Error
         from regrws.models.tickets import TicketRequest
 
         url = instance.absolute_url
-        if url:
-            url = str(url) + "/reallocate"
-            return self._do(
-                "put",
-                url,
-                data=net.to_xml(encoding="UTF-8", skip_empty=True),  # type: ignore
-                return_type=TicketRequest,
-            )
-        return None  # pragma: no cover
+        if not url:
+            return None  # pragma: no cover
+        preflight = self.api.preflight
+        child = None
+        if preflight is not None:
+            child = net if isinstance(net, Net) else Net.from_xml(net)
+            preflight.reserve(instance, child)
+        try:
+            # the range of a rendered payload is unknown, drop the parent's entries
+            with self._invalidating(
+                net if isinstance(net, Net) else instance,
+                registered=isinstance(net, Net),
+            ):
+                result = self._do(
+                    "put",
+                    f"{url}/{operation}",
+                    data=net,
+                    return_type=TicketRequest,
+                    operation=operation,
+                )
+        except Exception as exc:
+            # after a timeout or a connection error in flight, ARIN may have
+            # applied the request anyway: keep the range reserved
+            if child is not None and not _maybe_sent(exc):
+                preflight.release(instance, child)  # type: ignore
+            raise
+        if child is not None and isinstance(result, Error):
+            preflight.release(instance, child)  # type: ignore
+        return result
 
     def find_parent(
         self,
@@ -87,8 +137,7 @@ class NetManager(BaseManager):
     ) -> Net | None:
         """This call finds the parent of the network represented by the start and end IP range and returns a NET payload containing the details of the parent NET."""
         if self.model._endpoint:
-            url = f"{self.api.base_url}{self.model._endpoint}/parentNet/{start_address}/{end_address}"
-            return self._do("get", url)  # type: ignore
+            return self._find("find_parent", "parentNet", start_address, end_address)
         return None  # pragma: no cover
 
     def find_net(
@@ -99,10 +148,28 @@ class NetManager(BaseManager):
         """This call finds the network details related to the start and end IP range.
         If multiple networks exist for the same IP range, then the most specific network is returned."""
         if self.model._endpoint:
-            url = f"{self.api.base_url}{self.model._endpoint}/mostSpecificNet/{start_address}/{end_address}"
-            return self._do("get", url)  # type: ignore
+            return self._find("find_net", "mostSpecificNet", start_address, end_address)
         return None  # pragma: no cover
 
+    def _find(
+        self,
+        operation: str,
+        path: str,
+        start_address: ZeroPaddedIPvAnyAddress,
+        end_address: ZeroPaddedIPvAnyAddress,
+    ) -> Net | None:
+        cache = self.api.net_cache
+        if cache is not None:
+            net = cache.get(operation, start_address, end_address)
+            if net is not None:
+                net.manager = self
+                return net
+        url = f"{self.api.base_url}{self.model._endpoint}/{path}/{start_address}/{end_address}"
+        net = self._do("get", url, operation=operation)
+        if cache is not None and isinstance(net, Net):
+            cache.put(operation, start_address, end_address, net)
+        return net  # type: ignore
+
 
 class NetBlock(BaseModel, tag="netBlock", nsmap=NSMAP, search_mode="unordered"):
     type: Literal[
@@ -192,13 +259,13 @@ class Net(BaseModel, tag="net", nsmap=NSMAP, search_mode="unordered"):
             return None  # pragma: no cover
         return self._manager.remove(self)
 
-    def reassign(self, net: type[Net]) -> TicketRequest | None:
+    def reassign(self, net: type[Net] | bytes) -> TicketRequest | None:
         """Reassign the child Net to a different Org or Customer"""
         if self._manager is None:
             return None  # pragma: no cover
         return self._manager.reassign(self, net)
 
-    def reallocate(self, net: type[Net]) -> TicketRequest | None:
+    def reallocate(self, net: type[Net] | bytes) -> TicketRequest | None:
         """Reallocate the child Net to a different Org or Customer"""
         if self._manager is None:
             return None  # pragma: no cover
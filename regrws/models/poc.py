@@ -1,11 +1,68 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
 from typing import ClassVar, List, Literal, Optional
 
 from pydantic import model_validator
 from pydantic_xml import attr, element, wrapped
 
+from regrws.api import constants
+from regrws.api.bulk import Result, iter_updates
+from regrws.api.manager import BaseManager
 from regrws.models.base import NSMAP, BaseModel
 from regrws.models.nested import Iso31661, MultiLineElement, Phone
 from regrws.models.types import iso3166_2_type
+from regrws.models.validation import PayloadValidator
+
+
+class PocManager(BaseManager):
+    """Custom Manager for POC Payloads"""
+
+    def iter_bulk_update(
+        self,
+        handles: Iterable[str],
+        transform: Callable[[Poc], Poc | None],
+        max_workers: int = constants.DEFAULT_MAX_WORKERS,
+        validator: PayloadValidator | None = None,
+    ) -> Iterator[Result[str]]:
+        """Apply the same change to many POCs concurrently.
+
+        Every POC is fetched and transformed; unchanged POCs are left alone,
+        and changed ones are validated locally before being saved, so that
+        a transform producing invalid POCs (such as a ROLE POC with a first
+        name) is caught without sending anything.
+
+        Args:
+            handles: Handles of the POCs to update, read lazily so that a
+                generator over a large file runs in constant memory.
+            transform: Updates a POC, in place or by returning an updated
+                copy.
+            max_workers: Number of worker threads.
+            validator: Validator of the updated POCs. By default, they are
+                validated structurally, which also runs the checks of
+                :class:`Poc` itself.
+
+        Yields:
+            One result per handle, in input order; ``changed`` tells which
+            POCs were saved, and POCs failing validation have an
+            :class:`~regrws.models.validation.InvalidPayloadError` as
+            ``exception``.
+        """
+        validator = validator or PayloadValidator()
+        return iter_updates(
+            self.from_handle, transform, handles, max_workers, validator.check
+        )
+
+    def bulk_update(
+        self,
+        handles: Iterable[str],
+        transform: Callable[[Poc], Poc | None],
+        max_workers: int = constants.DEFAULT_MAX_WORKERS,
+        validator: PayloadValidator | None = None,
+    ) -> list[Result[str]]:
+        """Like :meth:`iter_bulk_update`, returning all the results at the
+        end."""
+        return list(self.iter_bulk_update(handles, transform, max_workers, validator))
 
 
 class PocLinkRef(BaseModel, tag="pocLinkRef", nsmap=NSMAP, search_mode="unordered"):
@@ -55,6 +112,7 @@ class Poc(BaseModel, tag="poc", nsmap=NSMAP, search_mode="unordered"):
     phones: List[Phone] = wrapped("phones", element(tag="phone"))
 
     _endpoint: ClassVar[str] = "/poc"
+    _manager_class: ClassVar[type[BaseManager]] = PocManager
 
     @model_validator(mode="before")
     @classmethod
@@ -0,0 +1,109 @@
+"""Pre-serialized payloads with a few fields patched per request"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any, Generic, TypeVar
+
+import pydantic_xml
+
+from regrws.models.base import BaseModel
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def _children(document: bytes) -> bytes:
+    """Return what lies between the root element's start and end tags."""
+    if document.endswith(b"/>"):
+        return b""
+    return document[document.index(b">") + 1 : document.rindex(b"</")]
+
+
+class PayloadTemplate(Generic[M]):
+    """An XML payload serialized once, with some fields filled in per request.
+
+    The template instance is serialized up front and split around the
+    elements of the patched ``fields``; :meth:`render` only serializes the
+    new values of those fields. Rendered payloads are byte for byte what
+    ``to_xml`` would produce for the patched instance, and the patched
+    instance is validated by the template's model, so model validators
+    still apply.
+
+    Args:
+        instance: Model holding the values shared by every request. Patched
+            fields must be set to a representative, non-empty value so that
+            their position in the payload can be found.
+        fields: Names of the fields set per request.
+
+    Raises:
+        ValueError: If a field is unknown, empty on the template, or cannot
+            be located unambiguously in the payload.
+
+    Example:
+        >>> template = PayloadTemplate(child_net, ["net_blocks", "customer_handle"])
+        >>> for parent, block, customer in plan:
+        ...     parent.reassign(
+        ...         template.render(net_blocks=[block], customer_handle=customer)
+        ...     )
+    """
+
+    def __init__(self, instance: M, fields: Iterable[str]) -> None:
+        self.model = instance.__class__
+        self.instance = instance
+        self.fields = tuple(fields)
+        document = instance.to_payload()
+
+        self._fragments: dict[str, type[pydantic_xml.BaseXmlModel]] = {}
+        slots = []
+        for name in self.fields:
+            if name not in self.model.model_fields:
+                raise ValueError(f"{self.model.__name__} has no field {name!r}")
+            info = self.model.model_fields[name]
+            self._fragments[name] = pydantic_xml.create_model(
+                f"{self.model.__name__}Fragment",
+                __tag__=self.model.__xml_tag__,
+                __nsmap__=self.model.__xml_nsmap__,
+                **{name: (info.annotation, info)},
+            )
+            fragment = self._serialize(name, getattr(instance, name))
+            if not fragment:
+                raise ValueError(f"Field {name!r} must be set on the template")
+            if document.count(fragment) != 1:
+                raise ValueError(f"Field {name!r} cannot be located in the payload")
+            start = document.index(fragment)
+            slots.append((start, start + len(fragment), name))
+
+        slots.sort()
+        self._static: list[bytes] = []
+        self._order: list[str] = []
+        position = 0
+        for start, end, name in slots:
+            if start < position:
+                raise ValueError(f"Field {name!r} overlaps another field")
+            self._static.append(document[position:start])
+            self._order.append(name)
+            position = end
+        self._static.append(document[position:])
+
+    def _serialize(self, name: str, value: Any) -> bytes:
+        fragment = self._fragments[name].model_construct(**{name: value})
+        return _children(fragment.to_xml(encoding="UTF-8", skip_empty=True))  # type: ignore
+
+    def render(self, **values: Any) -> bytes:
+        """Return the payload with ``values`` replacing the patched fields.
+
+        Fields not given keep the template's value.
+
+        Raises:
+            ValueError: If a value is not a patched field.
+            pydantic.ValidationError: If the patched instance is invalid.
+        """
+        unknown = values.keys() - set(self.fields)
+        if unknown:
+            raise ValueError(f"Not patched by this template: {sorted(unknown)}")
+        instance = self.model.model_validate({**self.instance.__dict__, **values})
+        parts = [self._static[0]]
+        for name, static in zip(self._order, self._static[1:]):
+            parts.append(self._serialize(name, getattr(instance, name)))
+            parts.append(static)
+        return b"".join(parts)
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from ipaddress import IPv4Address, IPv6Address
 from typing import Annotated, Union
 
@@ -25,10 +26,13 @@ iso3166_2_type = Annotated[str, Field(max_length=3), BeforeValidator(_to_upper)]
 cidr_length_type = Annotated[int, Field(ge=0, le=128)]
 
 
-def _validate_ip_address(
+IP_ADDRESS_CACHE_SIZE = 16384
+
+
+def _parse_ip_address(
     value: Union[str, bytes, int],
 ) -> Union[IPv4Address, IPv6Address]:
-    """Validate IP addresses, supporting both IPv4 and IPv6.
+    """Parse any value accepted by :mod:`ipaddress`, trying each version in turn.
 
     ARIN returns zero-padded octets (e.g., 010.000.000.001) which Python 3.11+
     rejects due to octal ambiguity. We strip the padding before parsing.
@@ -57,6 +61,42 @@ def _validate_ip_address(
     raise ValueError(f"Invalid IP address: {value}")
 
 
+@lru_cache(maxsize=IP_ADDRESS_CACHE_SIZE)
+def _parse_ip_string(value: str) -> IPv4Address | IPv6Address:
+    """Parse an address string, detecting its version without exceptions.
+
+    Dotted quads, zero-padded or not, are built from their integer value
+    rather than re-parsed; anything unusual goes through
+    :func:`_parse_ip_address`. Addresses are immutable, so cached instances
+    are shared between models.
+    """
+    if ":" in value:
+        return IPv6Address(value)
+    octets = value.split(".")
+    if len(octets) == 4 and all(o.isascii() and o.isdigit() for o in octets):
+        a, b, c, d = map(int, octets)
+        if a > 255 or b > 255 or c > 255 or d > 255:
+            raise ValueError(f"Invalid IP address: {value}")
+        return IPv4Address(a << 24 | b << 16 | c << 8 | d)
+    return _parse_ip_address(value)
+
+
+def _validate_ip_address(
+    value: str | bytes | int,
+) -> IPv4Address | IPv6Address:
+    """Validate IP addresses, supporting both IPv4 and IPv6.
+
+    Strings, including ARIN's zero-padded IPv4 form, are parsed once and
+    memoized; other values are handed to :mod:`ipaddress` as is.
+    """
+    if isinstance(value, str):
+        try:
+            return _parse_ip_string(value)
+        except ValueError:
+            raise ValueError(f"Invalid IP address: {value}") from None
+    return _parse_ip_address(value)
+
+
 ZeroPaddedIPvAnyAddress = Annotated[
     Union[IPv4Address, IPv6Address],
     BeforeValidator(_validate_ip_address),
@@ -0,0 +1,174 @@
+"""Offline validation of payloads before they are sent"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+import pydantic
+from pydantic_xml import ParsingError
+from pydantic_xml.element.native import etree
+
+from regrws.api import constants
+from regrws.api.bulk import iter_concurrently
+from regrws.models.base import BaseModel
+
+
+def _import_lxml() -> Any:
+    try:
+        from lxml import etree as lxml_etree  # pylint: disable=import-outside-toplevel
+    except ImportError as exc:  # pragma: no cover
+        raise ImportError(
+            "lxml is required for XSD validation: pip install lxml"
+        ) from exc
+    return lxml_etree
+
+
+def _models() -> dict[str, type[BaseModel]]:
+    # prevent circular import
+    from regrws.models import Customer, Net, Org, Poc
+
+    models: tuple[type[BaseModel], ...] = (Customer, Net, Org, Poc)
+    return {model.__xml_tag__: model for model in models}  # type: ignore
+
+
+class InvalidPayloadError(ValueError):
+    """A payload that failed offline validation.
+
+    Attributes:
+        errors: The errors found.
+    """
+
+    def __init__(self, errors: list[str]) -> None:
+        super().__init__("Invalid payload: " + "; ".join(errors))
+        self.errors = errors
+
+
+class PayloadValidator:
+    """Check payloads locally instead of learning about schema errors from
+    ``E_SCHEMA_VALIDATION`` responses, one request at a time.
+
+    With ``schema``, payloads are validated against that XSD (such as the
+    Reg-RWS core schema published by ARIN), which requires ``lxml``. The
+    schema is read once; as lxml schemas must not be shared between
+    threads, each thread compiles its own copy the first time it validates.
+
+    Without ``schema``, payloads are validated structurally: they are parsed
+    back into their model, checking the root element, namespace, required
+    elements, enumerations and value types, but not the constraints only
+    ARIN's schema knows about.
+
+    Args:
+        schema: Path of an XSD file.
+
+    Example:
+        >>> validator = PayloadValidator()
+        >>> errors = validator.validate_many(nets)
+        >>> invalid = {i: e for i, e in enumerate(errors) if e}
+    """
+
+    def __init__(self, schema: str | os.PathLike[str] | None = None) -> None:
+        self.schema = schema
+        self._document = None
+        if schema is not None:
+            self._document = _import_lxml().parse(os.fspath(schema))
+        self._local = threading.local()
+
+    def _schema(self) -> Any:
+        compiled = getattr(self._local, "schema", None)
+        if compiled is None:
+            compiled = self._local.schema = _import_lxml().XMLSchema(self._document)
+        return compiled
+
+    def validate(
+        self, payload: BaseModel | bytes, model: type[BaseModel] | None = None
+    ) -> list[str]:
+        """Validate a model instance or a serialized payload.
+
+        Args:
+            payload: Instance, or payload such as those rendered by a
+                :class:`~regrws.models.template.PayloadTemplate`.
+            model: Model of a serialized payload, found from its root element
+                by default.
+
+        Returns:
+            The errors found, empty if the payload is valid.
+        """
+        if isinstance(payload, BaseModel):
+            model = model or payload.__class__
+            payload = payload.to_payload()
+        if self._document is not None:
+            return self._validate_schema(payload)
+        return self._validate_structure(payload, model)
+
+    def check(
+        self, payload: BaseModel | bytes, model: type[BaseModel] | None = None
+    ) -> None:
+        """Like :meth:`validate`, raising instead of returning the errors.
+
+        Raises:
+            InvalidPayloadError: The payload is invalid.
+        """
+        errors = self.validate(payload, model)
+        if errors:
+            raise InvalidPayloadError(errors)
+
+    def _validate_schema(self, payload: bytes) -> list[str]:
+        lxml_etree = _import_lxml()
+        try:
+            document = lxml_etree.fromstring(payload)
+        except SyntaxError as exc:
+            return [str(exc)]
+        schema = self._schema()
+        if schema.validate(document):
+            return []
+        return [f"line {error.line}: {error.message}" for error in schema.error_log]
+
+    @staticmethod
+    def _validate_structure(payload: bytes, model: type[BaseModel] | None) -> list[str]:
+        try:
+            tree = etree.fromstring(payload)
+        except SyntaxError as exc:
+            return [str(exc)]
+        if model is None:
+            # "{namespace}local", the same with lxml and the standard library
+            tag = tree.tag.rpartition("}")[2]
+            model = _models().get(tag)
+            if model is None:
+                return [f"Unsupported payload <{tag}>"]
+        try:
+            model.from_xml_tree(tree)
+        except pydantic.ValidationError as exc:
+            return [
+                f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+                for error in exc.errors()
+            ]
+        except (ParsingError, ValueError) as exc:
+            return [str(exc)]
+        return []
+
+    def iter_validate(
+        self,
+        payloads: Iterable[BaseModel | bytes],
+        max_workers: int = constants.DEFAULT_MAX_WORKERS,
+    ) -> Iterator[list[str]]:
+        """Validate payloads concurrently, reading them lazily.
+
+        Yields:
+            The errors found for each payload, in input order.
+        """
+        for result in iter_concurrently(self.validate, payloads, max_workers):
+            if result.exception is not None:
+                yield [f"{type(result.exception).__name__}: {result.exception}"]
+            else:
+                yield result.value
+
+    def validate_many(
+        self,
+        payloads: Iterable[BaseModel | bytes],
+        max_workers: int = constants.DEFAULT_MAX_WORKERS,
+    ) -> list[list[str]]:
+        """Like :meth:`iter_validate`, returning all the errors at the end."""
+        return list(self.iter_validate(payloads, max_workers))
@@ -1,4 +1,4 @@
-from pydantic import HttpUrl, SecretStr
+from pydantic import HttpUrl, PositiveFloat, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -11,10 +11,12 @@ class Settings(BaseSettings):
     Attributes:
         base_url: The base URL for the ARIN Reg-RWS API.
         api_key: Your ARIN API key (stored securely as SecretStr).
+        timeout: Timeout of each HTTP call in seconds, no timeout if unset.
 
     Environment Variables:
         REGRWS_BASE_URL: Base URL for the API
         REGRWS_API_KEY: Your ARIN API key
+        REGRWS_TIMEOUT: Timeout of each HTTP call in seconds
 
     Example:
         >>> settings = Settings(
@@ -27,3 +29,4 @@ class Settings(BaseSettings):
 
     base_url: HttpUrl
     api_key: SecretStr
+    timeout: PositiveFloat | None = None
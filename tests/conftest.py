@@ -0,0 +1,23 @@
+import pytest
+import responses
+
+from regrws.api import Api
+
+
+@pytest.fixture
+def make_api():
+    def make(**kwargs):
+        return Api(api_key="APIKEY", base_url="https://reg.ote.arin.net/", **kwargs)
+
+    return make
+
+
+@pytest.fixture
+def api(make_api):
+    return make_api()
+
+
+@pytest.fixture
+def mocked_responses():
+    with responses.RequestsMock() as rsps:
+        yield rsps
@@ -190,3 +190,20 @@ TICKETED_REQUEST_PAYLOAD = f"""<ticketedRequest xmlns="http://www.arin.net/regrw
         {TICKET_PAYLOAD}
         {NET_PAYLOAD}
     </ticketedRequest>"""
+
+DELEGATION_PAYLOAD = """<delegation xmlns="http://www.arin.net/regrws/core/v1" >
+        <delegationKeys>
+            <delegationKey>
+                <algorithm name = "RSA/SHA-1">5</algorithm>
+                <digest>0DC99D4B6549F83385214189CA48DC6B209ABB71</digest>
+                <ttl>86400</ttl>
+                <digestType name = "SHA-1">1</digestType>
+                <keyTag>264</keyTag>
+            </delegationKey>
+        </delegationKeys>
+        <name>0.76.in-addr.arpa.</name>
+        <nameservers>
+            <nameserver>NS1.DOMAIN.COM</nameserver>
+            <nameserver>NS2.DOMAIN.COM</nameserver>
+        </nameservers>
+    </delegation>"""
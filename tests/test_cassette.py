@@ -0,0 +1,123 @@
+import json
+import time
+
+import pytest
+import requests
+import responses
+
+from regrws.api import Api, constants
+from regrws.api.cassette import CassetteError, Recorder, Replayer
+
+from .payloads import ERROR_PAYLOAD, POC_PAYLOAD
+
+BASE = "https://reg.ote.arin.net/rest"
+
+
+def make_api(transport):
+    return Api(
+        api_key="APIKEY", base_url="https://reg.ote.arin.net/", transport=transport
+    )
+
+
+@pytest.fixture(params=["bulk.cassette", "bulk.cassette.gz"])
+def cassette(request, tmp_path):
+    path = tmp_path / request.param
+    with responses.RequestsMock() as rsps, Recorder(path) as recorder:
+        rsps.get(
+            f"{BASE}/poc/ARIN-HOSTMASTER",
+            body=POC_PAYLOAD.encode(),
+            content_type=constants.CONTENT_TYPE,
+        )
+        rsps.get(
+            f"{BASE}/poc/MISSING",
+            body=ERROR_PAYLOAD.encode(),
+            status=404,
+            content_type=constants.CONTENT_TYPE,
+        )
+        api = make_api(recorder)
+        api.poc.from_handle("ARIN-HOSTMASTER")
+        api.poc.from_handle("MISSING")
+        api.poc.from_handle("ARIN-HOSTMASTER")
+    return path
+
+
+def test_records_without_apikey(cassette):
+    interactions = Replayer.read(cassette)
+    assert [(i.method, i.url, i.status) for i in interactions] == [
+        ("GET", f"{BASE}/poc/ARIN-HOSTMASTER", 200),
+        ("GET", f"{BASE}/poc/MISSING", 404),
+        ("GET", f"{BASE}/poc/ARIN-HOSTMASTER", 200),
+    ]
+    assert all("APIKEY" not in i.url for i in interactions)
+    assert interactions[0].offset <= interactions[1].offset
+
+
+def test_replays_without_network(cassette):
+    api = make_api(Replayer(cassette, speed=None))
+    assert api.poc.from_handle("ARIN-HOSTMASTER").handle == "ARIN-HOSTMASTER"
+    assert api.poc.from_handle("missing").code == "E_SCHEMA_VALIDATION"
+    api.poc.from_handle("ARIN-HOSTMASTER")
+    with pytest.raises(CassetteError):
+        api.poc.from_handle("ARIN-HOSTMASTER")
+
+
+def test_repeat(cassette):
+    api = make_api(Replayer(cassette, speed=None, repeat=True))
+    for _ in range(5):
+        assert api.poc.from_handle("ARIN-HOSTMASTER")
+
+
+def test_scaled_timings(cassette):
+    replayer = Replayer(cassette, speed=0.5)
+    for interaction in replayer.interactions:
+        interaction.elapsed = 0.05
+    start = time.perf_counter()
+    make_api(replayer).poc.from_handle("ARIN-HOSTMASTER")
+    assert time.perf_counter() - start >= 0.1
+
+
+def test_unsupported_version(tmp_path):
+    path = tmp_path / "bad.cassette"
+    path.write_text('{"version": 99}\n')
+    with pytest.raises(ValueError):
+        Replayer(path)
+
+
+def test_replays_binary_content_and_exceptions(tmp_path):
+    path = tmp_path / "failures.cassette"
+    content = bytes(range(256))
+    with responses.RequestsMock() as rsps, Recorder(path) as recorder:
+        rsps.get(f"{BASE}/blob", body=content, content_type="application/octet-stream")
+        rsps.get(f"{BASE}/poc/ARIN-HOSTMASTER", body=requests.ConnectionError("reset"))
+        session = requests.Session()
+        session.mount("https://", recorder)
+        assert session.get(f"{BASE}/blob").content == content
+        with pytest.raises(requests.ConnectionError):
+            make_api(recorder).poc.from_handle("ARIN-HOSTMASTER")
+
+    replayer = Replayer(path, speed=None)
+    _, failure = replayer.interactions
+    assert (failure.status, failure.body) == (None, None)
+    assert failure.exception == "requests.exceptions.ConnectionError"
+    session = requests.Session()
+    session.mount("https://", replayer)
+    assert session.get(f"{BASE}/blob").content == content
+    with pytest.raises(requests.ConnectionError, match="reset"):
+        make_api(replayer).poc.from_handle("ARIN-HOSTMASTER")
+
+
+def test_reads_version_1(tmp_path):
+    path = tmp_path / "v1.cassette"
+    interaction = {
+        "method": "GET",
+        "url": f"{BASE}/poc/ARIN-HOSTMASTER",
+        "request_body": None,
+        "status": 200,
+        "content_type": constants.CONTENT_TYPE,
+        "body": POC_PAYLOAD,
+        "elapsed": 0.01,
+        "offset": 0.0,
+    }
+    path.write_text(json.dumps({"version": 1}) + "\n" + json.dumps(interaction) + "\n")
+    api = make_api(Replayer(path, speed=None))
+    assert api.poc.from_handle("ARIN-HOSTMASTER").handle == "ARIN-HOSTMASTER"
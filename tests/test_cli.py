@@ -0,0 +1,167 @@
+import io
+import json
+
+import pytest
+import responses
+
+from regrws import cli
+from regrws.api import constants
+from regrws.api.journal import Journal
+
+from .payloads import ERROR_PAYLOAD, NET_PAYLOAD, POC_PAYLOAD, TICKETED_REQUEST_PAYLOAD
+
+BASE = "https://reg.ote.arin.net/rest"
+OPTIONS = ["--base-url", "https://reg.ote.arin.net/", "--api-key", "APIKEY"]
+
+
+@pytest.fixture
+def mocked_responses():
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        rsps.get(
+            f"{BASE}/poc/ARIN-HOSTMASTER?apikey=APIKEY",
+            body=POC_PAYLOAD.encode(),
+            status=200,
+            content_type=constants.CONTENT_TYPE,
+        )
+        rsps.get(
+            f"{BASE}/poc/MISSING-ARIN?apikey=APIKEY",
+            body=ERROR_PAYLOAD.encode(),
+            status=404,
+            content_type=constants.CONTENT_TYPE,
+        )
+        yield rsps
+
+
+def records(capsys):
+    out, err = capsys.readouterr()
+    return [json.loads(line) for line in out.splitlines()], err
+
+
+def test_get_from_file_and_arguments(mocked_responses, capsys, tmp_path):
+    handles = tmp_path / "handles.txt"
+    handles.write_text("# comment\nMISSING-ARIN\n\n")
+    status = cli.main([*OPTIONS, "get", "poc", "arin-hostmaster", "-f", str(handles)])
+    (found, missing), err = records(capsys)
+    assert status == 1
+    assert found["input"] == "arin-hostmaster"
+    assert found["ok"] and found["result"]["handle"] == "ARIN-HOSTMASTER"
+    assert not missing["ok"]
+    assert missing["error"]["code"] == "E_SCHEMA_VALIDATION"
+    assert "summary: count=2 succeeded=1 failed=1" in err
+
+
+def test_get_from_stdin(mocked_responses, capsys, monkeypatch):
+    monkeypatch.setattr("sys.stdin", io.StringIO("ARIN-HOSTMASTER\n"))
+    assert cli.main([*OPTIONS, "--concurrency", "2", "get", "poc"]) == 0
+    (found,), _ = records(capsys)
+    assert found["ok"]
+
+
+def test_export_parquet(mocked_responses, capsys, tmp_path):
+    parquet = pytest.importorskip("pyarrow.parquet")
+    output = tmp_path / "pocs.parquet"
+    cli.main(
+        [*OPTIONS, "export", "poc", "ARIN-HOSTMASTER", "MISSING-ARIN"]
+        + ["--format", "parquet", "-o", str(output)]
+    )
+    table = parquet.read_table(output)
+    assert table.column("handle").to_pylist() == ["ARIN-HOSTMASTER"]
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "feather"])
+def test_export_in_batches(mocked_responses, tmp_path, fmt):
+    ipc = pytest.importorskip("pyarrow.ipc")
+    parquet = pytest.importorskip("pyarrow.parquet")
+
+    output = tmp_path / f"pocs.{fmt}"
+    handles = ["ARIN-HOSTMASTER"] * 5
+    cli.main(
+        [*OPTIONS, "export", "poc", *handles]
+        + ["--format", fmt, "-o", str(output), "--batch-size", "2"]
+    )
+    if fmt == "parquet":
+        snapshot = parquet.ParquetFile(output)
+        assert snapshot.metadata.num_rows == 5
+        assert snapshot.num_row_groups == 3
+    else:
+        with ipc.open_file(output) as reader:
+            assert reader.num_record_batches == 3
+            assert reader.read_all().column("handle").to_pylist() == handles
+
+
+def test_export_requires_output(capsys):
+    with pytest.raises(SystemExit):
+        cli.main([*OPTIONS, "export", "poc", "ARIN-HOSTMASTER", "--format", "feather"])
+
+
+def test_reassign(mocked_responses, capsys, tmp_path):
+    mocked_responses.get(
+        f"{BASE}/net/NET-10-0-0-0-1?apikey=APIKEY",
+        body=NET_PAYLOAD.encode(),
+        status=200,
+        content_type=constants.CONTENT_TYPE,
+    )
+    mocked_responses.put(
+        f"{BASE}/net/NET-10-0-0-0-1/reassign?apikey=APIKEY",
+        body=TICKETED_REQUEST_PAYLOAD.encode(),
+        status=200,
+        content_type=constants.CONTENT_TYPE,
+    )
+    plan = tmp_path / "plan.csv"
+    plan.write_text(
+        "parent,prefix,customer_handle,net_name\n"
+        "NET-10-0-0-0-1,10.0.0.0/26,C01,\n"
+        "NET-10-0-0-0-1,10.0.0.64/26,C02,CUSTOMER-2\n"
+    )
+    journal = tmp_path / "reassign.journal"
+    status = cli.main([*OPTIONS, "reassign", str(plan), "--journal", str(journal)])
+    assert status == 0
+    results, _ = records(capsys)
+    assert [r["result"]["ticket"]["ticket_no"] for r in results] == ["TICKETNO"] * 2
+    parent_gets = [c for c in mocked_responses.calls if c.request.method == "GET"]
+    assert len(parent_gets) <= 2
+    assert [e.operation for e in Journal.read(journal)] == ["reassign"] * 2
+
+
+def test_reassign_dry_run(capsys, tmp_path):
+    plan = tmp_path / "plan.csv"
+    plan.write_text("parent,prefix,org_handle\nNET-10-0-0-0-1,2001:db8::/48,ORG\n")
+    assert cli.main([*OPTIONS, "reassign", str(plan), "--dry-run"]) == 0
+    (result,), _ = records(capsys)
+    net = result["result"]
+    assert net["net_name"] == "NET-2001-db8---48"
+    assert net["net_blocks"][0]["cidr_length"] == 48
+
+
+def test_reassign_validates_before_sending(capsys, tmp_path):
+    plan = tmp_path / "plan.csv"
+    plan.write_text(
+        "parent,prefix,customer_handle,org_handle\n"
+        "NET-10-0-0-0-1,10.0.0.0/26,C01,\n"
+        "NET-10-0-0-0-1,10.0.0.64/26,C02,ORG\n"
+        "NET-10-0-0-0-1,10.0.0.129/26,C03,\n"
+    )
+    # no request mocked: nothing may be sent
+    assert cli.main([*OPTIONS, "reassign", str(plan), "--validate"]) == 1
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    errors = [json.loads(line) for line in captured.err.splitlines()]
+    assert [error["line"] for error in errors] == [3, 4]
+
+
+def test_reassign_reports_file_lines(capsys, monkeypatch, tmp_path):
+    closed = []
+    monkeypatch.setattr(Journal, "close", lambda self: closed.append(self))
+    plan = tmp_path / "plan.csv"
+    plan.write_text(
+        "parent,prefix,customer_handle,net_name\n"
+        'NET-10-0-0-0-1,10.0.0.0/26,C01,"CUSTOMER\n1"\n'
+        "NET-10-0-0-0-1,10.0.0.129/26,C03,\n"
+    )
+    journal = tmp_path / "reassign.journal"
+    argv = [*OPTIONS, "reassign", str(plan), "--validate", "--journal", str(journal)]
+    assert cli.main(argv) == 1
+    (error,) = [json.loads(line) for line in capsys.readouterr().err.splitlines()]
+    # the quoted name spans lines 2 and 3
+    assert error["line"] == 4
+    assert len(closed) == 1
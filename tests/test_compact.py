@@ -0,0 +1,86 @@
+"""Tests for compact record representations in regrws.models.compact"""
+
+import pickle
+
+import pytest
+
+from regrws.models import Customer, Net, Poc
+from regrws.models.compact import (
+    CompactNet,
+    CompactNetBlock,
+    CompactPoc,
+    CompactPocLinkRef,
+    CompactRecord,
+    compact,
+    compact_all,
+)
+from regrws.models.nested import MultiLineElement
+from regrws.models.net import NetBlock
+
+from .payloads import CUSTOMER_PAYLOAD, NET_PAYLOAD, NETBLOCK_PAYLOAD, POC_PAYLOAD
+
+
+@pytest.mark.parametrize(
+    ("model", "payload", "record"),
+    (
+        (Net, NET_PAYLOAD, CompactNet),
+        (NetBlock, NETBLOCK_PAYLOAD, CompactNetBlock),
+        (Poc, POC_PAYLOAD, CompactPoc),
+    ),
+)
+def test_round_trip(model, payload, record):
+    instance = model.from_xml(payload)
+    compacted = compact(instance)
+    assert isinstance(compacted, record)
+    assert compacted.to_model() == instance
+    assert pickle.loads(pickle.dumps(compacted)) == compacted
+
+
+def test_round_trip_keeps_empty_lines():
+    poc = Poc.from_xml(POC_PAYLOAD)
+    poc.comment = [
+        MultiLineElement(number=1, line="Line 1"),
+        MultiLineElement(number=2, line=None),
+        MultiLineElement(number=3, line=""),
+    ]
+    restored = compact(poc).to_model()
+    assert [line.line for line in restored.comment] == ["Line 1", None, ""]
+    assert restored == poc
+
+
+def test_net_addresses_are_integers():
+    net = compact(Net.from_xml(NET_PAYLOAD))
+    block = net.net_blocks[0]
+    assert block.start == 0x0A000000
+    assert block.end == 0x0A0000FF
+    assert net.origin_ases == ("AS102",)
+    assert net.poc_links[0] == CompactPocLinkRef("T", "EXAMPLETECH-ARIN")
+    assert net.poc_links[0].description == "Tech"
+
+
+def test_records_are_slotted_and_share_strings():
+    first, second = compact_all(Net.from_xml(NET_PAYLOAD) for _ in range(2))
+    assert not hasattr(first, "__dict__")
+    assert first.handle is second.handle
+
+
+def test_poc_countries_are_shared():
+    first, second = (compact(Poc.from_xml(POC_PAYLOAD)) for _ in range(2))
+    assert first.iso3166_1 is second.iso3166_1
+
+
+def test_unsupported_model():
+    with pytest.raises(TypeError, match="No compact record for Customer"):
+        compact(Customer.from_xml(CUSTOMER_PAYLOAD))
+
+
+def test_records_must_implement_conversions():
+    class Incomplete(CompactRecord):
+        __slots__ = ("handle",)
+
+        @classmethod
+        def from_model(cls, instance):
+            return cls()
+
+    with pytest.raises(TypeError, match="to_model"):
+        Incomplete()
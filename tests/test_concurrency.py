@@ -0,0 +1,156 @@
+import threading
+import time
+
+import pytest
+import requests
+
+from regrws.api import constants
+from regrws.api.bulk import run_concurrently
+from regrws.api.concurrency import (
+    AdaptiveLimiter,
+    Priority,
+    current_priority,
+    priority,
+)
+from regrws.api.deadline import Deadline, DeadlineExceeded
+
+from .payloads import ERROR_PAYLOAD, POC_PAYLOAD
+
+URL = "https://reg.ote.arin.net/rest/poc/ARIN-HOSTMASTER?apikey=APIKEY"
+OUTAGE_PAYLOAD = ERROR_PAYLOAD.replace("E_SCHEMA_VALIDATION", "E_OUTAGE")
+
+
+def run(limiter, latency, count=1, failed=False):
+    for _ in range(count):
+        limiter.release(limiter.acquire(), latency, failed)
+
+
+def test_grows_while_latency_is_flat():
+    limiter = AdaptiveLimiter(initial_limit=2, max_limit=5)
+    run(limiter, 0.1, count=100)
+    assert limiter.limit == 5
+
+
+def test_backs_off_when_latency_rises():
+    limiter = AdaptiveLimiter(initial_limit=8, latency_tolerance=2.0)
+    run(limiter, 0.1, count=10)
+    before = limiter.limit
+    run(limiter, 1.0, count=3)
+    assert limiter.limit < before
+
+
+def test_one_decrease_per_round_trip():
+    limiter = AdaptiveLimiter(initial_limit=8)
+    tickets = [limiter.acquire() for _ in range(8)]
+    for ticket in tickets:
+        limiter.release(ticket, 0.1, failed=True)
+    assert limiter.limit == 4
+    run(limiter, 0.1, failed=True)
+    assert limiter.limit == 2
+    run(limiter, 0.1, count=5, failed=True)
+    assert limiter.limit == 1
+
+
+def test_blocks_at_limit():
+    limiter = AdaptiveLimiter(initial_limit=1, max_limit=1)
+    ticket = limiter.acquire()
+    acquired = threading.Event()
+    thread = threading.Thread(target=lambda: (limiter.acquire(), acquired.set()))
+    thread.start()
+    assert not acquired.wait(0.05)
+    limiter.release(ticket, 0.1)
+    assert acquired.wait(1)
+    thread.join()
+
+
+def test_serves_high_priority_first():
+    limiter = AdaptiveLimiter(initial_limit=1, min_limit=1, max_limit=1)
+    ticket = limiter.acquire()
+    order = []
+
+    def worker(level):
+        limiter.release(limiter.acquire(level), 0.1)
+        order.append(level)
+
+    threads = []
+    for level in (Priority.BULK, Priority.BULK, Priority.INTERACTIVE):
+        threads.append(threading.Thread(target=worker, args=(level,)))
+        threads[-1].start()
+        while limiter.waiting < len(threads):
+            time.sleep(0.001)
+    limiter.release(ticket, 0.1)
+    for thread in threads:
+        thread.join()
+    assert order == [Priority.INTERACTIVE, Priority.BULK, Priority.BULK]
+
+
+def test_priority_follows_bulk_operations():
+    assert current_priority() is Priority.NORMAL
+    with priority(Priority.BULK):
+        results = run_concurrently(lambda _: current_priority(), range(3))
+    assert [result.value for result in results] == [Priority.BULK] * 3
+    assert current_priority() is Priority.NORMAL
+
+
+def test_slot_counts_exceptions_as_failures():
+    limiter = AdaptiveLimiter(initial_limit=4)
+    with pytest.raises(requests.ConnectionError), limiter.slot():
+        raise requests.ConnectionError
+    assert limiter.limit == 2
+    assert limiter.in_flight == 0
+
+
+def test_slot_ignores_other_exceptions():
+    limiter = AdaptiveLimiter(initial_limit=4)
+    with pytest.raises(DeadlineExceeded), limiter.slot():
+        raise DeadlineExceeded("expired")
+    assert limiter.limit == 4
+    assert limiter.in_flight == 0
+
+
+def test_deadline_exceeded_leaves_the_limit(make_api):
+    limiter = AdaptiveLimiter(initial_limit=2, max_limit=2)
+    api = make_api(limiter=limiter)
+    with pytest.raises(DeadlineExceeded), Deadline(0):
+        api.poc.from_handle("ARIN-HOSTMASTER")
+
+    # the budget runs out while waiting for a slot
+    tickets = [limiter.acquire() for _ in range(2)]
+    errors = []
+
+    def lookup():
+        with Deadline(0.05):
+            try:
+                api.poc.from_handle("ARIN-HOSTMASTER")
+            except DeadlineExceeded as exc:
+                errors.append(exc)
+
+    thread = threading.Thread(target=lookup)
+    thread.start()
+    time.sleep(0.1)
+    for ticket in tickets:
+        limiter.release(ticket, None)
+    thread.join()
+    assert len(errors) == 1
+    assert limiter.limit == 2
+    assert limiter.in_flight == 0
+
+
+def test_invalid_limits():
+    with pytest.raises(ValueError):
+        AdaptiveLimiter(initial_limit=10, max_limit=5)
+
+
+@pytest.mark.parametrize(
+    ("body", "status", "limit"),
+    ((POC_PAYLOAD, 200, 4), (OUTAGE_PAYLOAD, 400, 2), (ERROR_PAYLOAD, 400, 4)),
+)
+def test_api_reports_outages(make_api, mocked_responses, body, status, limit):
+    limiter = AdaptiveLimiter(initial_limit=4, max_limit=4)
+    api = make_api(limiter=limiter)
+    mocked_responses.get(
+        URL, body=body.encode(), status=status, content_type=constants.CONTENT_TYPE
+    )
+    api.poc.from_handle("ARIN-HOSTMASTER")
+    assert limiter.limit == limit
+    assert limiter.in_flight == 0
@@ -1,5 +1,4 @@
 import pytest
-import responses
 from responses.matchers import header_matcher
 
 from regrws.api import Api, constants
@@ -14,17 +13,6 @@ from .payloads import (
 )
 
 
-@pytest.fixture()
-def api():
-    return Api(api_key="APIKEY", base_url="https://reg.ote.arin.net/")
-
-
-@pytest.fixture
-def mocked_responses():
-    with responses.RequestsMock() as rsps:
-        yield rsps
-
-
 def test_cust_manager(mocked_responses, api: type[Api]):
     mocked_responses.get(
         "https://reg.ote.arin.net/rest/net/NET-10-0-0-0-1?apikey=APIKEY",
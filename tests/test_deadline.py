@@ -0,0 +1,84 @@
+import time
+
+import pytest
+import requests
+import responses
+
+from regrws.api import Api, constants
+from regrws.api.bulk import run_concurrently
+from regrws.api.deadline import Deadline, DeadlineExceeded, current_deadline
+from regrws.settings import Settings
+
+from .payloads import POC_PAYLOAD
+
+URL = "https://reg.ote.arin.net/rest/poc/ARIN-HOSTMASTER"
+
+
+def test_remaining_budget():
+    deadline = Deadline(10)
+    assert 9 < deadline.check() <= 10
+    assert not deadline.expired
+    expired = Deadline(0)
+    assert expired.expired and expired.remaining == 0
+    with pytest.raises(DeadlineExceeded):
+        expired.check()
+
+
+def test_nested_deadlines_only_shorten():
+    assert current_deadline() is None
+    with Deadline(1) as outer:
+        with Deadline(10) as inner:
+            assert inner is outer
+        with Deadline(0.5) as inner:
+            assert current_deadline() is inner
+        assert current_deadline() is outer
+    assert current_deadline() is None
+
+
+def test_deadline_follows_bulk_operations():
+    with Deadline(10) as deadline:
+        results = run_concurrently(lambda _: current_deadline(), range(3))
+    assert [result.value for result in results] == [deadline] * 3
+
+
+def test_timeout_from_remaining_budget(api):
+    with responses.RequestsMock() as rsps:
+        rsps.get(URL, body=POC_PAYLOAD.encode(), content_type=constants.CONTENT_TYPE)
+        with Deadline(5):
+            api.poc.from_handle("ARIN-HOSTMASTER")
+        api.poc.from_handle("ARIN-HOSTMASTER")
+        first, second = rsps.calls
+    assert 4 < first.request.req_kwargs["timeout"] <= 5
+    assert second.request.req_kwargs["timeout"] is None
+
+
+def test_timeout_from_settings():
+    settings = Settings(
+        base_url="https://reg.ote.arin.net/", api_key="APIKEY", timeout=2.5
+    )
+    api = Api(settings=settings)
+    with responses.RequestsMock() as rsps:
+        rsps.get(URL, body=POC_PAYLOAD.encode(), content_type=constants.CONTENT_TYPE)
+        api.poc.from_handle("ARIN-HOSTMASTER")
+        assert rsps.calls[0].request.req_kwargs["timeout"] == 2.5
+
+
+def test_expired_deadline_is_not_sent(api):
+    with responses.RequestsMock() as rsps, Deadline(0.01):
+        time.sleep(0.02)
+        with pytest.raises(DeadlineExceeded):
+            api.poc.from_handle("ARIN-HOSTMASTER")
+        assert not rsps.calls
+
+
+def test_timeout_becomes_deadline_exceeded(api):
+    def hang(request):
+        time.sleep(0.05)
+        raise requests.ReadTimeout
+
+    with responses.RequestsMock() as rsps:
+        rsps.add_callback(responses.GET, URL, callback=hang)
+        with Deadline(0.01), pytest.raises(DeadlineExceeded):
+            api.poc.from_handle("ARIN-HOSTMASTER")
+        with pytest.raises(requests.ReadTimeout):
+            api.poc.from_handle("ARIN-HOSTMASTER")
@@ -0,0 +1,83 @@
+import responses
+
+from regrws.api import Api, constants
+from regrws.models import Delegation, Error
+from regrws.models.delegation import Algorithm, DelegationKey, DigestType
+from regrws.models.nested import AlgorithmEnum, DigestTypeEnum
+
+from .payloads import DELEGATION_PAYLOAD, ERROR_PAYLOAD
+
+BASE = "https://reg.ote.arin.net/rest"
+
+
+def make_api():
+    return Api(api_key="APIKEY", base_url="https://reg.ote.arin.net/")
+
+
+def test_parse():
+    delegation = Delegation.from_xml(DELEGATION_PAYLOAD.encode())
+    assert delegation.name == "0.76.in-addr.arpa."
+    (key,) = delegation.delegation_keys
+    assert key.algorithm.value is AlgorithmEnum.SHA1
+    assert key.algorithm.name == "RSA/SHA-1"
+    assert key.digest_type.value is DigestTypeEnum.SHA1
+    assert key.key_tag == 264
+    assert delegation.nameserver_set == {"NS1.DOMAIN.COM", "NS2.DOMAIN.COM"}
+
+
+def test_algorithm_names_default_to_the_registry():
+    key = DelegationKey(
+        algorithm=Algorithm(value=AlgorithmEnum.ECDSA256),
+        digest="ABCD",
+        digest_type=DigestType(value=DigestTypeEnum.SHA256),
+        key_tag=1,
+    )
+    payload = key.to_payload()
+    assert b'<algorithm name="ECDSA Curve P-256 with SHA-256">13</algorithm>' in payload
+    assert b'<digestType name="SHA-256">2</digestType>' in payload
+
+
+@responses.activate
+def test_names_are_not_uppercased():
+    responses.get(
+        f"{BASE}/delegation/0.76.in-addr.arpa.",
+        body=DELEGATION_PAYLOAD.encode(),
+        content_type=constants.CONTENT_TYPE,
+    )
+    delegation = make_api().delegation.from_handle("0.76.in-addr.arpa.")
+    assert delegation.absolute_url == f"{BASE}/delegation/0.76.in-addr.arpa."
+
+
+def test_update_nameservers_skips_unchanged_zones():
+    zones = ["0.76.in-addr.arpa.", "1.76.in-addr.arpa.", "2.76.in-addr.arpa."]
+    with responses.RequestsMock() as rsps:
+        for zone in zones[:2]:
+            payload = DELEGATION_PAYLOAD.replace("0.76.in-addr.arpa.", zone)
+            if zone == zones[1]:
+                payload = payload.replace("NS2.DOMAIN.COM", "NS3.DOMAIN.COM")
+            rsps.get(
+                f"{BASE}/delegation/{zone}",
+                body=payload.encode(),
+                content_type=constants.CONTENT_TYPE,
+            )
+        rsps.get(
+            f"{BASE}/delegation/{zones[2]}",
+            body=ERROR_PAYLOAD.encode(),
+            status=404,
+            content_type=constants.CONTENT_TYPE,
+        )
+        save = rsps.put(
+            f"{BASE}/delegation/{zones[1]}",
+            body=DELEGATION_PAYLOAD.replace("0.76", "1.76").encode(),
+            content_type=constants.CONTENT_TYPE,
+        )
+        results = make_api().delegation.update_nameservers(
+            zones, ["ns2.domain.com.", "ns1.domain.com"]
+        )
+        assert save.call_count == 1
+        (put,) = [call for call in rsps.calls if call.request.method == "PUT"]
+        assert b"<nameserver>ns2.domain.com.</nameserver>" in put.request.body
+    assert [result.changed for result in results] == [False, True, None]
+    assert [result.ok for result in results] == [True, True, False]
+    assert isinstance(results[2].value, Error)
+    assert results[0].value.name == zones[0]
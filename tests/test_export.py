@@ -0,0 +1,61 @@
+"""Tests for columnar export in regrws.models.export"""
+
+import pytest
+
+from regrws.models import Customer, Net, Org, Poc
+from regrws.models.export import to_arrow, to_columns, to_dataframe
+from regrws.models.net import NetBlock
+
+from .payloads import CUSTOMER_PAYLOAD, NET_PAYLOAD, ORG_PAYLOAD, POC_PAYLOAD
+
+
+def test_net_columns():
+    columns = to_columns([Net.from_xml(NET_PAYLOAD)])
+    assert columns["handle"] == ["NET-10-0-0-0-1"]
+    assert columns["version"] == [4]
+    assert columns["origin_ases"] == [["AS102"]]
+    assert columns["comment"] == [["Line 1", "", "Line 3"]]
+    block = columns["net_blocks"][0][0]
+    assert (block["start_address_hi"], block["start_address_lo"]) == (0, 0x0A000000)
+    assert block["end_address_lo"] == 0x0A0000FF
+    assert columns["poc_links"][0][1] == {
+        "function": "AD",
+        "description": "Admin",
+        "handle": "EXAMPLEADMIN-ARIN",
+    }
+
+
+def test_ipv6_addresses_are_split():
+    block = NetBlock(type="A", start_address="2001:db8::1", cidr_length=128)
+    columns = to_columns([block])
+    assert columns["start_address_hi"] == [0x20010DB800000000]
+    assert columns["start_address_lo"] == [1]
+    assert columns["end_address_hi"] == [None]
+
+
+def test_invalid_collections():
+    with pytest.raises(TypeError, match="model"):
+        to_columns([])
+    assert to_columns([], Customer)["customer_name"] == []
+    with pytest.raises(TypeError, match="not supported for Org"):
+        to_columns([Org.from_xml(ORG_PAYLOAD)])
+    with pytest.raises(TypeError, match="Expected Net instances, got Poc"):
+        to_columns([Net.from_xml(NET_PAYLOAD), Poc.from_xml(POC_PAYLOAD)])
+
+
+def test_to_arrow():
+    pa = pytest.importorskip("pyarrow")
+    table = to_arrow([Net.from_xml(NET_PAYLOAD)] * 3)
+    assert table.num_rows == 3
+    assert table.schema.field("version").type == pa.uint8()
+    net_blocks = table.schema.field("net_blocks").type
+    assert net_blocks.value_type.field("start_address_lo").type == pa.uint64()
+    assert to_arrow([], Poc).num_rows == 0
+
+
+def test_to_dataframe():
+    pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+    frame = to_dataframe([Customer.from_xml(CUSTOMER_PAYLOAD)])
+    assert frame.loc[0, "iso3166_1_code2"] == "US"
+    assert not frame.loc[0, "private_customer"]
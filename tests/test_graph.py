@@ -0,0 +1,97 @@
+import threading
+
+import pytest
+
+from regrws.api.graph import DependencyError, OperationGraph
+from regrws.models import Error
+
+from .payloads import ERROR_PAYLOAD
+
+
+def test_results_flow_along_edges():
+    graph = OperationGraph()
+    customer = graph.add("customer", lambda: "C012345")
+    net = graph.add("net", lambda: "NET-10-0-0-0-1")
+    graph.add("reassign", lambda c, n: f"{n}->{c}", depends_on=[customer, net])
+    graph.add("ticket", lambda ticket: ticket.upper(), depends_on=["reassign"])
+    results = graph.run()
+    assert results["reassign"].value == "NET-10-0-0-0-1->C012345"
+    assert results["ticket"].value == "NET-10-0-0-0-1->C012345".upper()
+    assert all(result.ok for result in results.values())
+
+
+def test_independent_branches_run_concurrently():
+    barrier = threading.Barrier(3, timeout=5)
+    graph = OperationGraph(max_workers=3)
+    for i in range(3):
+        graph.add(f"customer:{i}", barrier.wait)
+    results = graph.run()
+    assert all(result.ok for result in results.values())
+
+
+def test_concurrency_cap():
+    lock = threading.Lock()
+    active = peak = 0
+
+    def work():
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        threading.Event().wait(0.01)
+        with lock:
+            active -= 1
+
+    graph = OperationGraph(max_workers=2)
+    for i in range(6):
+        graph.add(str(i), work)
+    graph.run()
+    assert peak <= 2
+
+
+def test_failures_skip_dependents():
+    def fail():
+        raise RuntimeError("boom")
+
+    graph = OperationGraph()
+    graph.add("customer", fail)
+    graph.add("reassign", lambda c: c, depends_on=["customer"])
+    graph.add("ticket", lambda t: t, depends_on=["reassign"])
+    graph.add("error", lambda: Error.from_xml(ERROR_PAYLOAD))
+    graph.add("after-error", lambda e: e, depends_on=["error"])
+    graph.add("other", lambda: 1)
+    results = graph.run()
+    assert isinstance(results["customer"].exception, RuntimeError)
+    assert isinstance(results["reassign"].exception, DependencyError)
+    assert isinstance(results["ticket"].exception, DependencyError)
+    assert isinstance(results["after-error"].exception, DependencyError)
+    assert results["other"].value == 1
+
+
+def test_invalid_graphs():
+    graph = OperationGraph()
+    graph.add("a", lambda b: b, depends_on=["b"])
+    with pytest.raises(ValueError, match="already defined"):
+        graph.add("a", lambda: None)
+    with pytest.raises(ValueError, match="unknown 'b'"):
+        graph.run()
+    graph.add("b", lambda a: a, depends_on=["a"])
+    with pytest.raises(ValueError, match="cycle"):
+        graph.run()
+
+
+def test_long_chains():
+    def fail():
+        raise RuntimeError("boom")
+
+    for first in (lambda: 0, fail):
+        graph = OperationGraph()
+        graph.add("0", first)
+        for index in range(1, 5000):
+            graph.add(str(index), lambda n: n + 1, depends_on=[str(index - 1)])
+        last = graph.run()["4999"]
+        if first is fail:
+            assert isinstance(last.exception, DependencyError)
+            assert "'0' failed" in str(last.exception)
+        else:
+            assert last.value == 4999
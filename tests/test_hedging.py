@@ -0,0 +1,129 @@
+import itertools
+import threading
+import time
+
+import pytest
+import responses
+
+from regrws.api import constants
+from regrws.api.hedging import HedgingPolicy
+
+from .payloads import POC_PAYLOAD
+
+URL = "https://reg.ote.arin.net/rest/poc/ARIN-HOSTMASTER"
+
+
+def warmed_up(latency=0.01, **kwargs):
+    policy = HedgingPolicy(min_samples=5, min_delay=0.01, **kwargs)
+    for _ in range(5):
+        policy.record(latency)
+    return policy
+
+
+def test_no_hedging_until_enough_samples():
+    policy = HedgingPolicy(min_samples=3)
+    assert policy.delay is None
+    assert policy.run(lambda: 42) == 42
+    assert policy.hedged == 0
+    assert len(policy._latencies) == 1
+
+
+def test_slow_request_is_hedged():
+    policy = warmed_up()
+    calls = itertools.count()
+
+    def func():
+        if next(calls) == 0:
+            time.sleep(0.5)
+            return "slow"
+        return "fast"
+
+    start = time.perf_counter()
+    assert policy.run(func) == "fast"
+    assert time.perf_counter() - start < 0.4
+    assert (policy.hedged, policy.hedge_wins) == (1, 1)
+    policy.shutdown()
+
+
+def test_fast_request_is_not_hedged():
+    policy = warmed_up(latency=0.2)
+    assert policy.run(lambda: "primary") == "primary"
+    assert policy.hedged == 0
+    policy.shutdown()
+
+
+def test_failed_attempt_falls_back_to_the_other():
+    policy = warmed_up()
+    calls = itertools.count()
+    release = threading.Event()
+
+    def func():
+        if next(calls) == 0:
+            release.wait(1)
+            raise ConnectionError("primary")
+        release.set()
+        return "hedge"
+
+    assert policy.run(func) == "hedge"
+    policy.shutdown()
+
+
+def test_every_attempt_failed():
+    policy = warmed_up()
+
+    def func():
+        time.sleep(0.05)
+        raise ConnectionError("down")
+
+    with pytest.raises(ConnectionError):
+        policy.run(func)
+    policy.shutdown()
+
+
+def test_busy_workers_run_on_the_caller_unhedged():
+    policy = warmed_up(max_workers=1)
+    busy = threading.Event()
+    release = threading.Event()
+
+    def occupy():
+        busy.set()
+        release.wait(1)
+        return "background"
+
+    background = threading.Thread(target=policy.run, args=(occupy,))
+    background.start()
+    busy.wait(1)
+    threads = []
+
+    def func():
+        threads.append(threading.current_thread())
+        time.sleep(0.05)
+        return "inline"
+
+    assert policy.run(func) == "inline"
+    assert threads == [threading.current_thread()]
+    assert policy.hedged == 0
+    release.set()
+    background.join()
+    policy.shutdown()
+
+
+def test_api_hedges_gets(make_api):
+    policy = warmed_up()
+    api = make_api(hedging=policy)
+    calls = itertools.count()
+
+    def callback(request):
+        if next(calls) == 0:
+            time.sleep(0.5)
+        return 200, {"Content-Type": constants.CONTENT_TYPE}, POC_PAYLOAD.encode()
+
+    with responses.RequestsMock() as rsps:
+        rsps.add_callback(responses.GET, URL, callback=callback)
+        rsps.add_callback(responses.PUT, URL, callback=callback)
+        poc = api.poc.from_handle("ARIN-HOSTMASTER")
+        assert poc.handle == "ARIN-HOSTMASTER"
+        assert policy.hedged == 1
+        poc.save()
+        assert policy.hedged == 1
+    policy.shutdown()
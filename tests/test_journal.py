@@ -0,0 +1,109 @@
+import pytest
+import requests
+
+from regrws.api import constants
+from regrws.api.journal import Journal
+from regrws.models import Poc
+from regrws.models.customer import Customer
+
+from .payloads import (
+    CUSTOMER_PAYLOAD,
+    ERROR_PAYLOAD,
+    NET_PAYLOAD,
+    POC_PAYLOAD,
+    TICKETED_REQUEST_PAYLOAD,
+)
+
+BASE = "https://reg.ote.arin.net/rest"
+
+
+@pytest.fixture
+def journal(tmp_path):
+    with Journal(tmp_path / "ops.journal", fsync_every=2) as journal:
+        yield journal
+
+
+@pytest.fixture
+def api(make_api, journal):
+    return make_api(journal=journal)
+
+
+def test_mutating_calls_are_journaled(mocked_responses, api, journal):
+    for url, payload, verb in (
+        (f"{BASE}/net/NET-10-0-0-0-1", NET_PAYLOAD, mocked_responses.get),
+        (
+            f"{BASE}/net/NET-10-0-0-0-1/reassign",
+            TICKETED_REQUEST_PAYLOAD,
+            mocked_responses.put,
+        ),
+        (
+            f"{BASE}/net/NET-10-0-0-0-1/customer",
+            CUSTOMER_PAYLOAD,
+            mocked_responses.post,
+        ),
+    ):
+        verb(
+            f"{url}?apikey=APIKEY",
+            body=payload.encode(),
+            status=200,
+            content_type=constants.CONTENT_TYPE,
+        )
+    net = api.net.from_handle("NET-10-0-0-0-1")
+    net.reassign(net)
+    api.customer.create_for_net(net, **Customer.from_xml(CUSTOMER_PAYLOAD).model_dump())
+    journal.flush()
+
+    reassign, create = Journal.read(journal.path)
+    assert reassign.operation == "reassign"
+    assert reassign.method == "PUT"
+    assert reassign.url == f"{BASE}/net/NET-10-0-0-0-1/reassign"
+    assert "APIKEY" not in reassign.url
+    assert reassign.payload.startswith("<net ")
+    assert reassign.ticket_no == "TICKETNO"
+    assert reassign.handle == "NET-10-0-0-0-1"
+    assert reassign.status == 200
+    assert not reassign.pending
+    assert create.operation == "create_for_net"
+    assert create.handle == "C1241523"
+
+
+def test_errors_are_journaled(mocked_responses, api, journal):
+    mocked_responses.put(
+        f"{BASE}/poc/ARIN-HOSTMASTER?apikey=APIKEY",
+        body=ERROR_PAYLOAD.encode(),
+        status=400,
+        content_type=constants.CONTENT_TYPE,
+    )
+    mocked_responses.delete(
+        f"{BASE}/poc/ARIN-HOSTMASTER?apikey=APIKEY",
+        body=b"",
+        status=500,
+    )
+    poc = Poc.from_xml(POC_PAYLOAD)
+    poc.manager = api.poc
+    poc.save()
+    with pytest.raises(requests.HTTPError):
+        poc.delete()
+    journal.flush()
+
+    save, delete = Journal.read(journal.path)
+    assert (save.operation, save.status, save.error_code) == (
+        "save",
+        400,
+        "E_SCHEMA_VALIDATION",
+    )
+    assert delete.status == 500
+    assert delete.exception.startswith("HTTPError")
+
+
+def test_pending_entries_after_crash(journal):
+    journal.intent("reassign", "PUT", f"{BASE}/net/NET-1/reassign", b"<net/>")
+    done = journal.intent("save", "PUT", f"{BASE}/poc/P-ARIN", b"<poc/>")
+    journal.outcome(done, status=200)
+    journal.close()
+    with open(journal.path, "a") as f:
+        f.write('{"type": "outcome", "id": ')  # torn write
+
+    entries = list(Journal.read(journal.path))
+    assert [e.operation for e in entries if e.pending] == ["reassign"]
+    assert entries[0].payload == "<net/>"
@@ -0,0 +1,163 @@
+import responses
+
+from regrws.api import constants
+from regrws.cache import NetRangeCache, net_range
+from regrws.models import Net
+from regrws.models.net import NetBlock
+
+from .payloads import NET_PAYLOAD, TICKETED_REQUEST_PAYLOAD
+
+BASE = "https://reg.ote.arin.net/rest"
+TEMPLATE = Net.from_xml(NET_PAYLOAD.encode())
+
+
+def make_net(handle, start, cidr_length):
+    block = NetBlock(type="S", start_address=start, cidr_length=cidr_length)
+    return TEMPLATE.model_copy(update={"handle": handle, "net_blocks": [block]})
+
+
+PARENT = make_net("NET-10-0-0-0-1", "10.0.0.0", 16)
+
+
+def test_net_range():
+    assert net_range(PARENT) == (4, 0x0A000000, 0x0A00FFFF)
+    assert net_range(TEMPLATE) == (4, 0x0A000000, 0x0A0000FF)
+    assert net_range(TEMPLATE.model_copy(update={"net_blocks": None})) is None
+
+
+def test_answers_repeated_and_wider_queries():
+    cache = NetRangeCache()
+    cache.put("find_net", "10.0.1.0", "10.0.1.255", PARENT)
+    assert cache.get("find_net", "010.000.001.000", "010.000.001.255") == PARENT
+    # any net inside the parent containing the wider range would contain 10.0.1/24
+    assert cache.get("find_net", "10.0.0.0", "10.0.3.255").handle == PARENT.handle
+    assert cache.get("find_net", "10.0.1.0", "10.0.1.127") is None
+    assert cache.get("find_net", "10.0.0.0", "10.1.255.255") is None
+    assert cache.get("find_parent", "10.0.1.0", "10.0.1.255") is None
+    assert (cache.hits, cache.misses) == (2, 3)
+
+
+def test_answers_are_copies():
+    cache = NetRangeCache()
+    cache.put("find_net", "10.0.1.0", "10.0.1.255", PARENT)
+    cache.get("find_net", "10.0.1.0", "10.0.1.255").net_name = "CHANGED"
+    assert cache.get("find_net", "10.0.1.0", "10.0.1.255").net_name == "NETNAME"
+
+
+def test_a_range_is_not_its_own_parent():
+    cache = NetRangeCache()
+    cache.put("find_parent", "10.0.1.0", "10.0.1.255", PARENT)
+    assert cache.get("find_parent", "10.0.0.0", "10.0.127.255") == PARENT
+    assert cache.get("find_parent", "10.0.0.0", "10.0.255.255") is None
+
+
+def test_expiry():
+    cache = NetRangeCache(ttl=0)
+    cache.put("find_net", "10.0.1.0", "10.0.1.255", PARENT)
+    assert cache.get("find_net", "10.0.1.0", "10.0.1.255") is None
+    assert len(cache) == 0
+
+
+def test_trust_known_children():
+    cache = NetRangeCache(trust_known=True)
+    child = make_net("NET-10-0-8-0-1", "10.0.8.0", 22)
+    cache.put("find_net", "10.0.1.0", "10.0.1.255", PARENT)
+    cache.put("find_net", "10.0.8.0", "10.0.8.255", child)
+    assert cache.get("find_net", "10.0.2.0", "10.0.2.127") == PARENT
+    assert cache.get("find_net", "10.0.9.0", "10.0.9.255") == child
+    # the child lies within the queried range: still the parent
+    assert cache.get("find_net", "10.0.0.0", "10.0.15.255") == PARENT
+    assert cache.get("find_parent", "10.0.8.0", "10.0.11.255") == PARENT
+    # overlapping the child only partially: no provable answer
+    assert cache.get("find_net", "10.0.10.0", "10.0.13.255") is None
+
+
+def test_registration_blocks_inference():
+    cache = NetRangeCache(trust_known=True)
+    cache.put("find_net", "10.0.1.0", "10.0.1.255", PARENT)
+    cache.put("find_net", "10.0.3.0", "10.0.3.255", PARENT)
+    cache.invalidate(make_net(None, "10.0.1.0", 24), registered=True)
+    assert cache.get("find_net", "10.0.1.0", "10.0.1.127") is None
+    # answers not overlapping the new net are kept
+    assert cache.get("find_net", "10.0.3.0", "10.0.3.255") == PARENT
+    assert cache.get("find_net", "10.0.4.0", "10.0.4.255") == PARENT
+
+
+def test_invalidating_a_net_drops_it():
+    cache = NetRangeCache()
+    cache.put("find_net", "10.0.1.0", "10.0.1.255", PARENT)
+    cache.invalidate(PARENT.model_copy(update={"net_blocks": None}))
+    assert len(cache) == 0
+    cache.put("find_net", "10.0.1.0", "10.0.1.255", PARENT)
+    cache.invalidate(PARENT)
+    assert cache.get("find_net", "10.0.1.0", "10.0.1.255") is None
+
+
+def test_manager_uses_and_invalidates_the_cache(make_api):
+    api = make_api(net_cache=NetRangeCache())
+    with responses.RequestsMock() as rsps:
+        lookup = rsps.get(
+            f"{BASE}/net/mostSpecificNet/10.0.0.0/10.0.0.127",
+            body=NET_PAYLOAD.encode(),
+            content_type=constants.CONTENT_TYPE,
+        )
+        rsps.put(
+            f"{BASE}/net/NET-10-0-0-0-1/reassign",
+            body=TICKETED_REQUEST_PAYLOAD.encode(),
+            content_type=constants.CONTENT_TYPE,
+        )
+        net = api.net.find_net("10.0.0.0", "10.0.0.127")
+        cached = api.net.find_net("10.0.0.0", "10.0.0.127")
+        assert cached == net
+        assert cached.manager is api.net
+        assert lookup.call_count == 1
+
+        net.reassign(make_net(None, "10.0.0.0", 25))
+        api.net.find_net("10.0.0.0", "10.0.0.127")
+        assert lookup.call_count == 2
+
+
+def test_many_adjacent_nets():
+    cache = NetRangeCache(maxsize=300, trust_known=True)
+    cache.put("find_net", "10.0.0.0", "10.0.0.255", PARENT)
+    for index in range(1, 256):
+        child = make_net(f"NET-10-0-{index}-0-1", f"10.0.{index}.0", 24)
+        cache.put("find_net", f"10.0.{index}.0", f"10.0.{index}.255", child)
+    assert cache.get("find_net", "10.0.7.0", "10.0.7.127").handle == "NET-10-0-7-0-1"
+    assert cache.get("find_net", "10.0.0.0", "10.0.0.127") == PARENT
+    # crossing children
+    assert cache.get("find_net", "10.0.7.128", "10.0.8.127") is None
+    # covering children entirely
+    assert cache.get("find_net", "10.0.8.0", "10.0.11.255") == PARENT
+
+    # the least recently used entries are evicted from the index as well
+    for index in range(100):
+        other = make_net(f"NET-10-1-{index}-0-1", f"10.1.{index}.0", 24)
+        cache.put("find_net", f"10.1.{index}.0", f"10.1.{index}.255", other)
+    assert len(cache) == 300
+    assert sum(len(handles) for handles in cache._handles.values()) == 300
+    assert cache.get("find_net", "10.0.7.0", "10.0.7.127") is None
+    assert cache.get("find_net", "10.0.200.0", "10.0.200.127") is not None
+    cache.clear()
+    assert cache.get("find_net", "10.0.7.0", "10.0.7.127") is None
+    assert not cache._handles and not cache._starts
+
+
+def test_queries_kept_per_net_are_bounded():
+    cache = NetRangeCache(maxsize=10, max_queries=16)
+    parent = make_net("NET-10-0-0-0-1", "10.0.0.0", 8)
+    cache.put("find_net", "10.0.0.0", "10.0.255.255", parent)
+    # a narrower query makes the wider one redundant, and the other way round
+    cache.put("find_net", "10.0.1.0", "10.0.1.255", parent)
+    cache.put("find_net", "10.0.0.0", "10.0.3.255", parent)
+    (known,) = cache._known.values()
+    assert len(known.queries["find_net"]) == 1
+
+    for index in range(8000):
+        prefix = f"10.{index // 256}.{index % 256}"
+        cache.put("find_net", f"{prefix}.0", f"{prefix}.255", parent)
+    assert len(cache) == 1
+    assert len(known.queries["find_net"]) == 16
+    # the most recent answers are kept
+    assert cache.get("find_net", "10.31.63.0", "10.31.63.255").handle == parent.handle
+    assert cache.get("find_net", "10.0.2.0", "10.0.2.255") is None
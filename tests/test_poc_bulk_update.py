@@ -0,0 +1,91 @@
+import pytest
+import responses
+
+from regrws.api import Api, constants
+from regrws.api.bulk import Summary
+from regrws.models import Error, Poc
+from regrws.models.validation import InvalidPayloadError, PayloadValidator
+
+from .payloads import ERROR_PAYLOAD, POC_PAYLOAD
+
+BASE = "https://reg.ote.arin.net/rest"
+HANDLES = ["ALICE-ARIN", "BOB-ARIN", "CAROL-ARIN", "DAVE-ARIN"]
+
+
+def make_api():
+    return Api(api_key="APIKEY", base_url="https://reg.ote.arin.net/")
+
+
+ROLE_PAYLOAD = POC_PAYLOAD.replace("PERSON", "ROLE").replace(
+    "<firstName>FIRSTNAME</firstName>", ""
+)
+
+
+def poc_payload(handle, email, payload=POC_PAYLOAD):
+    return payload.replace("ARIN-HOSTMASTER", handle).replace("you@example.com", email)
+
+
+def leave_company(poc):
+    poc.emails = [email.replace("@old.example", "@new.example") for email in poc.emails]
+    poc.company_name = None
+
+
+def test_invalid_role_pocs_are_rejected():
+    validator = PayloadValidator()
+    role = Poc.from_xml(ROLE_PAYLOAD.encode())
+    validator.check(role)
+    role.first_name = "FIRSTNAME"
+    with pytest.raises(InvalidPayloadError) as raised:
+        validator.check(role)
+    assert "`first_name` must be left blank" in str(raised.value)
+    assert len(raised.value.errors) == 1
+
+
+def test_bulk_update():
+    with responses.RequestsMock() as rsps:
+        rsps.get(
+            f"{BASE}/poc/ALICE-ARIN",
+            body=poc_payload("ALICE-ARIN", "alice@old.example").encode(),
+            content_type=constants.CONTENT_TYPE,
+        )
+        rsps.get(
+            f"{BASE}/poc/BOB-ARIN",
+            body=poc_payload("BOB-ARIN", "bob@other.example")
+            .replace("<companyName>COMPANYNAME</companyName>", "")
+            .encode(),
+            content_type=constants.CONTENT_TYPE,
+        )
+        rsps.get(
+            f"{BASE}/poc/CAROL-ARIN",
+            body=poc_payload("CAROL-ARIN", "carol@old.example", ROLE_PAYLOAD).encode(),
+            content_type=constants.CONTENT_TYPE,
+        )
+        rsps.get(
+            f"{BASE}/poc/DAVE-ARIN",
+            body=ERROR_PAYLOAD.encode(),
+            status=404,
+            content_type=constants.CONTENT_TYPE,
+        )
+        save = rsps.put(
+            f"{BASE}/poc/ALICE-ARIN",
+            body=poc_payload("ALICE-ARIN", "alice@new.example").encode(),
+            content_type=constants.CONTENT_TYPE,
+        )
+        results = make_api().poc.bulk_update(HANDLES, leave_company, max_workers=4)
+        assert save.call_count == 1
+        assert b"alice@new.example" in save.calls[0].request.body
+
+    alice, bob, carol, dave = results
+    assert (alice.changed, alice.value.emails) == (True, ["alice@new.example"])
+    assert (bob.changed, bob.ok) == (False, True)
+    # ROLE POCs require a company name
+    assert isinstance(carol.exception, InvalidPayloadError)
+    assert carol.changed is None
+    assert isinstance(dave.value, Error)
+
+    summary = Summary()
+    for result in results:
+        summary.add(result)
+    report = summary.as_dict()
+    assert (report["succeeded"], report["failed"]) == (2, 2)
+    assert (report["changed"], report["unchanged"]) == (1, 1)
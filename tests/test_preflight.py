@@ -0,0 +1,178 @@
+import pytest
+import requests
+import responses
+
+from regrws.api import constants
+from regrws.api.deadline import Deadline, DeadlineExceeded
+from regrws.api.journal import Journal
+from regrws.api.preflight import ConflictError, Preflight
+from regrws.models import Net
+from regrws.models.net import NetBlock
+
+from .payloads import ERROR_PAYLOAD, NET_PAYLOAD, TICKETED_REQUEST_PAYLOAD
+
+BASE = "https://reg.ote.arin.net/rest"
+TEMPLATE = Net.from_xml(NET_PAYLOAD.encode())
+REASSIGN_URL = f"{BASE}/net/NET-10-0-0-0-1/reassign"
+
+
+def make_net(handle, start, cidr_length):
+    block = NetBlock(type="S", start_address=start, cidr_length=cidr_length)
+    return TEMPLATE.model_copy(
+        update={"handle": handle, "net_blocks": [block], "parent_net_handle": None}
+    )
+
+
+PARENT = make_net("NET-10-0-0-0-1", "10.0.0.0", 16)
+
+
+def test_rejects_nets_outside_of_the_parent():
+    preflight = Preflight()
+    with pytest.raises(ConflictError) as raised:
+        preflight.reserve(PARENT, make_net(None, "10.1.0.0", 24))
+    assert raised.value.parent == PARENT.handle
+    assert "10.1.0.0-10.1.0.255 is outside of 10.0.0.0-10.0.255.255" in str(
+        raised.value
+    )
+    with pytest.raises(ConflictError):
+        preflight.reserve(PARENT, make_net(None, "10.0.0.0", 15))
+    with pytest.raises(ConflictError):
+        preflight.reserve(PARENT, make_net(None, "2001:db8::", 48))
+    assert len(preflight) == 0
+
+
+def test_rejects_overlapping_children():
+    preflight = Preflight()
+    preflight.add(make_net("NET-10-0-4-0-1", "10.0.4.0", 22), PARENT.handle)
+    preflight.reserve(PARENT, make_net(None, "10.0.1.0", 24))
+    preflight.reserve(PARENT, make_net(None, "10.0.8.0", 24))
+    for start, cidr_length in (
+        ("10.0.1.0", 24),  # reserved above
+        ("10.0.1.128", 25),  # within a reserved one
+        ("10.0.5.0", 24),  # within a known child
+        ("10.0.0.0", 21),  # covering children
+    ):
+        with pytest.raises(ConflictError, match="overlaps"):
+            preflight.reserve(PARENT, make_net(None, start, cidr_length))
+    preflight.reserve(PARENT, make_net(None, "10.0.2.0", 23))
+    assert len(preflight) == 4
+
+
+def test_release():
+    preflight = Preflight()
+    net = make_net(None, "10.0.1.0", 24)
+    preflight.reserve(PARENT, net)
+    preflight.release(PARENT, net)
+    preflight.reserve(PARENT, net)
+
+
+def test_add_requires_a_parent():
+    with pytest.raises(ValueError):
+        Preflight().add(make_net("NET-10-0-1-0-1", "10.0.1.0", 24))
+
+
+def test_load_journal(tmp_path):
+    path = tmp_path / "reassign.journal"
+    with Journal(path) as journal:
+        for start, status in (("10.0.1.0", 200), ("10.0.2.0", 400), ("10.0.3.0", 0)):
+            payload = make_net(None, start, 24).to_xml(skip_empty=True)
+            entry_id = journal.intent("reassign", "PUT", REASSIGN_URL, payload)
+            if status:
+                journal.outcome(entry_id, status=status)
+        journal.intent("save", "PUT", f"{BASE}/net/NET-10-0-0-0-1", payload)
+    preflight = Preflight()
+    assert preflight.load_journal(path) == 2
+    for start in ("10.0.1.0", "10.0.3.0"):
+        with pytest.raises(ConflictError):
+            preflight.reserve(PARENT, make_net(None, start, 24))
+    # rejected by ARIN
+    preflight.reserve(PARENT, make_net(None, "10.0.2.0", 24))
+
+
+def test_reassign_checks_before_sending(make_api):
+    preflight = Preflight()
+    api = make_api(preflight=preflight)
+    parent = PARENT.model_copy()
+    parent.manager = api.net
+    with responses.RequestsMock() as rsps:
+        reassign = rsps.put(
+            REASSIGN_URL,
+            body=TICKETED_REQUEST_PAYLOAD.encode(),
+            content_type=constants.CONTENT_TYPE,
+        )
+        parent.reassign(make_net(None, "10.0.1.0", 24))
+        with pytest.raises(ConflictError):
+            parent.reassign(make_net(None, "10.0.1.0", 25))
+        with pytest.raises(ConflictError):
+            parent.reallocate(make_net(None, "192.0.2.0", 24).to_payload())
+        assert reassign.call_count == 1
+
+        # a rejected reassignment frees its range
+        rsps.replace(
+            responses.PUT,
+            REASSIGN_URL,
+            body=ERROR_PAYLOAD.encode(),
+            status=400,
+            content_type=constants.CONTENT_TYPE,
+        )
+        parent.reassign(make_net(None, "10.0.2.0", 24))
+        assert len(preflight) == 1
+
+
+def test_failed_sends_keep_the_reservation(make_api):
+    preflight = Preflight()
+    api = make_api(preflight=preflight)
+    parent = PARENT.model_copy()
+    parent.manager = api.net
+    with responses.RequestsMock() as rsps:
+        rsps.put(REASSIGN_URL, body=requests.ConnectionError("reset"))
+        with pytest.raises(requests.ConnectionError):
+            parent.reassign(make_net(None, "10.0.1.0", 24))
+    # the request may have been applied: the range stays reserved
+    assert len(preflight) == 1
+    with pytest.raises(ConflictError):
+        preflight.reserve(PARENT, make_net(None, "10.0.1.0", 24))
+
+
+def failing_intent(self, *args):
+    raise OSError("disk full")
+
+
+@pytest.mark.parametrize("failure", ("deadline", "journal"))
+def test_failures_before_sending_release_the_reservation(
+    make_api, mocked_responses, monkeypatch, tmp_path, failure
+):
+    preflight = Preflight()
+    with Journal(tmp_path / "ops.journal") as journal:
+        api = make_api(preflight=preflight, journal=journal)
+        parent = PARENT.model_copy()
+        parent.manager = api.net
+        if failure == "journal":
+            monkeypatch.setattr(Journal, "intent", failing_intent)
+        with (
+            pytest.raises((DeadlineExceeded, OSError)),
+            Deadline(0 if failure == "deadline" else 60),
+        ):
+            parent.reassign(make_net(None, "10.0.1.0", 24))
+        monkeypatch.undo()
+        assert len(preflight) == 0
+
+        mocked_responses.put(
+            REASSIGN_URL,
+            body=TICKETED_REQUEST_PAYLOAD.encode(),
+            content_type=constants.CONTENT_TYPE,
+        )
+        parent.reassign(make_net(None, "10.0.1.0", 24))
+    assert len(preflight) == 1
+
+
+def test_connect_timeouts_release_the_reservation(make_api, mocked_responses):
+    preflight = Preflight()
+    api = make_api(preflight=preflight)
+    parent = PARENT.model_copy()
+    parent.manager = api.net
+    mocked_responses.put(REASSIGN_URL, body=requests.ConnectTimeout("unreachable"))
+    with pytest.raises(requests.ConnectTimeout):
+        parent.reassign(make_net(None, "10.0.1.0", 24))
+    # never connected: nothing was sent
+    assert len(preflight) == 0
@@ -0,0 +1,78 @@
+import time
+
+import pytest
+import responses
+
+from regrws.api import constants
+from regrws.api.profiling import Profiler, phase
+from regrws.models import Poc
+
+from .payloads import POC_PAYLOAD
+
+
+def test_nested_phases_are_exclusive():
+    profiler = Profiler(sample_rate=1)
+    with profiler.call("op") as sample, phase("network"):
+        time.sleep(0.02)
+        with phase("parse"):
+            time.sleep(0.02)
+    assert sample.phases["parse"] >= 0.02
+    assert 0.02 <= sample.phases["network"] < 0.04
+
+
+def test_sample_rate():
+    never, always = Profiler(sample_rate=0), Profiler(sample_rate=1)
+    for _ in range(10):
+        with never.call("op") as sample:
+            assert sample is None
+        with always.call("op") as sample:
+            assert sample is not None
+    assert never.calls == always.calls == 10
+    assert never.report() == {}
+    assert always.report()["op"]["samples"] == 10
+    with pytest.raises(ValueError):
+        Profiler(sample_rate=2)
+
+
+def test_phase_outside_of_a_sample():
+    with phase("network"):
+        pass
+
+
+def test_report_window_and_reset():
+    profiler = Profiler(sample_rate=1, window=3)
+    for _ in range(5):
+        with profiler.call("op"), phase("network"):
+            pass
+    report = profiler.report()["op"]
+    assert report["samples"] == 3
+    assert set(report["total"]) == {"mean", "p50", "p95"}
+    assert set(report["phases"]["network"]) == {"mean", "p50", "p95", "share"}
+    profiler.reset()
+    assert profiler.report() == {}
+
+
+def test_api_records_phases_per_operation(make_api):
+    profiler = Profiler(sample_rate=1)
+    api = make_api(profiler=profiler)
+    with responses.RequestsMock() as rsps:
+        for method in (responses.GET, responses.PUT):
+            rsps.add(
+                method,
+                "https://reg.ote.arin.net/rest/poc/ARIN-HOSTMASTER",
+                body=POC_PAYLOAD.encode(),
+                content_type=constants.CONTENT_TYPE,
+            )
+        poc = api.poc.from_handle("ARIN-HOSTMASTER")
+        assert isinstance(poc, Poc)
+        poc.save()
+    report = profiler.report()
+    assert set(report) == {"from_handle", "save"}
+    phases = report["save"]["phases"]
+    assert {"serialize", "session", "network", "copy", "parse", "validate"} <= set(
+        phases
+    )
+    assert "serialize" not in report["from_handle"]["phases"]
+    assert sum(phase["share"] for phase in phases.values()) == pytest.approx(
+        1, abs=0.01
+    )
@@ -1,6 +1,5 @@
 import pytest
 import requests
-import responses
 from pydantic import ValidationError
 
 from regrws.api import constants
@@ -28,12 +27,6 @@ def test_invalid_model(cov):
     exc.match("type=missing")
 
 
-@pytest.fixture
-def mocked_responses():
-    with responses.RequestsMock() as rsps:
-        yield rsps
-
-
 def test_requests_wrapper(mocked_responses):
     mocked_responses.get(
         "https://reg.ote.arin.net/rest/org/ARIN?apikey=APIKEY",
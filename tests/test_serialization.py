@@ -0,0 +1,120 @@
+import pydantic
+import pytest
+import responses
+
+from regrws.api import Api, constants
+from regrws.cache import LRUCache
+from regrws.models import Net, Poc
+from regrws.models.base import _payloads
+from regrws.models.net import NetBlock
+from regrws.models.template import PayloadTemplate
+
+from .payloads import NET_PAYLOAD, POC_PAYLOAD, TICKETED_REQUEST_PAYLOAD
+
+BLOCK = NetBlock(type="S", start_address="10.1.0.0", cidr_length=24)
+
+
+def to_xml(instance):
+    return instance.to_xml(encoding="UTF-8", skip_empty=True)
+
+
+@pytest.fixture
+def net():
+    return Net.from_xml(NET_PAYLOAD.encode())
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c"), len(cache)) == (1, 3, 2)
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_payload_is_memoized(net):
+    _payloads.clear()
+    assert net.to_payload() == to_xml(net)
+    assert net.to_payload() is net.to_payload()
+    assert Net.from_xml(NET_PAYLOAD.encode()).to_payload() is net.to_payload()
+    assert _payloads.misses == 1
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    (
+        lambda net: setattr(net, "net_name", "RENAMED"),
+        lambda net: net.net_blocks.append(BLOCK),
+        lambda net: setattr(net.net_blocks[0], "cidr_length", 25),
+    ),
+)
+def test_mutation_changes_payload(net, mutate):
+    before = net.to_payload()
+    mutate(net)
+    assert net.to_payload() != before
+    assert net.to_payload() == to_xml(net)
+
+
+def test_payload_is_keyed_by_model():
+    poc = Poc.from_xml(POC_PAYLOAD.encode())
+    assert poc.to_payload() == to_xml(poc)
+
+
+def test_template_renders_like_to_xml(net):
+    template = PayloadTemplate(net, ["net_blocks", "customer_handle"])
+    assert template.render() == to_xml(net)
+    patched = net.model_copy(update={"net_blocks": [BLOCK], "customer_handle": "C1"})
+    assert template.render(net_blocks=[BLOCK], customer_handle="C1") == to_xml(patched)
+    cleared = net.model_copy(update={"net_blocks": None})
+    assert template.render(net_blocks=None) == to_xml(cleared)
+
+
+def test_template_validates(net):
+    template = PayloadTemplate(net, ["customer_handle"])
+    with pytest.raises(ValueError, match="Not patched"):
+        template.render(net_name="OTHER")
+    with pytest.raises(pydantic.ValidationError):
+        template.render(customer_handle=None)
+
+
+@pytest.mark.parametrize(
+    ("fields", "message"),
+    ((["unknown"], "no field"), (["org_handle"], "must be set")),
+)
+def test_invalid_template(net, fields, message):
+    with pytest.raises(ValueError, match=message):
+        PayloadTemplate(net, fields)
+
+
+def test_reassign_rendered_payload(net):
+    api = Api(api_key="APIKEY", base_url="https://reg.ote.arin.net/")
+    net.manager = api.net
+    payload = PayloadTemplate(net, ["net_blocks"]).render(net_blocks=[BLOCK])
+    with responses.RequestsMock() as rsps:
+        rsps.put(
+            "https://reg.ote.arin.net/rest/net/NET-10-0-0-0-1/reassign",
+            body=TICKETED_REQUEST_PAYLOAD.encode(),
+            content_type=constants.CONTENT_TYPE,
+        )
+        assert net.reassign(payload)
+        assert rsps.calls[0].request.body == payload
+
+
+def test_parse_cache_reuses_identical_content():
+    cache = LRUCache(16)
+    api = Api(api_key="APIKEY", base_url="https://reg.ote.arin.net/", parse_cache=cache)
+    with responses.RequestsMock() as rsps:
+        rsps.get(
+            "https://reg.ote.arin.net/rest/poc/ARIN-HOSTMASTER",
+            body=POC_PAYLOAD.encode(),
+            content_type=constants.CONTENT_TYPE,
+        )
+        first = api.poc.from_handle("ARIN-HOSTMASTER")
+        first.city = "Elsewhere"
+        second = api.poc.from_handle("ARIN-HOSTMASTER")
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert second is not first
+    assert second.model_dump() == Poc.from_xml(POC_PAYLOAD.encode()).model_dump()
+    assert second.manager.api is api
@@ -0,0 +1,58 @@
+import itertools
+import threading
+
+from regrws.api.bulk import Result, Summary, iter_concurrently
+from regrws.api.concurrency import Priority, current_priority, priority
+
+
+class Counter:
+    def __init__(self):
+        self.read = 0
+        self.called = 0
+        self._lock = threading.Lock()
+
+    def items(self):
+        for item in itertools.count():
+            self.read += 1
+            yield item
+
+    def double(self, item):
+        with self._lock:
+            self.called += 1
+        return item * 2
+
+
+def test_inputs_are_read_lazily():
+    counter = Counter()
+    results = iter_concurrently(counter.double, counter.items(), 2, window=4)
+    values = [result.value for result in itertools.islice(results, 10)]
+    assert values == [item * 2 for item in range(10)]
+    # the window, plus one item read to refill it per result yielded
+    assert counter.read == 14
+    results.close()
+    assert counter.called <= 14
+
+
+def test_default_window():
+    counter = Counter()
+    results = iter_concurrently(counter.double, counter.items(), max_workers=3)
+    next(results)
+    assert counter.read == 7
+    results.close()
+
+
+def test_context_is_copied_on_call():
+    with priority(Priority.BULK):
+        results = iter_concurrently(lambda _: current_priority(), range(3))
+    assert [result.value for result in results] == [Priority.BULK] * 3
+
+
+def test_summary_memory_is_bounded():
+    summary = Summary(sample_size=100, seed=1)
+    for index in range(10000):
+        summary.add(Result(index, elapsed=index / 10000))
+    assert len(summary.latencies) == 100
+    report = summary.as_dict()
+    assert report["count"] == 10000
+    assert report["max"] == 0.9999
+    assert 0.4 < report["p50"] < 0.6
@@ -0,0 +1,57 @@
+import threading
+
+import pytest
+import responses
+
+from regrws.api import constants
+from regrws.api.bulk import run_concurrently
+from regrws.api.deadline import Deadline, current_deadline
+from regrws.cache import LRUCache
+
+from .payloads import POC_PAYLOAD
+
+
+@pytest.fixture
+def api(make_api):
+    return make_api(parse_cache=LRUCache(4))
+
+
+def test_concurrent_from_handle(api):
+    with responses.RequestsMock() as rsps:
+        rsps.get(
+            "https://reg.ote.arin.net/rest/poc/ARIN-HOSTMASTER?apikey=APIKEY",
+            body=POC_PAYLOAD.encode(),
+            content_type=constants.CONTENT_TYPE,
+        )
+        results = run_concurrently(
+            lambda _: api.poc.from_handle("ARIN-HOSTMASTER"), range(64), 16
+        )
+    instances = [result.value for result in results]
+    assert all(result.ok for result in results)
+    assert len({id(instance) for instance in instances}) == 64
+    assert all(instance.manager is api.poc for instance in instances)
+
+
+def test_managers_are_shared(api):
+    assert api.manager_for(api.poc.model) is api.poc
+    with pytest.raises(TypeError):
+        api.poc.url_params["apikey"] = "OTHER"
+
+
+def test_deadline_entered_by_several_threads():
+    deadline = Deadline(10)
+    barrier = threading.Barrier(8)
+    seen = []
+
+    def enter():
+        with deadline:
+            barrier.wait()
+            seen.append(current_deadline())
+        seen.append(current_deadline())
+
+    threads = [threading.Thread(target=enter) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert seen.count(deadline) == 8 and seen.count(None) == 8
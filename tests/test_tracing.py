@@ -0,0 +1,145 @@
+import contextlib
+import contextvars
+import time
+
+import pytest
+import responses
+from requests import HTTPError
+
+from regrws.api import Api, constants
+from regrws.api.hedging import HedgingPolicy
+from regrws.models import Net
+
+from .payloads import ERROR_PAYLOAD, NET_PAYLOAD, POC_PAYLOAD
+
+BASE = "https://reg.ote.arin.net/rest"
+
+
+class FakeSpan:
+    def __init__(self, name, parent, attributes):
+        self.name = name
+        self.parent = parent
+        self.attributes = dict(attributes)
+        self.exception = None
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+
+class FakeTracer:
+    """Records spans and their parents, like an in-memory exporter would."""
+
+    def __init__(self):
+        self.spans = []
+        self._current = contextvars.ContextVar("current", default=None)
+
+    @contextlib.contextmanager
+    def start_as_current_span(self, name, attributes=None, **kwargs):
+        span = FakeSpan(name, self._current.get(), attributes or {})
+        self.spans.append(span)
+        token = self._current.set(span)
+        try:
+            yield span
+        except Exception as exc:
+            span.exception = exc
+            raise
+        finally:
+            self._current.reset(token)
+
+    def named(self, name):
+        return [span for span in self.spans if span.name == name]
+
+
+def make_api(tracer, **kwargs):
+    return Api(
+        api_key="APIKEY",
+        base_url="https://reg.ote.arin.net/",
+        tracer=tracer,
+        **kwargs,
+    )
+
+
+@responses.activate
+def test_span_per_operation_with_attempt_child():
+    responses.get(
+        f"{BASE}/poc/ARIN-HOSTMASTER",
+        body=POC_PAYLOAD.encode(),
+        content_type=constants.CONTENT_TYPE,
+    )
+    tracer = FakeTracer()
+    make_api(tracer).poc.from_handle("arin-hostmaster")
+    operation, attempt = tracer.spans
+    assert operation.name == "Poc.from_handle"
+    assert operation.parent is None
+    assert operation.attributes["regrws.endpoint"] == "/poc"
+    assert operation.attributes["regrws.handle"] == "ARIN-HOSTMASTER"
+    assert operation.attributes["http.response.status_code"] == 200
+    assert operation.attributes["regrws.response.size"] == len(POC_PAYLOAD.encode())
+    assert operation.attributes["regrws.parse.duration"] >= 0
+    assert attempt.name == "GET"
+    assert attempt.parent is operation
+    assert attempt.attributes["url.full"] == f"{BASE}/poc/ARIN-HOSTMASTER"
+    assert attempt.attributes["http.response.status_code"] == 200
+    assert "http.request.body.size" not in attempt.attributes
+
+
+@responses.activate
+def test_error_code_and_payload_sizes():
+    net = Net.from_xml(NET_PAYLOAD.encode())
+    responses.put(
+        f"{BASE}/net/{net.handle}/reassign",
+        body=ERROR_PAYLOAD.encode(),
+        status=400,
+        content_type=constants.CONTENT_TYPE,
+    )
+    tracer = FakeTracer()
+    api = make_api(tracer)
+    net.manager = api.net
+    net.reassign(net)
+    (operation,) = tracer.named("Net.reassign")
+    assert operation.attributes["regrws.error.code"] == "E_SCHEMA_VALIDATION"
+    assert operation.attributes["regrws.request.size"] > 0
+    (attempt,) = tracer.named("PUT")
+    size = operation.attributes["regrws.request.size"]
+    assert attempt.attributes["http.request.body.size"] == size
+    assert attempt.attributes["http.response.status_code"] == 400
+
+
+@responses.activate
+def test_exceptions_are_left_to_the_tracer():
+    responses.get(f"{BASE}/poc/UNKNOWN", status=500)
+    tracer = FakeTracer()
+    with pytest.raises(HTTPError) as raised:
+        make_api(tracer).poc.from_handle("UNKNOWN")
+    operation, attempt = tracer.spans
+    assert operation.exception is raised.value
+    assert attempt.exception is None
+    assert attempt.attributes["http.response.status_code"] == 500
+
+
+def test_hedged_attempts_are_children_of_the_operation():
+    policy = HedgingPolicy(min_samples=5, min_delay=0.01)
+    for _ in range(5):
+        policy.record(0.01)
+
+    def slow_then_fast(request):
+        if not slow_then_fast.called:
+            slow_then_fast.called = True
+            time.sleep(0.2)
+        return 200, {}, NET_PAYLOAD.encode()
+
+    slow_then_fast.called = False
+    tracer = FakeTracer()
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        rsps.add_callback(
+            responses.GET,
+            f"{BASE}/net/parentNet/10.0.0.0/10.0.0.255",
+            callback=slow_then_fast,
+            content_type=constants.CONTENT_TYPE,
+        )
+        make_api(tracer, hedging=policy).net.find_parent("10.0.0.0", "10.0.0.255")
+    policy.shutdown()
+    (operation,) = tracer.named("Net.find_parent")
+    attempts = tracer.named("GET")
+    assert len(attempts) == 2
+    assert all(attempt.parent is operation for attempt in attempts)
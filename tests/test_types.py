@@ -4,7 +4,7 @@ from ipaddress import IPv4Address, IPv6Address
 
 import pytest
 
-from regrws.models.types import _validate_ip_address
+from regrws.models.types import _parse_ip_string, _validate_ip_address
 
 
 class TestValidateIPAddress:
@@ -39,3 +39,25 @@ class TestValidateIPAddress:
         """Test that completely invalid strings raise ValueError."""
         with pytest.raises(ValueError, match="Invalid IP address"):
             _validate_ip_address("not-an-ip-address")
+
+    def test_zero_padded_octet_out_of_range(self):
+        """Test that padded octets above 255 raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid IP address"):
+            _validate_ip_address("256.000.000.001")
+
+    def test_full_ipv6(self):
+        """Test uncompressed IPv6 address parsing (ARIN format)."""
+        result = _validate_ip_address("2001:0db8:0000:0000:0000:0000:0000:0001")
+        assert result == IPv6Address("2001:db8::1")
+
+    def test_non_string_values(self):
+        """Test that integers and packed bytes are handed to ipaddress."""
+        assert _validate_ip_address(1) == IPv6Address("::1")
+        assert _validate_ip_address(b"\n\x00\x00\x01") == IPv4Address("10.0.0.1")
+
+    def test_repeated_strings_are_memoized(self):
+        """Test that repeated strings return the same cached instance."""
+        _parse_ip_string.cache_clear()
+        first = _validate_ip_address("010.000.000.001")
+        assert _validate_ip_address("010.000.000.001") is first
+        assert _parse_ip_string.cache_info().hits == 1
@@ -0,0 +1,84 @@
+import pytest
+import responses
+
+from regrws.api import constants
+from regrws.api.unit_of_work import UnitOfWork
+
+from .payloads import ERROR_PAYLOAD, NET_PAYLOAD, ORG_PAYLOAD, POC_PAYLOAD
+
+BASE = "https://reg.ote.arin.net/rest"
+
+
+@pytest.fixture
+def mocked_responses():
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        for model, handle, payload in (
+            ("poc", "ARIN-HOSTMASTER", POC_PAYLOAD),
+            ("org", "ARIN", ORG_PAYLOAD),
+            ("net", "NET-10-0-0-0-1", NET_PAYLOAD),
+        ):
+            for verb in (rsps.get, rsps.put):
+                verb(
+                    f"{BASE}/{model}/{handle}?apikey=APIKEY",
+                    body=payload.encode(),
+                    status=200,
+                    content_type=constants.CONTENT_TYPE,
+                )
+        yield rsps
+
+
+def calls(mocked_responses, method):
+    return [c for c in mocked_responses.calls if c.request.method == method]
+
+
+def test_edits_are_coalesced(mocked_responses, api):
+    with UnitOfWork(api) as uow:
+        poc = uow.get(api.poc, "arin-hostmaster")
+        poc.emails.append("noc@example.com")
+        assert uow.get(api.poc, "ARIN-HOSTMASTER") is poc
+        uow.get(api.poc, "ARIN-HOSTMASTER").city = "Reston"
+        org = uow.get(api.org, "ARIN")
+        org.org_name = "NEW NAME"
+        uow.get(api.net, "NET-10-0-0-0-1")
+        assert len(uow.dirty) == 2
+
+    assert len(calls(mocked_responses, "GET")) == 3
+    puts = calls(mocked_responses, "PUT")
+    assert sorted(c.request.url.split("?")[0] for c in puts) == [
+        f"{BASE}/org/ARIN",
+        f"{BASE}/poc/ARIN-HOSTMASTER",
+    ]
+    body = next(c.request.body for c in puts if "/poc/" in c.request.url)
+    assert b"noc@example.com" in body and b"Reston" in body
+
+
+def test_commit_results(mocked_responses, api):
+    uow = UnitOfWork(api)
+    uow.get(api.poc, "ARIN-HOSTMASTER").city = "Reston"
+    results = uow.commit()
+    assert [r.ok for r in results] == [True]
+    assert uow.dirty == []
+    assert uow.commit() == []
+
+
+def test_failed_saves_stay_dirty(mocked_responses, api):
+    mocked_responses.replace(
+        responses.PUT,
+        f"{BASE}/poc/ARIN-HOSTMASTER?apikey=APIKEY",
+        body=ERROR_PAYLOAD.encode(),
+        status=400,
+        content_type=constants.CONTENT_TYPE,
+    )
+    uow = UnitOfWork(api)
+    uow.get(api.poc, "ARIN-HOSTMASTER").city = "Reston"
+    (result,) = uow.commit()
+    assert not result.ok
+    assert len(uow.dirty) == 1
+
+
+def test_rollback_on_exception(mocked_responses, api):
+    with pytest.raises(RuntimeError), UnitOfWork(api) as uow:
+        uow.get(api.poc, "ARIN-HOSTMASTER").city = "Reston"
+        raise RuntimeError
+    assert calls(mocked_responses, "PUT") == []
+    assert uow.dirty == []
@@ -0,0 +1,84 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from regrws.models import Net, Poc
+from regrws.models.net import NetBlock
+from regrws.models.validation import PayloadValidator
+
+from .payloads import NET_PAYLOAD, POC_PAYLOAD
+
+# accepts any <net> of the core namespace, and nothing else
+SCHEMA = """<?xml version="1.0"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"
+    targetNamespace="http://www.arin.net/regrws/core/v1"
+    elementFormDefault="qualified">
+  <xs:element name="net">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:any processContents="skip" minOccurs="0" maxOccurs="unbounded"/>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>
+"""
+
+
+@pytest.fixture
+def net():
+    return Net.from_xml(NET_PAYLOAD.encode())
+
+
+def test_valid_payloads(net):
+    validator = PayloadValidator()
+    assert validator.validate(net) == []
+    assert validator.validate(net.to_payload()) == []
+    assert validator.validate(POC_PAYLOAD.encode()) == []
+
+
+def test_structural_errors():
+    validator = PayloadValidator()
+    broken = NET_PAYLOAD.replace("<version>4</version>", "<version>5</version>")
+    (error,) = validator.validate(broken.encode())
+    assert error.startswith("version:")
+    assert validator.validate(NET_PAYLOAD.encode(), Poc)
+    assert validator.validate(b"<net") != []
+    assert validator.validate(b"<unknown/>") == ["Unsupported payload <unknown>"]
+
+
+def test_validate_many(net):
+    block = NetBlock(type="S", start_address="10.0.0.0", cidr_length=24)
+    payloads = [net, b"<net/>", net.model_copy(update={"net_blocks": [block]})]
+    results = PayloadValidator().validate_many(payloads, max_workers=2)
+    assert [bool(errors) for errors in results] == [False, True, False]
+
+
+def test_schema(tmp_path, net):
+    pytest.importorskip("lxml")
+    schema = tmp_path / "core.xsd"
+    schema.write_text(SCHEMA)
+    validator = PayloadValidator(schema)
+    assert validator.validate(net) == []
+    (error,) = validator.validate(POC_PAYLOAD.encode())
+    assert "No matching global declaration" in error
+    assert validator.validate_many([net] * 8, max_workers=4) == [[]] * 8
+
+
+def test_structural_validation_without_lxml():
+    # pydantic-xml picks its etree implementation once, when imported
+    script = (
+        "from regrws.models.validation import PayloadValidator\n"
+        "from tests.payloads import POC_PAYLOAD\n"
+        "validator = PayloadValidator()\n"
+        "assert validator.validate(POC_PAYLOAD.encode()) == []\n"
+        "assert validator.validate(b'<unknown/>') == ['Unsupported payload <unknown>']\n"
+        "assert validator.validate(b'<net') != []\n"
+    )
+    subprocess.run(
+        [sys.executable, "-c", script],
+        check=True,
+        env={**os.environ, "FORCE_STD_XML": "1"},
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
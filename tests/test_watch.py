@@ -0,0 +1,88 @@
+import threading
+import time
+
+from regrws.api.watch import FieldChange, Watcher, diff
+from regrws.models import Error, Poc
+
+from .payloads import ERROR_PAYLOAD, POC_PAYLOAD
+
+
+class FakeManager:
+    """Serve successive versions of objects, recording when they are fetched."""
+
+    model = Poc
+
+    def __init__(self, versions):
+        self.versions = versions
+        self.fetched = []
+
+    def from_handle(self, handle):
+        self.fetched.append((handle, time.monotonic()))
+        versions = self.versions[handle]
+        version = versions.pop(0) if len(versions) > 1 else versions[0]
+        if isinstance(version, Exception):
+            raise version
+        return version
+
+
+def poc(**changes):
+    return Poc.from_xml(POC_PAYLOAD.encode()).model_copy(update=changes)
+
+
+def test_diff():
+    old = {"a": 1, "b": [{"c": 1}], "d": None}
+    new = {"a": 1, "b": [{"c": 2}, {"c": 3}], "e": "x"}
+    assert diff(old, new) == [
+        FieldChange("b[0].c", 1, 2),
+        FieldChange("b[1]", None, {"c": 3}),
+        FieldChange("e", None, "x"),
+    ]
+    assert diff(old, old) == []
+
+
+def test_reports_changed_fields():
+    manager = FakeManager({"A": [poc(), poc(), poc(city="Elsewhere")], "B": [poc()]})
+    watcher = Watcher([(manager, "A"), (manager, "B")], interval=0.02)
+    changes = list(watcher.watch(cycles=3))
+    assert len(changes) == 1
+    assert (changes[0].handle, changes[0].kind) == ("A", "changed")
+    assert [change.path for change in changes[0].fields] == ["city"]
+    assert changes[0].instance.city == "Elsewhere"
+
+
+def test_reports_errors_once():
+    error = Error.from_xml(ERROR_PAYLOAD.encode())
+    manager = FakeManager(
+        {"A": [poc(), error, ConnectionError("down"), poc(city="Elsewhere")]}
+    )
+    watcher = Watcher([(manager, "A")], interval=0.01)
+    changes = list(watcher.watch(cycles=4))
+    assert [change.kind for change in changes] == ["error", "changed"]
+    assert changes[0].error is error
+    assert [change.path for change in changes[1].fields] == ["city"]
+
+
+def test_spreads_requests_over_the_cycle():
+    manager = FakeManager({handle: [poc()] for handle in "ABCD"})
+    watcher = Watcher([(manager, handle) for handle in "ABCD"], interval=0.2)
+    start = time.monotonic()
+    list(watcher.watch(cycles=1))
+    assert [handle for handle, _ in manager.fetched] == list("ABCD")
+    # requests are never sent ahead of their slot; being late depends on load
+    for index, (_, fetched) in enumerate(manager.fetched):
+        assert fetched - start >= index * 0.05
+
+
+def test_budget_stretches_cycle():
+    watcher = Watcher([(FakeManager({}), str(i)) for i in range(10)], interval=1)
+    assert watcher.cycle == 1
+    watcher.budget = 2
+    assert watcher.cycle == 5
+
+
+def test_stop():
+    manager = FakeManager({"A": [poc()]})
+    watcher = Watcher([(manager, "A")], interval=0.01)
+    threading.Timer(0.05, watcher.stop).start()
+    assert list(watcher.watch()) == []
+    assert len(manager.fetched) >= 2
@@ -1,12 +1,13 @@
 import pytest
 
-from regrws.models import Customer, Error, Org, Poc
+from regrws.models import Customer, Delegation, Error, Org, Poc
 from regrws.models.nested import Iso31661
 from regrws.models.net import Net, NetBlock
 from regrws.models.tickets import TicketRequest
 
 from .payloads import (
     CUSTOMER_PAYLOAD,
+    DELEGATION_PAYLOAD,
     ERROR_EMPTY_COMPONENTS_PAYLOAD,
     ERROR_PAYLOAD,
     NET_PAYLOAD,
@@ -19,6 +20,7 @@ from .payloads import (
 PARAMETERS = (
     (Org, ORG_PAYLOAD),
     (Customer, CUSTOMER_PAYLOAD),
+    (Delegation, DELEGATION_PAYLOAD),
     (NetBlock, NETBLOCK_PAYLOAD),
     (Net, NET_PAYLOAD),
     (Error, ERROR_PAYLOAD),